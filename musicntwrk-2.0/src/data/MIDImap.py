@@ -18,14 +18,11 @@ import numpy as np
 def MIDImap(pdt,scale,nnote):
 	
 	# Data to MIDI conversion on given scale
-	pmin = min(pdt)
-	pmax = max(pdt)
+	pmin = np.min(pdt)
+	pmax = np.max(pdt)
 
 	yvs = (pdt-pmin)/(pmax-pmin)*(nnote-1)
 	yvs=yvs.astype(int)
-	yvf = np.zeros(pdt.shape[0],dtype=float)
-	for i in range(pdt.shape[0]):
-		yvf[i]=scale[yvs[i]]
+	yvf = np.asarray(scale,dtype=float)[yvs]
 	
 	return(yvf)
-
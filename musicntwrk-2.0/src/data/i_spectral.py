@@ -20,49 +20,19 @@ import numpy as np
 
 import ctcsound
 
+from .spectralBins import spectralBins
+
 def i_spectral(xv,yv,itime,path='./',instr='noise'):
 	
 	# Normalization of the energy into FFT bins
 	# must be power of 2 for oscil opcode
 
-	nlines = xv.shape[0]
-
-	nbins = int(np.sqrt(nlines)-np.sqrt(nlines)%1)**2
-	while nbins > nlines or not(nbins != 0 and ((nbins & (nbins - 1)) == 0)):
-		nbins = int((np.sqrt(nbins)-1)**2)
-	yfft = np.zeros((nbins),dtype=int)
-	for n in range(nbins):
-		yfft[n] = n+1
-	
-	xminf = xv[0]
-	xmaxf = xv[-1]
-	xvf=np.asarray(xv)
-	xvs = (xv-xminf)/(xmaxf-xminf)*nbins
-	for line in range(nlines):
-		if xvs[line] >= nbins: xvs[line] = -1 
-		xvf[line] = yfft[int(xvs[line])]
-
-	# Normalization of the data shape into MIDI velocity
-
-	yminf = min(yv)
-	ymaxf = max(yv)
-	yvf=np.asarray(yv)
-	yvf = (yv-yminf)/(ymaxf-yminf)*127
-
-	vel=np.zeros((nbins),dtype=float)
-	nvel=0
-	for note in range(nbins):
-		for line in range(nlines):
-			if xvf[line] == yfft[note]:
-				vel[nvel] = yvf[line]
-				nvel=nvel+1
-				break
+	nbins,vel,nvel = spectralBins(xv,yv)
 
 	########## DSI file for CSound processing on fft grid ###########
-	velmax = max(vel)
+	velmax = np.max(vel)
 	f=open(path+'DSI_CSound.dat','w')
-	for line in range(int(nvel)):
-		f.write(str(vel[line]/float(velmax))+'\n')
+	f.write(''.join(str(v)+'\n' for v in (vel[:nvel]/float(velmax)).tolist()))
 	f.close()
 
 	########## Initialize and play CSound instruments ############
@@ -21,53 +21,23 @@ import scipy.fftpack as FFT
 
 import ctcsound
 
+from .spectralBins import spectralBins
+
 
 def i_spectral2(xv,yv,itime,path='./',instr='noise'):
 	
 	# Normalization of the energy into FFT bins
 	# must be power of 2 for oscil opcode - FIR filter done using scipy.fftpack
 
-	nlines = xv.shape[0]
-
-	nbins = int(np.sqrt(nlines)-np.sqrt(nlines)%1)**2
-	while nbins > nlines or not(nbins != 0 and ((nbins & (nbins - 1)) == 0)):
-		nbins = int((np.sqrt(nbins)-1)**2)
-	yfft = np.zeros((nbins),dtype=int)
-	for n in range(nbins):
-		yfft[n] = n+1
-	
-	xminf = xv[0]
-	xmaxf = xv[-1]
-	xvf=np.asarray(xv)
-	xvs = (xv-xminf)/(xmaxf-xminf)*nbins
-	for line in range(nlines):
-		if xvs[line] >= nbins: xvs[line] = -1 
-		xvf[line] = yfft[int(xvs[line])]
-
-	# Normalization of the data shape into MIDI velocity
-
-	yminf = min(yv)
-	ymaxf = max(yv)
-	yvf=np.asarray(yv)
-	yvf = (yv-yminf)/(ymaxf-yminf)*127
-
-	vel=np.zeros((nbins),dtype=float)
-	nvel=0
-	for note in range(nbins):
-		for line in range(nlines):
-			if xvf[line] == yfft[note]:
-				vel[nvel] = yvf[line]
-				nvel=nvel+1
-				break
+	nbins,vel,nvel = spectralBins(xv,yv)
 
 	########## DSI file for CSound - Finite Impulse Response filter  ###########
-	velmax = max(vel)
+	velmax = np.max(vel)
 	vel = vel/velmax
 	ftvel = FFT.irfft(vel)
 	ftvel = FFT.fftshift(ftvel)
 	f=open(path+'DSI_CSound.dat','w')
-	for line in range(int(nvel)):
-		f.write(str(ftvel[line])+'\n')
+	f.write(''.join(str(v)+'\n' for v in ftvel[:nvel].tolist()))
 	f.close()
 	
 
@@ -18,6 +18,8 @@ import numpy as np
 import scipy.fftpack as FFT
 import pyo as po
 
+from .spectralBins import spectralBins
+
 def i_spectral_pyo(xv,yv):
 	# As i_spectral2 but uses pyo as audio engine
 	'''
@@ -39,40 +41,9 @@ def i_spectral_pyo(xv,yv):
 	time.sleep(5)
 	s.stop()
 	'''
-	nlines = xv.shape[0]
-
-	nbins = int(np.sqrt(nlines)-np.sqrt(nlines)%1)**2
-	while nbins > nlines or not(nbins != 0 and ((nbins & (nbins - 1)) == 0)):
-		nbins = int((np.sqrt(nbins)-1)**2)
-	yfft = np.zeros((nbins),dtype=int)
-	for n in range(nbins):
-		yfft[n] = n+1
-		
-	xminf = xv[0]
-	xmaxf = xv[-1]
-	xvf=np.asarray(xv)
-	xvs = (xv-xminf)/(xmaxf-xminf)*nbins
-	for line in range(nlines):
-		if xvs[line] >= nbins: xvs[line] = -1 
-		xvf[line] = yfft[int(xvs[line])]
-
-	# Normalization of the data shape into MIDI velocity
-
-	yminf = min(yv)
-	ymaxf = max(yv)
-	yvf=np.asarray(yv)
-	yvf = (yv-yminf)/(ymaxf-yminf)*127
-
-	vel=np.zeros((nbins),dtype=float)
-	nvel=0
-	for note in range(nbins):
-		for line in range(nlines):
-			if xvf[line] == yfft[note]:
-				vel[nvel] = yvf[line]
-				nvel=nvel+1
-				break
+	_,vel,_ = spectralBins(xv,yv)
 
-	velmax = max(vel)
+	velmax = np.max(vel)
 	vel /= velmax
 	# FFT for FIR filter
 	ftvel = FFT.irfft(vel)
@@ -0,0 +1,55 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import numpy as np
+
+def spectralBins(xv,yv):
+	'''
+	•	normalization of the energy of the data into FFT bins and of the data shape into MIDI velocity, as used by the
+		spectral sonification (i_spectral, i_spectral2, i_spectral_pure, i_spectral_pyo)
+	•	the number of bins is a power of 2 (for the oscil opcode): each data point is assigned to its bin by
+		fancy-indexing and the first point of every occupied bin is found with np.unique
+	•	xv,yv (float) – data structure to sonify (xv in increasing order)
+	•	returns the number of bins, the velocities of the occupied bins in bin order (array of size nbins padded with
+		zeros) and the number of occupied bins
+	'''
+	nlines = xv.shape[0]
+
+	nbins = int(np.sqrt(nlines)-np.sqrt(nlines)%1)**2
+	while nbins > nlines or not(nbins != 0 and ((nbins & (nbins - 1)) == 0)):
+		nbins = int((np.sqrt(nbins)-1)**2)
+	yfft = np.arange(1,nbins+1)
+
+	xminf = xv[0]
+	xmaxf = xv[-1]
+	xvs = (np.asarray(xv)-xminf)/(xmaxf-xminf)*nbins
+	# points past the last bin go to the last bin
+	xvs[xvs >= nbins] = -1
+	xvf = yfft[xvs.astype(int)]
+
+	# Normalization of the data shape into MIDI velocity
+
+	yminf = np.min(yv)
+	ymaxf = np.max(yv)
+	yvf = (np.asarray(yv)-yminf)/(ymaxf-yminf)*127
+
+	# velocity of the first data point of every occupied bin
+	_,first = np.unique(xvf,return_index=True)
+	nvel = first.shape[0]
+	vel = np.zeros((nbins),dtype=float)
+	vel[:nvel] = yvf[first]
+
+	return(nbins,vel,nvel)
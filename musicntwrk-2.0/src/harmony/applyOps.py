@@ -18,9 +18,19 @@ import numpy as np
 
 from ..musicntwrk import PCSet
 from ..utils.Remove import Remove
+from ..utils.pcsMask import pcs2mask
 
-def applyOps(name,chord,prt=True):
+def applyOps(name,chord,prt=True,table=None):
     # operate on the pcs with a relational distance operator
+    # if table (OpsTable built on pcs) is given, returns the chords of the table reached by the operator
+    if table is not None and table.mask is not None:
+        pcs = np.asarray([int(num) for num in re.findall("[-\d]+", chord)])%table.TET
+        add = []
+        for i in np.nonzero(table.mask == pcs2mask(pcs))[0]:
+            for j in table.targets(i,name):
+                add.append(str(PCSet(table.pcs[j],TET=table.TET).normalOrder().tolist()))
+        if prt: print(Remove(add))
+        return(Remove(add))
     op = []
     for num in re.findall("[-\d]+", name):
         op.append(int(num))
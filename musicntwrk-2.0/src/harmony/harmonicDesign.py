@@ -14,6 +14,7 @@
 #
 import networkx as nx
 import numpy as np
+import scipy.sparse as sp
 import music21 as m21
 import community as cm
 
@@ -58,11 +59,21 @@ def harmonicDesign(mk,nnodes,refnodes,refedges,nedges=2,dualedge=3,nstart=None,s
         avg += n[1]
     avgdeg = avg/float(ntot)
     if verbose: print('Average degree: ', avgdeg, ' modularity = ',modul)
+    # node labels as table (pandas) or array (output='csr', 'coo' or 'networkx')
+    refnodes = np.asarray(refnodes)
+    if len(refnodes.shape) == 1:
+        refnodes = np.reshape(refnodes,(len(refnodes),1))
     # reference node degree distribution
-    try:
-        bnet = nx.from_pandas_edgelist(refedges,'Source','Target',['Weight','Label'])
-    except:
-        bnet = nx.from_pandas_edgelist(refedges,'Source','Target',['Weight'])
+    if sp.issparse(refedges):
+        # adjacency matrix as returned by the network builders with output='csr' or 'coo'
+        bnet = nx.from_scipy_sparse_array(refedges,edge_attribute='Weight')
+    elif isinstance(refedges,nx.Graph):
+        bnet = nx.Graph(refedges)
+    else:
+        try:
+            bnet = nx.from_pandas_edgelist(refedges,'Source','Target',['Weight','Label'])
+        except:
+            bnet = nx.from_pandas_edgelist(refedges,'Source','Target',['Weight'])
     bnode = np.zeros((nnodes),dtype=int)
     bweight = np.zeros((nnodes),dtype=int)
     for n in range(nnodes):
@@ -15,16 +15,20 @@
 
 import numpy as np
 
+from ..utils.opsTable import OpsTable
+
 def lookupOps(ops,table,header,Pnumber='',ch1='',ch2=''):
+        # table is an OpsTable or the list of lists of operators of a tonal model
         operator = ops
-        tab = np.array(table)
+        if not isinstance(table,OpsTable):
+                table = OpsTable(header=header,names=table)
         if Pnumber != '':
                 try:
                         print('Pnumber of operator '+operator+' =',Pnumber[operator],'\n')
                 except:
                         print('operator not found in Pnumber')
                         return
-        idx,idy = np.where(tab == operator)
+        idx,idy = table.pairs(operator)
         for n in range(len(idy)):
                 if ch1 == '' and ch2 == '':
                         print(str(header[idx[n]]).ljust(12),str(' ->\t'+header[idy[n]]).rjust(0))
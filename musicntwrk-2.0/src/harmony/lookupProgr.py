@@ -15,14 +15,17 @@
 
 import numpy as np
 
+from ..utils.opsTable import OpsTable
+
 def lookupProgr(ch1,ch2,table,header):
 
-        tab = np.array(table)
+        if not isinstance(table,OpsTable):
+                table = OpsTable(header=header,names=table)
         head = np.array(header)
         idx = np.where(head == ch1)
         idy = np.where(head == ch2)
         try:
-                print(str(ch1).ljust(8),'->',tab[idx[0],idy[0]][0],'->',str(ch2).rjust(8))
+                print(str(ch1).ljust(8),'->',table.name(idx[0][0],idy[0][0]),'->',str(ch2).rjust(8))
         except:
                 print('no operator found')
 
@@ -40,7 +40,7 @@ def networkHarmonyGen(mk,descriptor=None,dictionary=None,thup=None,thdw=None,nam
     # this oine is for building networks from composites (what is really this function for)
 
     elif thup == None and thdw == None and names != None:
-        edges = pd.DataFrame(None,columns=['Source','Target','Weight','Label'])
+        edges = []
         # generation of probabilistic complex network with operatorial design
         if len(names) != len(probs):
             print('names not matching probabilities!')
@@ -49,6 +49,7 @@ def networkHarmonyGen(mk,descriptor=None,dictionary=None,thup=None,thdw=None,nam
                 nodes,dedges = mk.network(space='vLead',ops=True,name=names[n],
                                            pcslabel=True,dictionary=dictionary,distance=distance,
                                            prob=probs[n],write=False)
-                edges = edges.append(dedges)
+                edges.append(dedges)
+            edges = pd.concat(edges)
 
     return(nodes,edges)
\ No newline at end of file
@@ -13,6 +13,7 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 import numpy as np
+import scipy.sparse as sp
 import networkx as nx
 import fractions as fr
 import music21 as m21
@@ -37,11 +38,21 @@ def rhythmicDesign(dictionary,nnodes,nedges,refnodes,refedges,nstart=None,seed=N
         nstart = idx[0]
     euler_circuit = chinese_postman(scfree,nstart)
     print('Length of Eulerian circuit: {}'.format(len(euler_circuit)))
+    # node labels as table (pandas) or array (output='csr', 'coo' or 'networkx')
+    refnodes = np.asarray(refnodes)
+    if len(refnodes.shape) == 1:
+        refnodes = np.reshape(refnodes,(len(refnodes),1))
     # reference node degree distribution
-    try:
-        bnet = nx.from_pandas_edgelist(refedges,'Source','Target',['Weight','Label'])
-    except:
-        bnet = nx.from_pandas_edgelist(refedges,'Source','Target',['Weight'])
+    if sp.issparse(refedges):
+        # adjacency matrix as returned by the network builders with output='csr' or 'coo'
+        bnet = nx.from_scipy_sparse_array(refedges,edge_attribute='Weight')
+    elif isinstance(refedges,nx.Graph):
+        bnet = nx.Graph(refedges)
+    else:
+        try:
+            bnet = nx.from_pandas_edgelist(refedges,'Source','Target',['Weight','Label'])
+        except:
+            bnet = nx.from_pandas_edgelist(refedges,'Source','Target',['Weight'])
     bnode = np.zeros((nnodes),dtype=int)
     bweight = np.zeros((nnodes),dtype=int)
     for n in range(nnodes):
@@ -20,7 +20,8 @@ import music21 as m21
 from ..musicntwrk import PCSet
 from .enharmonicDictionary import enharmonicDictionary
 from .shortHands import shortHands
-from ...utils.generalizedOpsName import generalizedOpsName
+from ..utils.generalizedOpsName import generalizedOpsName
+from ..utils.opsTable import OpsTable
 
 
 def scoreAnalysis(seq,moduldict,keydict,first=None,keychange=None,altrn=None,table='',verbose=False):
@@ -31,7 +32,8 @@ def scoreAnalysis(seq,moduldict,keydict,first=None,keychange=None,altrn=None,tab
     head = pickle.load(f)
     table = pickle.load(f)
     f.close()
-    tab = np.array(table)
+    if not isinstance(table,OpsTable):
+        table = OpsTable(header=head,names=table)
     
 # Dictionary of enharmonics for notes in music21 Chords
     enharmonicDict = enharmonicDictionary()
@@ -71,7 +73,7 @@ def scoreAnalysis(seq,moduldict,keydict,first=None,keychange=None,altrn=None,tab
             if altrn != None and i in altrn.keys():
                 rn.append(altrn[i])
             else:
-                idx,idy = np.where(tab == ops[i])
+                idx,idy = table.pairs(ops[i])
                 tmp = []
                 for n in range(len(idy)):
                     if (rn[i] == str(head[idx[n]])):
@@ -24,6 +24,7 @@ from operator import mul
 from functools import reduce
 
 from ..musicntwrk import PCmidiR
+from ..utils.edgeBuffer import EdgeBuffer
 
 def spiralChordSpace(chord,scale,octaves=3,TET=12,distance='euclidean',thdw=0.01,thup=12):
 
@@ -106,26 +107,21 @@ def spiralChordSpace(chord,scale,octaves=3,TET=12,distance='euclidean',thdw=0.01
 #     build the network
     df = np.asarray(dictionary)
 #     nodes
-    dnodes = pd.DataFrame(None,columns=['Label'])
-    for n in range(len(df)):
-        s = ','
-        p = s.join(df[n,0])
-        dnodes = dnodes.append(pd.DataFrame([[str(p)]],columns=['Label']))
+    dnodes = pd.DataFrame([','.join(df[n,0]) for n in range(len(df))],columns=['Label'])
 
 #     edges according to a metric
     thup = np.sqrt(thup)
 
     N = df[:,1].shape[0]
-    dedges = pd.DataFrame(None,columns=['Source','Target','Weight','Label'])
+    edges = EdgeBuffer(label=True)
     for i in range(N):
         a  = np.asarray(df[i,1])
         for j in range(i,N):
             b  = np.asarray(df[j,1])
             pair = sklm.pairwise_distances(a.reshape(1, -1),b.reshape(1, -1),metric=distance)[0]
             if pair <= thup and pair >= thdw:
-                tmp = pd.DataFrame([[str(i),str(j),str(1/pair[0]),str(int(np.round(pair[0]**2,0)))]],
-                                   columns=['Source','Target','Weight','Label'])
-                dedges = dedges.append(tmp)
+                edges.add(i,j,1/pair[0],str(int(np.round(pair[0]**2,0))))
+    dedges = edges.toDataFrame()
     
     Gxu = nx.from_pandas_edgelist(dedges,'Source','Target',['Weight','Label'])
     
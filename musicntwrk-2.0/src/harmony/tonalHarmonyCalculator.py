@@ -23,6 +23,7 @@ from music21.figuredBass import realizerScale
 from .applyOps import applyOps
 from .lookupWrapper import lookupWrapper
 from ..utils.generalizedOpsName import generalizedOpsName
+from ..utils.opsTable import OpsTable
 from ..utils.Remove import Remove
 
 def tonalHarmonyCalculator():
@@ -100,6 +101,8 @@ def tonalHarmonyCalculator():
                 head = pickle.load(f)
                 table = pickle.load(f)
                 f.close()
+                # integer-indexed operator table for the lookups
+                table = OpsTable(header=head,names=table)
             except:
                 print('file not found')
         if event in ('Quit', None):
@@ -20,7 +20,7 @@
 # adapted to music21 roman module
 # chords can be added or removed at will - two sets, full and minimal, are provided - selection in the command line
 
-from ..utils.generalizedOpsName import generalizedOpsName
+from ..utils.opsTable import OpsTable
 import music21 as m21
 import pickle, sys
 
@@ -146,17 +146,11 @@ def tonalHarmonyModel(mode='minimal'):
 
 
 	# make table of operators
-	opstable = []
-	for n in range(len(seq)):
-		mat = []
-		for m in range(len(seq)):
-			_,m = generalizedOpsName(seq[n],seq[m])
-			mat.append(m)
-		opstable.append(mat)
+	opstable = OpsTable(seq,TET=12,distance='euclidean',kind='full',header=rn)
 		
 	f = open(filout,'wb')
 	pickle.dump(rn,f)
-	pickle.dump(opstable,f)
+	pickle.dump(opstable.table(),f)
 	f.close()
 	
 	return
@@ -15,10 +15,13 @@
 
 import numpy as np
 
+from ..timbre.featureStore import FeatureStore
 from .scaleDataSet import scaleDataSet
 
 def multiModelPredictor(xnew,models,scalers,normals):
-   
+    # xnew can be a slice of a FeatureStore (e.g. store[n:n+1]) or a FeatureStore of new sounds
+    if isinstance(xnew,FeatureStore): xnew = xnew.features
+
     try: 
         ynew = []
         for m in range(len(models)):
@@ -20,12 +20,15 @@ from tensorflow.keras.layers import Dense, Dropout, Flatten
 from tensorflow.keras.layers import Conv2D, MaxPooling2D
 from tensorflow.keras.layers import LeakyReLU
 
+from ..timbre.featureStore import FeatureStore
 from .modelDump import modelDump
 from .prepareDataSet import prepareDataSet
 
 def trainCNNmodel(mfcc,label,gpu=0,cpu=4,niter=100,nstep=10,neur=16,test=0.08,num_classes=2,
                                     epoch=30,verb=0,thr=0.85,w=False):
     # Convolutional NN
+    # mfcc – array or FeatureStore, as in trainNNmodel
+    if isinstance(mfcc,FeatureStore): mfcc = mfcc.features
 
 #    config = tf.ConfigProto(device_count={'GPU':gpu, 'CPU':cpu})
 #    sess = tf.Session(config=config)
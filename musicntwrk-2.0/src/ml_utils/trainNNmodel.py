@@ -16,11 +16,14 @@
 import numpy as np
 import tensorflow as tf
 
+from ..timbre.featureStore import FeatureStore
 from .modelDump import modelDump
 from .prepareDataSet import prepareDataSet
 
 def trainNNmodel(mfcc,label,gpu=0,cpu=4,niter=100,nstep=10,neur=16,test=0.08,num_classes=2,epoch=30,verb=0,thr=0.85,w=False):
     # train a 2 layers NN
+    # mfcc can be a FeatureStore: the data set is split from its memory map without copying the full tensor
+    if isinstance(mfcc,FeatureStore): mfcc = mfcc.features
 
 #    config = tf.ConfigProto(device_count={'GPU':gpu, 'CPU':cpu})
 #    sess = tf.Session(config=config)
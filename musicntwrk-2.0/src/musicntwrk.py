@@ -142,6 +142,16 @@ class PCSet:
         bins = np.linspace(1,int(self.TET/2)+1,int(self.TET/2)+1,dtype=int)
         return(np.histogram(itv,bins)[0])
 
+    def mask(self):
+        '''
+        •	integer bitmask encoding of the pcs: bit p is set when pitch class p belongs to the set
+        •	see utils.maskTable for the lookup of canonical forms from the mask
+        '''
+        mask = 0
+        for p in np.unique(self.pcs):
+            mask |= 1 << int(p)
+        return(mask)
+
     def Op(self,name):
         # operate on the pcs with a generic distance operator
         
@@ -252,6 +262,124 @@ class PCSet:
             if xml: c.show('musicxml')
             return(c)
 
+class PCSetArray:
+
+    def __init__(self,pcs,TET=12,ORD=True):
+        '''
+        •	pcs (int)– matrix of N pitch class sets of equal cardinality Nc as (N,Nc) list or numpy array
+        •	TET (int)- number of allowed pitches in the totality of the musical space (temperament). Default = 12 tones equal temperament
+        •   ORD (logical) - if True, sorts each pcs in ascending order
+        •	batch version of PCSet: every method operates on all the rows at once
+        '''
+        pcs = np.asarray(pcs,dtype=int)
+        if pcs.ndim == 1:
+            pcs = pcs.reshape(1,-1)
+        if ORD == True:
+            self.pcs = np.sort(pcs%TET,axis=1)
+        else:
+            self.pcs = pcs%TET
+        self.TET = TET
+
+    def __len__(self):
+        return(self.pcs.shape[0])
+
+    def normalOrder(self):
+        '''
+        •	Order each pcs according to the most compact ascending scale in pitch-class space that spans less than an octave by cycling permutations.
+        •	same result as PCSet.normalOrder() row by row
+        '''
+        pcs = np.sort(self.pcs,axis=1)
+        N,n = pcs.shape
+
+        # trivial sets
+        if n == 1:
+            return(pcs-pcs[:,:1])
+
+        # 1. all cyclic rotations of every pcs: rot[:,i] = np.roll(pcs,i)
+        roll = (np.arange(n)[None,:]-np.arange(n)[:,None])%n
+        rot = pcs[:,roll]
+        # spans from the first pitch, starting from the last one
+        span = (rot[:,:,::-1]-rot[:,:,:1])%self.TET
+
+        # 2. lexicographic argmin over the rotations - fully symmetric sets keep the sorted order
+        cand = np.ones((N,n),dtype=bool)
+        for l in range(n):
+            dist = np.where(cand,span[:,:,l],self.TET)
+            cand &= dist == dist.min(axis=1)[:,None]
+        nroll = np.where(cand.sum(axis=1) == 1,np.argmax(cand,axis=1),0)
+        return(rot[np.arange(N),nroll])
+
+    def normal0Order(self):
+        '''
+        •	As normal order, transposed so that the first pitch is 0
+        '''
+        norm = self.normalOrder()
+        return((norm-norm[:,:1])%self.TET)
+
+    def T(self,t=0):
+        '''
+        •	Transposition by t (int) units (modulo TET)
+        '''
+        return((self.pcs+t)%self.TET)
+
+    def M(self,t=1):
+        '''
+        •	Multiplication by t (int) units (modulo TET) - rows keep their cardinality, hence duplicates if gcd(t,TET) != 1
+        '''
+        return(np.sort((self.pcs*t)%self.TET,axis=1))
+
+    def I(self):
+        '''
+        •	inverse operation: (-pcs modulo TET)
+        '''
+        return(-self.pcs%self.TET)
+
+    def primeForm(self):
+        '''
+        •	most compact normal 0 order between each pcs and its inverse
+        '''
+        norm = self.normal0Order()
+        inv = PCSetArray(self.I(),TET=self.TET).normal0Order()
+        sn = np.sum(norm,axis=1)
+        si = np.sum(inv,axis=1)
+        return(np.where((sn <= si)[:,None],norm,inv))
+
+    def intervalVector(self):
+        '''
+        •	 total interval content of each pcs
+        '''
+        i,j = np.triu_indices(self.pcs.shape[1],k=1)
+        itv = np.abs(self.pcs[:,i]-self.pcs[:,j])
+        itv = np.where(itv > self.TET/2,self.TET-itv,itv)
+        bins = np.linspace(1,int(self.TET/2),int(self.TET/2),dtype=int)
+        return(np.sum(itv[:,:,None] == bins[None,None,:],axis=1))
+
+    def mask(self):
+        '''
+        •	integer bitmask encoding of each pcs as numpy uint64 (TET ≤ 64)
+        '''
+        if self.TET > 64:
+            print('bitmask encoding defined only for TET ≤ 64')
+            return()
+        return(np.bitwise_or.reduce(np.left_shift(np.uint64(1),self.pcs.astype(np.uint64)),axis=1))
+
+    def classNames(self):
+        '''
+        •	Names of the pcs following the Forte-style ordinal scheme used in pcsDictionary: Nc-(row+1),
+            with 'Z' appended to the pcs that share the same interval vector
+        •	returns the array of names and the list of all Z-related pcs
+        '''
+        Nc = self.pcs.shape[1]
+        name = np.char.add(str(Nc)+'-',(np.arange(len(self))+1).astype(str)).astype(object)
+        u, indeces, counts = np.unique(self.intervalVector(),return_inverse=True,return_counts=True,axis=0)
+        indeces = indeces.reshape(-1)
+        zrel = counts[indeces] != 1
+        name[zrel] = name[zrel]+'Z'
+        ZrelT = []
+        for n in np.nonzero(counts != 1)[0]:
+            ZrelT.append(name[indeces == n].tolist())
+        return(name.astype(str),ZrelT)
+
 class PCSetR:
 
     def __init__(self,pcs,TET=12,UNI=False,ORD=False):
@@ -910,6 +1038,194 @@ class RHYTHMSeq:
             m.show()
         return
 
+class RHYTHMSeqArray:
+
+    def __init__(self,rseq,REF='e',ORD=False,TPW=None):
+        '''
+        •	rseq – matrix of N rhythm sequences of equal length Nc as (N,Nc) list of strings/fractions/floats
+        •	REF = reference duration for prime form (str)
+        •	TPW (int) – ticks per whole note. If given, rseq is a matrix of integer ticks on that grid,
+            otherwise the grid is the least common multiple of the denominators of rseq and of the named durations
+        •	batch version of RHYTHMSeq on an integer-tick grid: every method operates on all the rows at once,
+            fractions are used only for display and export
+        '''
+        dur_dict = RHYTHMSeq([],REF).dict
+        self.dict = dur_dict
+        self.REF = dur_dict[REF]
+        if TPW == None:
+            seq = []
+            for row in rseq:
+                cell = []
+                for d in row:
+                    if isinstance(d,str):
+                        cell.append(dur_dict[d] if d in dur_dict else fr.Fraction(d))
+                    elif isinstance(d,float):
+                        cell.append(fr.Fraction(d).limit_denominator(2**16))
+                    else:
+                        cell.append(fr.Fraction(d))
+                seq.append(cell)
+            den = [d.denominator for cell in seq for d in cell]+[d.denominator for d in dur_dict.values()]
+            TPW = int(np.lcm.reduce(np.asarray(den,dtype=np.int64)))
+            ticks = np.asarray([[d.numerator*(TPW//d.denominator) for d in cell] for cell in seq],dtype=np.int64)
+        else:
+            ticks = np.asarray(rseq,dtype=np.int64)
+        if ticks.ndim == 1:
+            ticks = ticks.reshape(1,-1)
+        if ORD:
+            ticks = np.sort(ticks,axis=1)
+        self.ticks = ticks
+        self.TPW = TPW
+
+    def __len__(self):
+        return(self.ticks.shape[0])
+
+    def tick(self,t):
+        # duration (str or fraction) in ticks of the grid
+        t = self.dict[t] if isinstance(t,str) else fr.Fraction(t)
+        if (t*self.TPW).denominator != 1:
+            print('duration not on the tick grid')
+            sys.exit()
+        return(int(t*self.TPW))
+
+    def fractions(self,ticks=None):
+        '''
+        •	ticks (default the sequences) as object array of fractions, for display and export
+        '''
+        if ticks is None: ticks = self.ticks
+        return(np.vectorize(lambda t: fr.Fraction(int(t),self.TPW),otypes=[object])(ticks))
+
+    def labels(self,ticks=None):
+        '''
+        •	ticks (default the sequences) as strings of fractions, e.g. '1/8 1/4 3/8', as in the rhythm dictionaries
+        '''
+        if ticks is None: ticks = self.ticks
+        g = np.gcd(ticks,self.TPW)
+        num = (ticks//g).astype(str)
+        den = (self.TPW//g).astype(str)
+        frac = np.char.add(np.char.add(num,'/'),den)
+        return(np.asarray([' '.join(row) for row in frac]))
+
+    def normalOrder(self):
+        '''
+        •	Order each rhythmic sequence according to the most compact ascending form
+        •	same result as RHYTHMSeq.normalOrder() row by row (including the truncation of the
+            tie-breaking distances to whole notes); fully tied sequences are returned unchanged
+        '''
+        r = self.ticks
+        N,n = r.shape
+        if n == 1:
+            return(r.copy())
+        i = np.arange(n)
+        # 1. cycle to find the most compact ascending order: roll(r,i)[k] = r[(k-i)%n]
+        dist = np.abs(r[:,(n-1-i)%n]-r[:,(-i)%n])
+        cand = dist == dist.min(axis=1)[:,None]
+        # 2. check for multiple compact orders
+        for l in range(1,n):
+            tie = cand.sum(axis=1) != 1
+            if not tie.any(): break
+            dist = np.abs(r[:,(n-1-l-i)%n]-r[:,(-i)%n])//self.TPW
+            dist = np.where(cand,dist,np.iinfo(np.int64).max)
+            cand = np.where(tie[:,None],cand & (dist == dist.min(axis=1)[:,None]),cand)
+        nroll = np.where(cand.sum(axis=1) == 1,np.argmax(cand,axis=1),0)
+        return(r[np.arange(N)[:,None],(i[None,:]-nroll[:,None])%n])
+
+    def augment(self,t='e'):
+        '''
+        •	Augmentation by t (string) units
+        '''
+        return(self.ticks+self.tick(t))
+
+    def diminish(self,t='e'):
+        '''
+        •	Diminution by t (string) units – returns a list of tick arrays since it might reduce the length of the sequences
+        '''
+        dim = self.ticks-self.tick(t)
+        return([row[row > 0] for row in dim])
+
+    def retrograde(self):
+        '''
+        •	retrograde operation
+        '''
+        return(self.ticks[:,::-1])
+
+    def isNonRetro(self):
+        '''
+        •	check if each sequence is not retrogradable
+        '''
+        return(np.all(self.ticks == self.ticks[:,::-1],axis=1))
+
+    def canBeNonRetro(self):
+        '''
+        •	check if each sequence can be reordered into a non retrogradable one: its durations
+            form a palindrome if at most one of them occurs an odd number of times
+        '''
+        _,idx = np.unique(self.ticks,return_inverse=True)
+        idx = idx.reshape(self.ticks.shape)
+        rows = np.broadcast_to(np.arange(len(self))[:,None],idx.shape)
+        counts = np.zeros((len(self),idx.max()+1 if idx.size > 0 else 0),dtype=int)
+        np.add.at(counts,(rows,idx),1)
+        return(np.sum(counts%2,axis=1) <= 1)
+
+    def floatize(self):
+        '''
+        •	transform the sequences in floats (fractions of whole note)
+        '''
+        return(self.ticks/self.TPW)
+
+    def reduce2GCD(self):
+        '''
+        •	reduce the series of fractions to a common denominator – on the tick grid it is the sorted sequence
+        '''
+        return(np.sort(self.ticks,axis=1))
+
+    def primeForm(self):
+        '''
+        •	reduce the series of fractions to prime form – returns a RHYTHMSeqArray on a grid refined to hold the scaled durations
+        '''
+        norm = self.normalOrder()
+        num = norm*self.tick(self.REF)
+        den = norm[:,0]
+        # refine the grid so that num/den is an integer number of ticks on every row
+        g = np.gcd(den,np.gcd.reduce(num,axis=1))
+        L = int(np.lcm.reduce(den//g))
+        prime = RHYTHMSeqArray(num*L//den[:,None],TPW=self.TPW*L)
+        prime.REF = self.REF
+        return(prime)
+
+    def histogram(self,durv,lseq=None):
+        # np.histogram of the durations of every row with fractional bin edges, in integer arithmetic
+        if lseq == None:
+            lseq = [fr.Fraction(1/8),fr.Fraction(2/8),fr.Fraction(3/8),fr.Fraction(4/8),\
+                    fr.Fraction(5/8),fr.Fraction(6/8),fr.Fraction(7/8),fr.Fraction(8/8),fr.Fraction(9/8)]
+        bins = np.sort(np.asarray([fr.Fraction(b) for b in lseq]))
+        Q = int(np.lcm.reduce([b.denominator for b in bins]))
+        edges = np.asarray([b.numerator*(Q//b.denominator)*self.TPW for b in bins],dtype=np.int64)
+        x = durv*Q
+        nb = edges.shape[0]-1
+        idx = np.searchsorted(edges,x,side='right')-1
+        # the last bin is closed on the right
+        idx = np.where(x == edges[-1],nb-1,idx)
+        valid = (idx >= 0) & (idx < nb)
+        rows = np.broadcast_to(np.arange(durv.shape[0])[:,None],durv.shape)
+        hist = np.zeros((durv.shape[0],nb),dtype=int)
+        np.add.at(hist,(rows[valid],idx[valid]),1)
+        label = ' '.join([str(b.numerator)+'/'+str(b.denominator) for b in bins[:nb]])
+        return(hist,label)
+
+    def durationVector(self,lseq=None):
+        '''
+        •	 total relative duration ratios content of each sequence
+        '''
+        i,j = np.triu_indices(self.ticks.shape[1],k=1)
+        return(self.histogram(np.abs(self.ticks[:,i]-self.ticks[:,j]),lseq))
+
+    def rIntervalVector(self,lseq=None):
+        '''
+        •	 inter-onset duration interval content of each sequence
+        '''
+        durv = np.hstack([np.abs(self.ticks),np.abs(self.ticks+np.roll(self.ticks,-1,axis=1))])
+        return(self.histogram(durv,lseq))
+
 class musicntwrk:
     
     def __init__(self,TET=12):
@@ -949,118 +1265,141 @@ class musicntwrk:
         
     def network(self,space=None,label=None,dictionary=None,thup=None,thdw=None,thup_e=None,thdw_e=None,distance=None,prob=None,write=None,\
                 pcslabel=None,vector=None,ops=None,name=None,ntx=None,general=None,seq=None,sub=None,start=None,end=None,grphtype=None,\
-                wavefil=None,cepstrum=None,color=None):
+                wavefil=None,cepstrum=None,color=None,output=None,k=None,method='exact',update=None,window=None):
         '''
         define networks in the musical space specified in 'space': pcs (reg and ego), vLead (reg, vec, name and nameVec), 
         rhythm, rLead, score (reg, name and sub), timbre, orch
+        output: format of nodes and edges - None (pandas DataFrames), 'csr', 'coo' (scipy.sparse) or 'networkx'
+        k, method, update: k nearest neighbours, 'exact' or 'approximate' search and existing network to extend
+        in timbre networks (see timbralNetwork)
+        window: in score networks, keep only the chords and transitions among the last window chords (see ScoreGraph)
         '''
         if space == 'pcs':
             from .networks.pcsNetwork import pcsNetwork
-            nodes, edges = pcsNetwork(dictionary,thup,thdw,distance,prob,write,pcslabel,TET=self.TET)
+            nodes, edges = pcsNetwork(dictionary,thup,thdw,distance,prob,write,pcslabel,TET=self.TET,output=output)
             return(nodes,edges)
         
         if space == 'pcsEgo':
             from .networks.pcsEgoNetwork import pcsEgoNetwork
-            nodes_e, edges_e, edges_a = pcsEgoNetwork(label,dictionary,thup_e,thdw_e,thup,thdw,distance,write,TET=self.TET)
+            nodes_e, edges_e, edges_a = pcsEgoNetwork(label,dictionary,thup_e,thdw_e,thup,thdw,distance,write,TET=self.TET,output=output)
             return(nodes_e,edges_e,edges_a)
         
         if space == 'vLead' and vector != True and ops != True:
             from .networks.vLeadNetwork import vLeadNetwork
-            nodes, edges = vLeadNetwork(dictionary,thup,thdw,distance,prob,write,pcslabel,TET=self.TET)
+            nodes, edges = vLeadNetwork(dictionary,thup,thdw,distance,prob,write,pcslabel,TET=self.TET,output=output)
             return(nodes, edges)
         
         if space == 'vLead' and vector and ops != True:
             from .networks.vLeadNetworkVec import vLeadNetworkVec
-            nodes, edges = vLeadNetworkVec(dictionary,thup,thdw,distance,prob,write,pcslabel,TET=self.TET)
+            nodes, edges = vLeadNetworkVec(dictionary,thup,thdw,distance,prob,write,pcslabel,TET=self.TET,output=output)
             return(nodes, edges)
         
         if space == 'vLead' and vector != True and ops:
             from .networks.vLeadNetworkByName import vLeadNetworkByName
-            nodes, edges = vLeadNetworkByName(dictionary,name,distance,prob,write,pcslabel,TET=self.TET)
+            nodes, edges = vLeadNetworkByName(dictionary,name,distance,prob,write,pcslabel,TET=self.TET,output=output)
             return(nodes, edges)
         
         if space == 'vLead' and vector and ops:
             from .networks.vLeadNetworkByNameVec import vLeadNetworkByNameVec
-            nodes, edges = vLeadNetworkByNameVec(dictionary,name,distance,prob,write,pcslabel,TET=self.TET)
+            nodes, edges = vLeadNetworkByNameVec(dictionary,name,distance,prob,write,pcslabel,TET=self.TET,output=output)
             return(nodes, edges)
 
         if space == 'rhythm':
             from .networks.rhythmNetwork import rhythmNetwork
-            nodes, edges = rhythmNetwork(dictionary,thup,thdw,distance,prob,write)
+            nodes, edges = rhythmNetwork(dictionary,thup,thdw,distance,prob,write,output=output)
             return(nodes, edges)
         
         if space == 'rLead':
             from .networks.rLeadNetwork import rLeadNetwork
-            nodes, edges = rLeadNetwork(dictionary,thup,thdw,distance,prob,write)
+            nodes, edges = rLeadNetwork(dictionary,thup,thdw,distance,prob,write,output=output)
             return(nodes, edges)
         
+        if space == 'score' and sub != True and window != None:
+            from .networks.scoreGraph import ScoreGraph
+            graph = ScoreGraph(TET=self.TET,distance=distance,general=general,window=window)
+            graph.add(seq)
+            nodes, edges, counts = graph.toOutput(output)
+            if ntx:
+                return(nodes,edges,counts,graph.degree(),graph.modularity()[0],graph.graph(directed=True),graph.graph(directed=False))
+            else:
+                return(nodes, edges, counts)
+
         if space == 'score' and sub != True:
             from .networks.scoreNetwork import scoreNetwork
             if ntx:
-                nodes,edges,counts,deg,modul,Gxfull,Gxufull = scoreNetwork(seq,ntx,general,distance,TET=self.TET)
+                nodes,edges,counts,deg,modul,Gxfull,Gxufull = scoreNetwork(seq,ntx,general,distance,TET=self.TET,output=output)
                 return(nodes,edges,counts,deg,modul,Gxfull,Gxufull)
             else:
-                nodes, edges, counts = scoreNetwork(seq,ntx,general,distance,TET=self.TET)
+                nodes, edges, counts = scoreNetwork(seq,ntx,general,distance,TET=self.TET,output=output)
                 return(nodes, edges, counts)
         
         if space == 'score' and sub:
             from .networks.scoreSubNetwork import scoreSubNetwork
             if ntx:
-                nodes,edges,counts,deg,modul,Gxfull,Gxufull = scoreSubNetwork(seq,start,end,ntx,general,distance,grphtype,TET=self.TET)
+                nodes,edges,counts,deg,modul,Gxfull,Gxufull = scoreSubNetwork(seq,start,end,ntx,general,distance,grphtype,TET=self.TET,output=output)
                 return(nodes,edges,counts,deg,modul,Gxfull,Gxufull)
             else:
-                nodes, edges, counts = scoreSubNetwork(seq,start,end,ntx,general,distance,grphtype,TET=self.TET)
+                nodes, edges, counts = scoreSubNetwork(seq,start,end,ntx,general,distance,grphtype,TET=self.TET,output=output)
                 return(nodes, edges, counts)
 
         if space == 'timbre':
             from .networks.timbralNetwork import timbralNetwork
-            nodes, edges = timbralNetwork(wavefil,cepstrum,thup,thdw)
+            nodes, edges = timbralNetwork(wavefil,cepstrum,thup,thdw,distance,output=output,k=k,method=method,
+                                          network=update)
             return(nodes, edges)
         
         if space == 'orch':
             from .networks.orchestralNetwork import orchestralNetwork
-            nodes,edges,deg,modul,part,_,_ = orchestralNetwork(seq,distance,TET=self.TET)
+            nodes,edges,deg,modul,part,_,_ = orchestralNetwork(seq,distance,TET=self.TET,output=output)
             return(nodes,edges,deg,modul,part)
         
             
     def timbre(self,descriptor=None,path=None,wavefil=None,standard=None,nmel=None,ncc=None,zero=None,lmax=None,maxi=None,nbins=None,\
-                method=None,scnd=None,nstep=None):
+                method=None,scnd=None,nstep=None,nproc=None,cache=None,mmap=None):
         '''
         Define sound descriptor for timbral analysis
-        '''
+        nproc: number of processes, cache: SQLite file of the feature cache (see timbreFeatures)
+        mmap: .npy file of the memory-mapped output of the standardized descriptors
+        '''
+        if isinstance(descriptor,list):
+            from .timbre.timbreFeatures import timbreFeatures
+            waves, features = timbreFeatures(path,wavefil,descriptor,nmel=nmel,ncc=ncc,lmax=lmax,method=method,nstep=nstep,
+                                             nproc=nproc,cache=cache)
+            return(waves, features)
+
         if descriptor == 'PSCC' and standard != True:
             from .timbre.computePSCC import computePSCC
-            waves, cepstrum0, cepstrum = computePSCC(path,wavefil,ncc,zero)
+            waves, cepstrum0, cepstrum = computePSCC(path,wavefil,ncc,zero,nproc,cache)
             return(waves, cepstrum0, cepstrum)
         
         if descriptor == 'PSCC' and standard:
             from .timbre.computeStandardizedPSCC import computeStandardizedPSCC
-            waves, cepstrum0, lmax = computeStandardizedPSCC(path,wavefil,ncc,lmax,maxi,nbins)
+            waves, cepstrum0, lmax = computeStandardizedPSCC(path,wavefil,ncc,lmax,maxi,nbins,nproc,cache,mmap)
             return(waves, cepstrum0, lmax)
             
         if descriptor == 'MFCC' and standard != True:
             from .timbre.computeMFCC import computeMFCC
-            waves, cepstrum0, cepstrum = computeMFCC(path,wavefil,nmel,ncc,zero)
+            waves, cepstrum0, cepstrum = computeMFCC(path,wavefil,nmel,ncc,zero,nproc,cache)
             return(waves, cepstrum0, cepstrum)
 
         if descriptor == 'MFCC' and standard:
             from .timbre.computeStandardizedMFCC import computeStandardizedMFCC
-            waves, cepstrum0, lmax = computeStandardizedMFCC(path,wavefil,nmel,ncc,lmax,maxi,nbins)
+            waves, cepstrum0, lmax = computeStandardizedMFCC(path,wavefil,nmel,ncc,lmax,maxi,nbins,nproc,cache,mmap)
             return(waves, cepstrum0, lmax)
             
         if descriptor == 'MFPS' and standard:
             from .timbre.computeStandardizedMFPS import computeStandardizedMFPS
-            waves, cepstrum0, lmax = computeStandardizedMFPS(path,wavefil,nmel,lmax,maxi,nbins)
+            waves, cepstrum0, lmax = computeStandardizedMFPS(path,wavefil,nmel,lmax,maxi,nbins,nproc,cache,mmap)
             return(waves, cepstrum0, lmax)
             
         if descriptor == 'ASCBW' and standard != True:
             from .timbre.computeASCBW import computeASCBW
-            waves, ascbw = computeASCBW(path,wavefil)
+            waves, ascbw = computeASCBW(path,wavefil,nproc,cache)
             return(waves, ascbw)
 
         if descriptor == 'ASCBW' and standard:
             from .timbre.computeModifiedASCBW import computeModifiedASCBW
-            waves, ascbw, ascbwu = computeModifiedASCBW(path,wavefil,scnd,method,nstep)
+            waves, ascbw, ascbwu = computeModifiedASCBW(path,wavefil,scnd,method,nstep,nproc,cache)
             return(waves, ascbw, ascbwu)
 
     def harmony(self,descriptor=None,mode=None,x=None,y=None):
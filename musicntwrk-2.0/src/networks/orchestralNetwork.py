@@ -19,39 +19,32 @@ import networkx as nx
 import community as cm
 
 from ..utils.minimalDistance import minimalDistance
+from ..utils.edgeBuffer import EdgeBuffer
 
-def orchestralNetwork(seq,distance,TET):
+def orchestralNetwork(seq,distance,TET,output=None):
     
     ''' 
     •    generates the directional network of orchestration vectors from any score in musicxml format
     •    seq (int) – list of orchestration vectors extracted from the score
     •    use orchestralScore() to import the score data as sequence
+    •    output (str) – format of nodes and edges: None (pandas DataFrames), 'csr', 'coo' (scipy.sparse) or 'networkx'
     '''
     # build the directional network of the full orchestration progression
 
-    dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
-    dnodes = pd.DataFrame(None,columns=['Label'])
-    for n in range(len(seq)):
-        nameseq = pd.DataFrame([np.array2string(seq[n]).replace(" ","").replace("[","").replace("]","")],\
-                               columns=['Label'])
-        dnodes = dnodes.append(nameseq)
-    df = np.asarray(dnodes)
-    dnodes = pd.DataFrame(None,columns=['Label'])
-    dff,idx = np.unique(df,return_inverse=True)
-    for n in range(dff.shape[0]):
-        nameseq = pd.DataFrame([[str(dff[n])]],columns=['Label'])
-        dnodes = dnodes.append(nameseq)
+    edges = EdgeBuffer(len(seq))
+    name = [np.array2string(seq[n]).replace(" ","").replace("[","").replace("]","") for n in range(len(seq))]
+    dff,idx = np.unique(name,return_inverse=True)
+    dnodes = pd.DataFrame(dff.astype(str),columns=['Label'])
     for n in range(1,len(seq)):
         a = np.asarray(seq[n-1])
         b = np.asarray(seq[n])
         pair,r = minimalDistance(a,b,TET,distance)
-        tmp = pd.DataFrame([[str(idx[n-1]),str(idx[n]),str(pair+0.1)]],
-                           columns=['Source','Target','Weight'])
-        dedges = dedges.append(tmp)
+        edges.add(idx[n-1],idx[n],pair+0.1)
+    dnodes,dedges = edges.toOutput(dnodes,output,directed=True)
     
     # evaluate average degree and modularity
-    gbch = nx.from_pandas_edgelist(dedges,'Source','Target','Weight',create_using=nx.DiGraph())
-    gbch_u = nx.from_pandas_edgelist(dedges,'Source','Target','Weight')
+    gbch = edges.toNetworkx(directed=True)
+    gbch_u = edges.toNetworkx()
     # modularity 
     part = cm.best_partition(gbch_u)
     modul = cm.modularity(part,gbch_u)
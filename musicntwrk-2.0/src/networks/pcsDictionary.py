@@ -13,11 +13,13 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
-import itertools as iter
+import math
+import numpy as np
 import pandas as pd
 
 from ..utils.communications import *
 from ..utils.load_balancing import *
+from ..utils.unrankCombinations import unrankCombinations
 
 try:
     from mpi4py import MPI
@@ -31,7 +33,7 @@ except:
     size = 1
     para = False
 
-from ..musicntwrk import PCSet
+from ..musicntwrk import PCSetArray
 
 def pcsDictionary(Nc,row,a,order,prob,TET):
 
@@ -43,71 +45,47 @@ def pcsDictionary(Nc,row,a,order,prob,TET):
     •	if row = True, a is the list of pitches in the tone row (int)
     •	returns the dictionary as pandas DataFrame and the list of all Z-related pcs
     '''
-    name = prime = commonName = None
+    prime = None
     if rank == 0:
-        name = []
         prime = []
-        commonName = []
         
-    # generate all possible combinations of n integers or of the row in argument
-    if row:
-        a = np.asarray(list(iter.combinations(a,Nc)))
-    else:
-        a = np.asarray(list(iter.combinations(range(TET),Nc)))
+    # split the space of all possible combinations of n integers or of the row in argument
+    # among processes: each one generates only its own slice by combinatorial unranking
+    n = len(a) if row else TET
+    ini,end = load_balancing(size, rank, math.comb(n,Nc))
+    aux = unrankCombinations(n,Nc,ini,end)
+    if row: aux = np.asarray(a)[aux]
 
     # put all pcs in prime/normal order form
-    s = np.zeros((a.shape[0],Nc),dtype=int)
-    ini,end = load_balancing(size, rank, a.shape[0])
-    nsize = end-ini
-
-    aux = scatter_array(a)
-    saux = np.zeros((nsize,Nc),dtype=int)
-    if para: comm.Barrier()
-    for i in range(nsize):
-        p = PCSet(aux[i,:],TET=TET)
-        if order == 0:
-            saux[i,:] = p.primeForm()[:]
-        elif order == 1:
-            saux[i,:] = p.normalOrder()[:]
-        elif order == 2:
-            saux[i,:] = p.normal0Order()[:]
-        else:
-            if rank == 0: print('no ordering specified')
-    if para:
-        comm.Barrier()
-        gather_array(s,saux,sroot=0)
+    p = PCSetArray(aux,TET=TET)
+    if order == 0:
+        saux = p.primeForm()
+    elif order == 1:
+        saux = p.normalOrder()
+    elif order == 2:
+        saux = p.normal0Order()
     else:
-        s = saux
+        saux = np.zeros((end-ini,Nc),dtype=int)
+        if rank == 0: print('no ordering specified')
+
+    # eliminate duplicates locally, then merge on rank 0
+    saux = np.unique(saux,axis=0).reshape(-1,Nc)
+    s = gatherv(saux)
 
     if rank == 0:
-        # eliminate duplicates in s
+        # eliminate duplicates among processes
         s = np.unique(s,axis=0)
 
         # calculate interval vectors and assign names
-        v = []
+        p = PCSetArray(s,TET=TET,ORD=False)
+        vector = p.intervalVector()
         for i in range(s.shape[0]):
-            p = PCSet(s[i,:],TET)
-            v.append(p.intervalVector())
-            name.append(str(Nc)+'-'+str(i+1))
             prime.append(np.array2string(s[i,:],separator=',').replace(" ",""))
 
-        vector = np.asarray(v)
-
     dictionary = ZrelT = None
     if rank == 0:
         # find pc sets in Z relation
-        u, indeces = np.unique(vector, return_inverse=True,axis=0)
-        ZrelT = []
-        for n in range(u.shape[0]):
-            if np.array(np.where(indeces == n)).shape[1] != 1:
-                indx = np.array(np.where(indeces == n))[0]
-                Zrel = []
-                for m in range(indx.shape[0]):
-                    name[indx[m]] = name[indx[m]]+'Z'
-                    Zrel.append(name[indx[m]])
-                ZrelT.append(Zrel)
-
-        name = np.asarray(name)
+        name,ZrelT = p.classNames()
         
         # Create dictionary of pitch class sets
         reference = []
@@ -117,15 +95,11 @@ def pcsDictionary(Nc,row,a,order,prob,TET):
             reference.append(entry)
 
         dictionary = pd.DataFrame(reference,columns=['class','pcs','interval'])
+        # integer encoding of the pcs for the network builders
+        if TET <= 64: dictionary['mask'] = p.mask()
         
         if prob != None:
-            df = np.asarray(dictionary)
-            pruned = pd.DataFrame(None,columns=['class','pcs','interval'])
-            for i in range(df.shape[0]):
-                r = np.random.rand()
-                if r <= prob:
-                    tmp = pd.DataFrame([[str(df[i,0]),str(df[i,1]),str(df[i,2])]],columns=['class','pcs','interval'])
-                    pruned = pruned.append(tmp)
-            dictionary = pruned
+            r = np.random.rand(len(dictionary))
+            dictionary = dictionary[r <= prob]
         
     return(dictionary,ZrelT)
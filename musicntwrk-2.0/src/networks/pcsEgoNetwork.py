@@ -13,11 +13,14 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
-import sys,re,os
+import sys,re
 import pandas as pd
 import numpy as np
 import sklearn.metrics as sklm
 
+from ..utils.pcsMask import *
+from ..utils.sparsePairDistance import sparsePairDistance
+from ..utils.edgeBuffer import EdgeBuffer
 from ..utils.communications import *
 from ..utils.load_balancing import *
 
@@ -33,7 +36,7 @@ except:
     size = 1
     para = False
 
-def pcsEgoNetwork(label,dictionary,thup_e,thdw_e,thup,thdw,distance,write,TET):
+def pcsEgoNetwork(label,dictionary,thup_e,thdw_e,thup,thdw,distance,write,TET,output=None):
     
     '''
     •	network generated from a focal node (ego) and the nodes to whom ego is directly connected to (alters)
@@ -41,6 +44,7 @@ def pcsEgoNetwork(label,dictionary,thup_e,thdw_e,thup,thdw,distance,write,TET):
     •	thup_e, thdw_e (float) - upper and lower thresholds for edge creation from ego node
     •	thup, thdw (float)– upper and lower thresholds for edge creation among alters
     •	in output it writes the nodes_ego.csv, edges_ego.csv and edges_alters.csv as separate files in csv format
+    •	output (str) – format of nodes and edges: None (pandas DataFrames), 'csr', 'coo' (scipy.sparse) or 'networkx'
     '''
     
     if thdw_e < 1e-9:
@@ -53,13 +57,11 @@ def pcsEgoNetwork(label,dictionary,thup_e,thdw_e,thup,thdw,distance,write,TET):
 
     # define nodes as distance 1 from ego
     # ego
-    dict_class = df.set_index("class", drop = True)
-    ego = np.asarray(list(map(int,re.findall('\d+',dict_class.loc[label][1]))))
-    # alters
     dfv = np.asarray(df)
-    vector = np.zeros((dfv[:,2].shape[0],int(TET/2)),dtype=int)
-    for i in range(dfv[:,2].shape[0]):
-        vector[i]  = np.asarray(list(map(int,re.findall('\d+',dfv[i,2]))))
+    row = dict(zip(dfv[:,0],range(dfv.shape[0])))
+    vector = maskIntervalVector(dictionaryMasks(df),TET)
+    ego = vector[row[label]]
+    # alters
     name = []
     pair = sklm.pairwise_distances(ego.reshape(1, -1), vector, metric=distance)
     for i in range(dfv[:,2].shape[0]):
@@ -71,72 +73,36 @@ def pcsEgoNetwork(label,dictionary,thup_e,thdw_e,thup,thdw,distance,write,TET):
     # write csv for nodes
     dnodes = pd.DataFrame(np.asarray(name),columns=['Label'])
     if write: dnodes.to_csv('nodes_ego.csv',index=False)
-    nodes_ego = dnodes
     
     # find edges according to a metric
     # ego edges with proportional weights
     N = len(name)
-    vector = np.zeros((N,int(TET/2)),dtype=int)
-    dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
-    for j in range(N):
-        vector[j] = np.asarray(list(map(int,re.findall('\d+',dict_class.loc[name[j]][1]))))
-    pair = sklm.pairwise_distances(ego.reshape(1, -1), vector, metric=distance)
-    for j in range(N):
-        if pair[0,j] <= thup_e and pair[0,j] >= thdw_e:
-            tmp = pd.DataFrame([[str(i),str(j),str(1/pair[0,j])]],columns=['Source','Target','Weight'])
-            dedges = dedges.append(tmp)
+    vector = vector[[row[n] for n in name]]
+    pair = sklm.pairwise_distances(ego.reshape(1, -1), vector, metric=distance)[0]
+    alter = np.nonzero((pair <= thup_e) & (pair >= thdw_e))[0]
+    edges = EdgeBuffer(alter.shape[0])
+    edges.extend(np.full(alter.shape[0],N-1),alter,1/pair[alter])
     # write csv for ego's edges
-    if write: dedges.to_csv('edges_ego.csv',index=False)   
-    edges_ego = dedges     
+    if write: edges.toDataFrame().to_csv('edges_ego.csv',index=False)   
+    nodes_ego,edges_ego = edges.toOutput(dnodes,output)
     
-    # alters edges
-    # parallelize over interval vector to optimize the vectorization in sklm.pairwise_distances
-    if size != 1:
-        ini,end = load_balancing(size, rank, N)
-        nsize = end-ini
-        vaux = scatter_array(vector)
-        pair = sklm.pairwise_distances(vaux, vector, metric=distance)
-        index = np.linspace(0,N,N,dtype=int)
-        dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
-        for i in range(nsize):
-            tmp = pd.DataFrame(None,columns=['Source','Target','Weight'])
-            tmp['Source'] = (i+ini)*np.ones(N,dtype=int)[:]
-            tmp['Target'] = index[:]
-            tmp['Weight'] = pair[i,:]
-            dedges = dedges.append(tmp)
-        dedges = dedges.query('Weight<='+str(thup)).query('Weight>='+str(thdw))
-        dedges['Weight'] = dedges['Weight'].apply(lambda x: 1/x)
-        # do some cleaning
-        cond = dedges.Source > dedges.Target
-        dedges.loc[cond, ['Source', 'Target']] = dedges.loc[cond, ['Target', 'Source']].values
-        dedges = dedges.drop_duplicates(subset=['Source', 'Target'])
-
-        # write csv for partial edges
-        dedges.to_csv('edges'+str(rank)+'.csv',index=False)
-        
-        if rank == 0:
-            dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
-            for i in range(size):
-                tmp = pd.read_csv('edges'+str(i)+'.csv')
-                dedges = dedges.append(tmp)
-                os.remove('edges'+str(i)+'.csv')
-            # write csv for edges
-            if write: dedges.to_csv('edges_alters.csv',index=False)
-            edges_alters = dedges
-    else:
-        N = len(name)-1
-        dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
-        for i in range(N):
-            vector_i = np.asarray(list(map(int,re.findall('\d+',dict_class.loc[name[i]][1]))))
-            for j in range(i,N):
-                vector_j = np.asarray(list(map(int,re.findall('\d+',dict_class.loc[name[j]][1]))))
-                pair = sklm.pairwise.paired_euclidean_distances(vector_i.reshape(1, -1),vector_j.reshape(1, -1))
-                if pair <= thup and pair >= thdw:
-                    tmp = pd.DataFrame([[str(i),str(j),str(1/pair[0])]],columns=['Source','Target','Weight'])
-                    dedges = dedges.append(tmp)
-
+    # alters edges (ego is the last node)
+    N = len(name)-1
+    # parallelize over interval vector to optimize the vectorization of the distance kernel
+    ini,end = load_balancing(size, rank, N)
+    vaux = scatter_array(vector[:N])
+    source,target,weight = sparsePairDistance(vaux,vector[:N],thup,thdw,distance,offset=ini)
+    edges = EdgeBuffer(source.shape[0])
+    edges.extend(source,target,1/weight)
+    # gather partial edges in memory on rank 0 and remove duplicates
+    rec = gatherv(edges.records())
+    edges_alters = None
+    if rank == 0:
+        edges = EdgeBuffer(rec.shape[0])
+        edges.extend(rec['Source'],rec['Target'],rec['Weight'])
+        edges.unique()
         # write csv for alters' edges
-        if write: dedges.to_csv('edges_alters.csv',index=False)
-        edges_alters = dedges
+        if write: edges.toDataFrame().to_csv('edges_alters.csv',index=False)
+        edges_alters = edges.toOutput(dnodes,output)[1]
     
     return(nodes_ego, edges_ego, edges_alters)
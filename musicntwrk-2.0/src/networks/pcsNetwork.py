@@ -13,14 +13,16 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
-import sys,re,os
+import sys,re
 import pandas as pd
 import numpy as np
-import music21 as m21
 
-from ..musicntwrk import PCSet
+from ..utils.pcsLabels import pcsLabels
+from ..utils.pcsMask import *
+from ..utils.sparsePairDistance import sparsePairDistance
 from ..utils.communications import *
 from ..utils.load_balancing import *
+from ..utils.edgeBuffer import EdgeBuffer
 
 try:
     from mpi4py import MPI
@@ -34,34 +36,25 @@ except:
     size = 1
     para = False
 
-def pcsNetwork(dictionary,thup,thdw,distance,prob,write,pcslabel,TET):
+def pcsNetwork(dictionary,thup,thdw,distance,prob,write,pcslabel,TET,output=None):
     
     '''
     •	generate the network of pcs based on distances between interval vectors
     •	dictionary (str)– dictionary generated by pcsNetwork
     •	thup, thdw (float)– upper and lower thresholds for edge creation
     •	distance (str)– choice of norm in the musical space, default is 'euclidean'
-    •	col = 2 – metric based on interval vector
+    •	metric based on interval vector, computed from the pcs masks
     •	prob (float)– if ≠ 1, defines the probability of acceptance of any given edge
     •	in output it writes the nodes.csv and edges.csv as separate files in csv format
+    •	output (str) – format of nodes and edges: None (pandas DataFrames), 'csr', 'coo' (scipy.sparse) or 'networkx'
     '''
 
-    col = 2
     df = np.asarray(dictionary)
-    
-    dim = np.asarray(list(map(int,re.findall('\d+',df[0,col])))).shape[0]
+    mask = dictionaryMasks(dictionary)
     
     # write csv for nodes
     if pcslabel:
-        dnodes = pd.DataFrame(None,columns=['Label'])
-        for n in range(len(df)):
-            p = PCSet(np.asarray(list(map(int,re.findall('\d+',df[n,1])))))
-            if p.pcs.shape[0] == 1:
-                nn = ''.join(m21.chord.Chord(p.pcs.tolist()).pitchNames)
-            else:
-                nn = ''.join(m21.chord.Chord(p.normalOrder().tolist()).pitchNames)
-            nameseq = pd.DataFrame([[str(nn)]],columns=['Label'])
-            dnodes = dnodes.append(nameseq)
+        dnodes = pd.DataFrame(pcsLabels(mask2pcs(mask,TET)),columns=['Label'])
     else:
         dnodes = pd.DataFrame(df[:,0],columns=['Label'])
     if write: dnodes.to_csv('nodes.csv',index=False)
@@ -70,57 +63,25 @@ def pcsNetwork(dictionary,thup,thdw,distance,prob,write,pcslabel,TET):
     
     # find edges according to a metric
     
-    vector = np.zeros((df[:,col].shape[0],dim))
-    for i in range(df[:,col].shape[0]):
-        vector[i]  = np.asarray(list(map(int,re.findall('\d+',df[i,col]))))
+    vector = maskIntervalVector(mask,TET).astype(float)
     N = vector.shape[0]
-    index = np.linspace(0,vector.shape[0]-1,vector.shape[0],dtype=int)
-    # parallelize over interval vector to optimize the vectorization in sklm.pairwise_distances
+    # parallelize over interval vector to optimize the vectorization of the distance kernel
     ini,end = load_balancing(size, rank, N)
-    nsize = end-ini
     vaux = scatter_array(vector)
-    #pair = sklm.pairwise_distances(vaux,vector,metric=distance)
-    dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
-    for i in range(nsize):
-        tmp = pd.DataFrame(None,columns=['Source','Target','Weight'])
-        tmp['Source'] = (i+ini)*np.ones(vector.shape[0],dtype=int)[:]
-        tmp['Target'] = index[:]
-        tmp['Weight'] = np.sqrt(np.sum((vaux[i,:]-vector[:,:])**2,axis=1))
-        tmp = tmp.query('Weight<='+str(thup)).query('Weight>='+str(thdw))
-        if prob == 1:
-            dedges = dedges.append(tmp)
-        else:
-            np.random.seed(int(time.time()))
-            if np.random.rand() >= prob:
-                dedges = dedges.append(tmp)
-            else:
-                pass
-            
-    dedges = dedges.query('Weight<='+str(thup)).query('Weight>='+str(thdw))
-    dedges['Weight'] = dedges['Weight'].apply(lambda x: 1/x)
-    # do some cleaning
-    cond = dedges.Source > dedges.Target
-    dedges.loc[cond, ['Source', 'Target']] = dedges.loc[cond, ['Target', 'Source']].values
-    dedges = dedges.drop_duplicates(subset=['Source', 'Target'])
+    source,target,weight = sparsePairDistance(vaux,vector,thup,thdw,distance,offset=ini)
+    if prob != 1:
+        keep = np.random.rand(weight.shape[0]) <= prob
+        source,target,weight = source[keep],target[keep],weight[keep]
+    edges = EdgeBuffer(source.shape[0])
+    edges.extend(source,target,1/weight)
 
-    # write csv for partial edges
-    dedges.to_csv('edges'+str(rank)+'.csv',index=False)
-    if para: comm.Barrier()
-    
-    if size != 1 and rank == 0:
-        dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
-        for i in range(size):
-            tmp = pd.read_csv('edges'+str(i)+'.csv')
-            dedges = dedges.append(tmp)
-            os.remove('edges'+str(i)+'.csv')
-        # do some cleaning
-        cond = dedges.Source > dedges.Target
-        dedges.loc[cond, ['Source', 'Target']] = dedges.loc[cond, ['Target', 'Source']].values
-        dedges = dedges.drop_duplicates(subset=['Source', 'Target'])
+    # gather partial edges in memory on rank 0 and remove duplicates
+    rec = gatherv(edges.records())
+    if rank == 0:
+        edges = EdgeBuffer(rec.shape[0])
+        edges.extend(rec['Source'],rec['Target'],rec['Weight'])
+        edges.unique()
         # write csv for edges
-        if write: dedges.to_csv('edges.csv',index=False)
-    elif size == 1:
-        os.rename('edges'+str(rank)+'.csv','edges.csv')
-        if not write: os.remove('edges.csv')
+        if write: edges.toDataFrame().to_csv('edges.csv',index=False)
 
-    return(dnodes,dedges)
+    return(edges.toOutput(dnodes,output))
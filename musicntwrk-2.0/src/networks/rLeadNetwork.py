@@ -15,14 +15,14 @@
 
 import time,re,os
 import numpy as np
-import fractions as fr
 import pandas as pd
 
-from ..musicntwrk import RHYTHMSeq
-from ..utils.floatize import floatize
-from ..utils.rhythmDistance import rhythmDistance
+from ..musicntwrk import RHYTHMSeqArray
+from ..utils.str2frac import str2frac
+from ..utils.minimalDistanceMatrix import minimalDistanceMatrix
+from ..utils.edgeBuffer import EdgeBuffer
 
-def rLeadNetwork(dictionary,thup,thdw,distance,prob,write):
+def rLeadNetwork(dictionary,thup,thdw,distance,prob,write,output=None):
         
     '''
     •	generation of the network of all minimal rhythm leadings in a generalized musical space of Nc-dim rhythmic cells – based on the rhythm distance operator
@@ -30,6 +30,7 @@ def rLeadNetwork(dictionary,thup,thdw,distance,prob,write):
     •	thup, thdw (float)– upper and lower thresholds for edge creation
     •	w (logical) – if True it writes the nodes.csv and edges.csv files in csv format
     •	returns nodes and edges tables as pandas DataFrames
+    •	output (str) – format of nodes and edges: None (pandas DataFrames), 'csr', 'coo' (scipy.sparse) or 'networkx'
     '''
 
     start=time.time()    
@@ -44,32 +45,24 @@ def rLeadNetwork(dictionary,thup,thdw,distance,prob,write):
     
     # find edges according to a metric
     N = df[:,1].shape[0]
-    dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
     np.random.seed(int(time.process_time()*10000))
-    for i in range(N):
-        vector_i = []
-        for l in range(len(df[:,1][0].split())):
-            vector_i.append(fr.Fraction(df[:,1][i].split()[l]))
-        vector_i  = RHYTHMSeq(vector_i)
-        for j in range(i,N):
-            vector_j = []
-            for l in range(len(df[:,1][0].split())):
-                vector_j.append(fr.Fraction(df[:,1][j].split()[l]))
-            vector_j  = RHYTHMSeq(vector_j)
-            pair = floatize(rhythmDistance(vector_i,vector_j,distance))
-            if pair < thup and pair > thdw:
-                if prob == 1:
-                    tmp = pd.DataFrame([[str(i),str(j),str(pair)]],columns=['Source','Target','Weight'])
-                    dedges = dedges.append(tmp)
-                else:
-                    r = np.random.rand()
-                    if r <= prob:
-                        tmp = pd.DataFrame([[str(i),str(j),str(pair)]],columns=['Source','Target','Weight'])
-                        dedges = dedges.append(tmp)
-                    else:
-                        pass
+    # parse the cells once: normal orders in units of whole notes
+    cells = RHYTHMSeqArray([str2frac(r) for r in df[:,1]])
+    vector = cells.normalOrder()/cells.TPW
+    # minimal distance over the shifts of one voice by a whole note, as in rhythmDistance(), by blocks of rows
+    edges = EdgeBuffer()
+    chunk = 512
+    for i in range(0,N,chunk):
+        dis,_ = minimalDistanceMatrix(vector[i:i+chunk],vector[i:],1,distance,sort=False,chunk=chunk)
+        ix,iy = np.nonzero((dis < thup) & (dis > thdw))
+        keep = iy >= ix
+        ix,iy = ix[keep],iy[keep]
+        if prob != 1:
+            keep = np.random.rand(ix.shape[0]) <= prob
+            ix,iy = ix[keep],iy[keep]
+        edges.extend(ix+i,iy+i,dis[ix,iy])
 
     # write csv for edges
-    if write: dedges.to_csv('edges.csv',index=False)
+    if write: edges.toDataFrame().to_csv('edges.csv',index=False)
 
-    return(dnodes,dedges)
+    return(edges.toOutput(dnodes,output))
@@ -18,15 +18,22 @@ import itertools as itr
 import numpy as np
 import pandas as pd
 
-from ..musicntwrk import RHYTHMSeq
+from ..musicntwrk import RHYTHMSeqArray
 
 from ..utils.communications import *
 from ..utils.load_balancing import *
 
-# initialize parallel execution
-comm=MPI.COMM_WORLD
-rank = comm.Get_rank()
-size = comm.Get_size()
+try:
+    from mpi4py import MPI
+    # initialize parallel execution
+    comm=MPI.COMM_WORLD
+    rank = comm.Get_rank()
+    size = comm.Get_size()
+    para = True
+except:
+    rank = 0
+    size = 1
+    para = False
 
 def rhythmDictionary(Nc,a,REF):
 
@@ -38,40 +45,29 @@ def rhythmDictionary(Nc,a,REF):
     •	returns the dictionary as pandas DataFrame and indicates all non retrogradable cells
     '''
     name = []
-    prime = []
     if a == None:
         sys.exit()
-    a = RHYTHMSeq(a).normalOrder()
-    a = RHYTHMSeq(a).floatize()
-    a = np.unique(np.asarray(list(itr.combinations(a,Nc))),axis=0)
+    # durations as integer ticks on a common grid
+    a = RHYTHMSeqArray([a],REF)
+    TPW = a.TPW
+    a = np.unique(np.asarray(list(itr.combinations(a.normalOrder()[0],Nc))),axis=0)
         
     # put all cells in prime/normal order form
 
-    s = []
-    v = []
-    for i in range(a.shape[0]):
-        p = RHYTHMSeq(a[i,:].tolist(),REF)
-        s.append(p.normalOrder())
-        v.append(p.durationVector()[0])
-    s = np.asarray(s)
-    vector = np.asarray(v)
+    p = RHYTHMSeqArray(a,REF,TPW=TPW)
+    prime = p.labels(p.normalOrder()).tolist()
+    vector = p.durationVector()[0]
 
     for i in range(a.shape[0]):
         name.append(str(Nc)+'-'+str(i+1))
-        prime.append(str(s[i,:]).replace('Fraction','').replace(', ','/')\
-                            .replace('(','').replace(')','').replace('\n','').replace('[','').replace(']',''))
         
         
     dictionary = None
     
-    # find those that can be made non retrogradable
+    # find those that can be made non retrogradable (some permutation of the cell is a palindrome)
     
-    for n in range(a.shape[0]):
-        perm = np.asarray(list(itr.permutations(a[n,:],a.shape[1])))
-        perm = np.unique(perm,axis=0)
-        for i in range(perm.shape[0]):
-            if RHYTHMSeq(perm[i].tolist(),REF).isNonRetro():
-                name[n] = name[n]+'N'
+    for n in np.nonzero(p.canBeNonRetro())[0]:
+        name[n] = name[n]+'N'
     
     # find those that are Z-related (have same duration vector)
     
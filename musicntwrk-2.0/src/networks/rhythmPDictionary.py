@@ -13,24 +13,27 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
-import sys
-import itertools as itr
+import sys,math
 import numpy as np
 import pandas as pd
 
-from ..musicntwrk import RHYTHMSeq
+from ..musicntwrk import RHYTHMSeqArray
 
 from ..utils.communications import *
 from ..utils.load_balancing import *
-from ..utils.Sublists import *
-from ..utils.Remove import *
-from ..utils.str2frac import *
-from ..utils.str2float import *
+from ..utils.unrankCombinations import unrankCompositions
 
-# initialize parallel execution
-comm=MPI.COMM_WORLD
-rank = comm.Get_rank()
-size = comm.Get_size()
+try:
+    from mpi4py import MPI
+    # initialize parallel execution
+    comm=MPI.COMM_WORLD
+    rank = comm.Get_rank()
+    size = comm.Get_size()
+    para = True
+except:
+    rank = 0
+    size = 1
+    para = False
 
 def rhythmPDictionary(N,Nc,REF):
 
@@ -39,88 +42,45 @@ def rhythmPDictionary(N,Nc,REF):
         REF durations
     •	N (int)– number of REF units
     •	Nc cardinality of the grouping
+    •	the groupings are the compositions of N in Nc parts, generated by stars and bars unranking
+        and split among processes
     •	returns the dictionary as pandas DataFrame and indicates all non retrogradable cells
     '''
-    name = []
-    prime = []
-    
-    r = [REF] * N
-    r = RHYTHMSeq(r)
-    idx = np.linspace(0,N-1,N,dtype=int)
-    
-    subidx = list(Sublists(idx))
-    seq=[]
-    for l in range(len(subidx)):
-        subseq = []
-        for i in range(len(subidx[l])):
-            aux = 0
-            for k in range(len(subidx[l][i])):
-                aux += r.rseq[subidx[l][i][k]]
-            subseq.append(aux)
-        seq.append(subseq)
-    seq = Remove(seq)
-    
-    # select groupings with requested cardinality
-    seqx = []
-    for n in range(len(seq)):
-        if len(seq[n]) == Nc:
-            seqx.append(seq[n])
-    seq = seqx
-        
-    # put all cells in prime/normal order form
-    s = []
-    v = []
-    for i in range(len(seq)):
-        p = RHYTHMSeq(seq[i][:],REF)
-        s.append(p.rseq)
-        v.append(p.rIntervalVector()[0])
-    s = np.asarray(s)
-    vector = np.asarray(v)
+    # durations as integer ticks on a common grid
+    ref = RHYTHMSeqArray([[REF]],REF)
+    TPW = ref.TPW
 
-    for i in range(len(seq)):
-        name.append(str(Nc)+'-'+str(i+1))
-        prime.append(str(s[i,:]).replace('Fraction','').replace(', ','/')\
-                            .replace('(','').replace(')','').replace('\n','').replace('[','').replace(']',''))
-        
-    dictionary = None
-    
-    # Create dictionary of rhythmic cells
-    reference = []
-    for n in range(len(name)):
-        entry = [name[n],prime[n],
-                np.array2string(vector[n,:],separator=',').replace(" ","")]
-        reference.append(entry)
+    # each process generates only its own slice of the compositions of N REF units in Nc parts
+    ini,end = load_balancing(size, rank, math.comb(N-1,Nc-1))
+    p = RHYTHMSeqArray(unrankCompositions(N,Nc,ini,end)*ref.ticks[0,0],REF,TPW=TPW)
 
-    dictionary = pd.DataFrame(reference,columns=['cell','r-seq','r-vec'])
-    dictionary = dictionary.drop_duplicates(subset=['r-seq', 'r-vec'])
-    
-    # clean dictionary
-    for n in range(len(dictionary)):
-        dictionary.loc[n][1] = str(RHYTHMSeq(str2frac(dictionary.loc[n][1])).normalOrder())\
-        .replace('Fraction','').replace(', ','/').replace('(','').replace(')','')\
-        .replace('\n','').replace('[','').replace(']','')
-    dictionary = dictionary.drop_duplicates(subset=['r-seq', 'r-vec']).reset_index(drop=True)
-    
-    # rename entries in ascending order and check for non-retrogradability
-    for n in range(len(dictionary)):
-        dictionary.loc[n][0] = str(Nc)+'-'+str(n+1)
-        if RHYTHMSeq(str2frac(dictionary.loc[n][1])).isNonRetro(): 
-            dictionary.loc[n][0] += 'N'
-    
-    # find those that are Z-related (have same interval onset vector)
-    
-    vector = []
-    for n in range(len(dictionary)):
-        vector.append(str2float(dictionary['r-vec'][n]))
-    u, indeces = np.unique(vector, return_inverse=True,axis=0)
-    ZrelT = []
-    for n in range(u.shape[0]):
-        if np.array(np.where(indeces == n)).shape[1] != 1:
-            indx = np.array(np.where(indeces == n))[0]
-            Zrel = []
-            for m in range(indx.shape[0]):
-                dictionary.loc[indx[m]][0] = dictionary.loc[indx[m]][0]+'Z'
-                Zrel.append(dictionary.loc[indx[m]][0])
-            ZrelT.append(Zrel)    
-    return(dictionary,ZrelT)
+    # put all cells in normal order form and eliminate duplicates locally (keeping the first occurrence)
+    cell = np.hstack([p.normalOrder(),p.rIntervalVector()[0]])
+    _,first = np.unique(cell,return_index=True,axis=0)
+    cell = gatherv(cell[np.sort(first)])
+
+    dictionary = ZrelT = None
+    if rank == 0:
+        # eliminate duplicates among processes
+        _,first = np.unique(cell,return_index=True,axis=0)
+        cell = cell[np.sort(first)]
+        p = RHYTHMSeqArray(cell[:,:Nc],REF,TPW=TPW)
+        vector = cell[:,Nc:]
+
+        # name entries in ascending order and check for non-retrogradability
+        name = np.char.add(str(Nc)+'-',(np.arange(len(p))+1).astype(str)).astype(object)
+        name[p.isNonRetro()] += 'N'
 
+        # find those that are Z-related (have same interval onset vector)
+        u, indeces, counts = np.unique(vector,return_inverse=True,return_counts=True,axis=0)
+        indeces = indeces.reshape(-1)
+        name[counts[indeces] != 1] += 'Z'
+        ZrelT = []
+        for n in np.nonzero(counts != 1)[0]:
+            ZrelT.append(name[indeces == n].tolist())
+
+        # Create dictionary of rhythmic cells
+        dictionary = pd.DataFrame({'cell':name.astype(str),'r-seq':p.labels(),
+                                   'r-vec':[np.array2string(v,separator=',').replace(" ","") for v in vector]})
+
+    return(dictionary,ZrelT)
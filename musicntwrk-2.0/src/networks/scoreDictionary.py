@@ -19,6 +19,7 @@ import music21 as m21
 
 from ..musicntwrk import PCSet
 from ..utils.Remove import *
+from ..utils.pcsMask import pcs2mask
 
 def scoreDictionary(seq,TET=12):
     '''
@@ -63,5 +64,7 @@ def scoreDictionary(seq,TET=12):
         reference.append(entry)
 
     dictionary = pd.DataFrame(reference,columns=['class','pcs','interval'])
+    # integer encoding of the pcs for the network builders
+    dictionary['mask'] = pcs2mask(s)
     
     return(dictionary)
@@ -0,0 +1,174 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+from collections import deque
+import pandas as pd
+import numpy as np
+import community as cm
+
+from ..utils.minimalDistance import minimalDistance
+from ..utils.minimalNoBijDistance import minimalNoBijDistance
+from ..utils.opsName import opsName
+from ..utils.generalizedOpsName import generalizedOpsName
+from ..utils.pcsLabels import pcsLabels
+from ..utils.edgeBuffer import EdgeBuffer
+
+class ScoreGraph:
+
+    def __init__(self,TET=12,distance='euclidean',general=False,window=None):
+        '''
+        •	directional network of chord progressions updated in place as chord sequences are streamed in – a score
+            at a time over a corpus, or a window sliding over a long piece
+        •	general (logical) – operator names from generalizedOpsName (True) or opsName (False), as in scoreNetwork
+        •	window (int) – if set, only the chords and transitions among the last window chords are kept: chords that
+            leave the window are dropped from nodes, counts and graphs
+        •	nodes are numbered in order of appearance among the chords currently in the network; edges hold weight
+            (1/distance), operator and number of transitions; the operator of every pair of pcs is computed only once
+        '''
+        self.TET = TET
+        self.distance = distance
+        self.general = general
+        self.window = window
+        self.ids = {}
+        self.labels = []
+        self.counts = []
+        self.edges = {}
+        self.ops = {}
+        # chords in the window as [node, pcs, incoming edge]: the last one links the next chunk
+        self.chords = deque()
+        self.stats = {}
+
+    def operator(self,a,b):
+        # weight and operator of the transition between the pcs a and b (None if the distance is 0)
+        if (a,b) not in self.ops:
+            if len(a) == len(b):
+                x = np.asarray(a)
+                pair,r = minimalDistance(x,np.asarray(b),self.TET,self.distance)
+            elif len(a) > len(b):
+                x = np.asarray(a)
+                pair,r = minimalNoBijDistance(x,np.asarray(b),self.TET,self.distance)
+            else:
+                x = np.asarray(b)
+                pair,r = minimalNoBijDistance(x,np.asarray(a),self.TET,self.distance)
+            if pair != 0:
+                if self.general == False:
+                    self.ops[a,b] = (1/pair,opsName(x,r,self.TET))
+                else:
+                    self.ops[a,b] = (1/pair,generalizedOpsName(x,r,self.TET,self.distance)[1])
+            else:
+                self.ops[a,b] = None
+        return(self.ops[a,b])
+
+    def add(self,seq,link=True):
+        '''
+        •	append a sequence of chords (list of pcs, e.g. from readScore)
+        •	link (logical) – if False the first chord is not connected to the last chord of the previous sequence
+            (e.g. a new score of a corpus)
+        '''
+        if len(seq) == 0: return
+        label = pcsLabels(seq,self.TET).astype(str)
+        for n in range(len(seq)):
+            pcs = tuple(np.asarray(seq[n]).tolist())
+            if label[n] not in self.ids:
+                self.ids[label[n]] = len(self.labels)
+                self.labels.append(label[n])
+                self.counts.append(0)
+            i = self.ids[label[n]]
+            self.counts[i] += 1
+            key = None
+            if (n > 0 or link) and len(self.chords) > 0:
+                op = self.operator(self.chords[-1][1],pcs)
+                if op != None:
+                    key = (self.chords[-1][0],i)
+                    if key in self.edges:
+                        self.edges[key][2] += 1
+                    else:
+                        self.edges[key] = [op[0],op[1],1]
+            self.chords.append([i,pcs,key])
+            if self.window == None:
+                if len(self.chords) > 1: self.chords.popleft()
+            else:
+                while len(self.chords) > self.window: self.evict()
+        self.stats = {}
+
+    def evict(self):
+        # remove the oldest chord of the window and its transition to the next one
+        i,_,_ = self.chords.popleft()
+        self.counts[i] -= 1
+        if len(self.chords) > 0 and self.chords[0][2] != None:
+            key = self.chords[0][2]
+            self.edges[key][2] -= 1
+            if self.edges[key][2] == 0: del self.edges[key]
+            self.chords[0][2] = None
+
+    def live(self):
+        # chords in the network (count > 0) and position of every internal id among them (-1 if evicted)
+        counts = np.asarray(self.counts,dtype=int)
+        live = np.nonzero(counts > 0)[0]
+        pos = np.full(counts.shape[0],-1,dtype=int)
+        pos[live] = np.arange(live.shape[0])
+        return(live,pos)
+
+    def toEdgeBuffer(self,multi=False):
+        '''
+        •	edges as EdgeBuffer with operator labels, with multi=True one edge per transition
+        '''
+        _,pos = self.live()
+        edges = EdgeBuffer(max(1,len(self.edges)),label=True)
+        for (s,t),(w,op,c) in self.edges.items():
+            for _ in range(c if multi else 1):
+                edges.add(pos[s],pos[t],w,op)
+        return(edges)
+
+    def toOutput(self,output=None):
+        '''
+        •	nodes and edges as in scoreNetwork: output None (pandas DataFrames, with the number of transitions of every
+            edge in Count), 'csr', 'coo' (scipy.sparse) or 'networkx'; returns nodes, edges and node counts
+        '''
+        live,_ = self.live()
+        labels = np.asarray(self.labels,dtype=str)[live]
+        dnodes = pd.DataFrame(labels,columns=['Label'])
+        dcounts = pd.DataFrame({'Label':labels,'Counts':np.asarray(self.counts,dtype=int)[live]})
+        dnodes,dedges = self.toEdgeBuffer().toOutput(dnodes,output,directed=True)
+        if output == None or output == 'pandas':
+            dedges['Count'] = np.fromiter((e[2] for e in self.edges.values()),dtype=int,count=len(self.edges))
+        return(dnodes,dedges,dcounts)
+
+    def graph(self,directed=True,multi=False):
+        '''
+        •	networkx graph of the progression (multi=True: one edge per transition)
+        '''
+        return(self.toEdgeBuffer(multi).toNetworkx(directed=directed,multi=multi))
+
+    def degree(self):
+        '''
+        •	average degree of the directional network (nodes with at least one edge), as scoreNetwork
+        '''
+        if 'degree' not in self.stats:
+            nodes = set(s for s,t in self.edges) | set(t for s,t in self.edges)
+            # self-loops count twice, as in networkx
+            self.stats['degree'] = 2*len(self.edges)/float(len(nodes)) if len(nodes) > 0 else 0.0
+        return(self.stats['degree'])
+
+    def modularity(self):
+        '''
+        •	modularity and Louvain partition of the undirected network, evaluated only when requested after an update
+        '''
+        if 'modularity' not in self.stats:
+            gbch_u = self.graph(directed=False)
+            part = cm.best_partition(gbch_u)
+            self.stats['modularity'] = (cm.modularity(part,gbch_u),part)
+        return(self.stats['modularity'])
@@ -13,54 +13,33 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
+import sys
 import pandas as pd
 import numpy as np
-import music21 as m21
 import networkx as nx
 import community as cm
 
-from ..musicntwrk import PCSet
 from ..utils.minimalDistance import minimalDistance
 from ..utils.minimalNoBijDistance import minimalNoBijDistance
+from ..utils.opsName import opsName
 from ..utils.generalizedOpsName import generalizedOpsName
+from ..utils.pcsLabels import pcsLabels
+from ..utils.edgeBuffer import EdgeBuffer
 
-def scoreSubNetwork(seq,start,end,ntx,general,distance,grphtype,TET):
+def scoreSubNetwork(seq,start,end,ntx,general,distance,grphtype,TET,output=None):
     
     ''' 
     •	generates the directional network of chord progressions from any score in musicxml format
     •	seq (int) – list of pcs for each chords extracted from the score
     •	use readScore() to import the score data as sequence
+    •	output (str) – format of nodes and edges: None (pandas DataFrames), 'csr', 'coo' (scipy.sparse) or 'networkx'
     '''
     # build the directional network of the full progression in the chorale
 
-    dedges = pd.DataFrame(None,columns=['Source','Target','Weight','Label'])
-    dnodes = pd.DataFrame(None,columns=['Label'])
-    for n in range(len(seq)):
-        p = PCSet(np.asarray(seq[n]),TET)
-        if TET == 12:
-            if p.pcs.shape[0] == 1:
-                nn = ''.join(m21.chord.Chord(p.pcs.tolist()).pitchNames)
-            else:
-                nn = ''.join(m21.chord.Chord(p.normalOrder().tolist()).pitchNames)
-            nameseq = pd.DataFrame([[str(nn)]],columns=['Label'])
-        elif TET == 24:
-            dict24 = {'C':0,'C~':1,'C#':2,'D-':2,'D`':3,'D':4,'D~':5,'D#':6,'E-':6,'E`':7,'E':8,
-                                'E~':9,'F`':9,'F':10,'F~':11,'F#':12,'G-':12,'G`':13,'G':14,'G~':15,'G#':16,
-                                'A-':16,'A`':17,'A':18,'A~':19,'A#':20,'B-':20,'B`':21,'B':22,'B~':23,'C`':23}
-            tmp = []
-            for i in p.pcs:
-                tmp.append(list(dict24.keys())[list(dict24.values()).index(i)]) 
-            nameseq = pd.DataFrame([[''.join(tmp)]],columns=['Label'])
-        dnodes = dnodes.append(nameseq)
-    df = np.asarray(dnodes)
-    dnodes = pd.DataFrame(None,columns=['Label'])
-    dcounts = pd.DataFrame(None,columns=['Label','Counts'])
-    dff,idx,cnt = np.unique(df,return_inverse=True,return_counts=True)
-    for n in range(dff.shape[0]):
-        nameseq = pd.DataFrame([[str(dff[n])]],columns=['Label'])
-        dnodes = dnodes.append(nameseq)
-        namecnt = pd.DataFrame([[str(dff[n]),cnt[n]]],columns=['Label','Counts'])
-        dcounts = dcounts.append(namecnt)
+    edges = EdgeBuffer(label=True)
+    dff,idx,cnt = np.unique(pcsLabels(seq,TET).astype(str),return_inverse=True,return_counts=True)
+    dnodes = pd.DataFrame(dff,columns=['Label'])
+    dcounts = pd.DataFrame({'Label':dff,'Counts':cnt})
 
     for n in range(1,len(seq)):
         if len(seq[n-1]) == len(seq[n]):
@@ -79,31 +58,26 @@ def scoreSubNetwork(seq,start,end,ntx,general,distance,grphtype,TET):
         if pair != 0:
             if general == False:
                 if n >= start and n < end:
-                    tmp = pd.DataFrame([[str(idx[n-1]),str(idx[n]),str(1/pair),opsName(a,r,TET)]],
-                                        columns=['Source','Target','Weight','Label'])
+                    edges.add(idx[n-1],idx[n],1/pair,opsName(a,r,TET))
 #                 else:
-#                     tmp = pd.DataFrame([[str(idx[n-1]),str(idx[n]),str(0),opsName(a,r,TET)]],
-#                                         columns=['Source','Target','Weight','Label'])
-                    dedges = dedges.append(tmp)
+#                     edges.add(idx[n-1],idx[n],0,opsName(a,r,TET))
             else:
                 if n >= start and n < end:
-                    tmp = pd.DataFrame([[str(idx[n-1]),str(idx[n]),str(1/pair),generalizedOpsName(a,r,TET,distance)[1]]],
-                                        columns=['Source','Target','Weight','Label'])
+                    edges.add(idx[n-1],idx[n],1/pair,generalizedOpsName(a,r,TET,distance)[1])
 #                 else:
-#                     tmp = pd.DataFrame([[str(idx[n-1]),str(idx[n]),str(0),generalizedOpsName(a,r,TET)[1]]],
-#                                         columns=['Source','Target','Weight','Label'])
-                    dedges = dedges.append(tmp)
+#                     edges.add(idx[n-1],idx[n],0,generalizedOpsName(a,r,TET)[1])
+    dnodes,dedges = edges.toOutput(dnodes,output,directed=True)
     
     if ntx:
         # evaluate average degree and modularity
         if grphtype == 'directed':
-            gbch = nx.from_pandas_edgelist(dedges,'Source','Target',['Weight','Label'],create_using=nx.DiGraph())
+            gbch = edges.toNetworkx(directed=True)
         elif grphtype == 'multi':
-            gbch = nx.from_pandas_edgelist(dedges,'Source','Target',['Weight','Label'],create_using=nx.MultiDiGraph())
+            gbch = edges.toNetworkx(directed=True,multi=True)
         else:
             print('no graph type specified')
             sys.exit()
-        gbch_u = nx.from_pandas_edgelist(dedges,'Source','Target',['Weight','Label'])
+        gbch_u = edges.toNetworkx()
         # modularity 
         part = cm.best_partition(gbch_u)
         modul = cm.modularity(part,gbch_u)
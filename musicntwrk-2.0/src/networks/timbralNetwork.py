@@ -13,13 +13,18 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
-import sys,os
+import sys
 import numpy as np
 import itertools as iter
 import pandas as pd
+import scipy.sparse as sp
 
+from ..utils.sparsePairDistance import sparsePairDistance
+from ..utils.nearestNeighbors import topkPairDistance, lshCandidates, lshWidth, candidateDistance, kSmallest
 from ..utils.communications import *
 from ..utils.load_balancing import *
+from ..utils.edgeBuffer import EdgeBuffer
+from ..timbre.featureStore import FeatureStore
 
 try:
     from mpi4py import MPI
@@ -33,68 +38,115 @@ except:
     size = 1
     para = False
 
-def timbralNetwork(waves,vector,thup,thdw):
+def networkTables(network):
+    # nodes table and edge arrays of a network in any of the output formats of timbralNetwork
+    nodes,edges = network
+    if not isinstance(nodes,pd.DataFrame):
+        nodes = pd.DataFrame(np.asarray(nodes).reshape(-1).astype(str),columns=['Label'])
+    if isinstance(edges,pd.DataFrame):
+        return(nodes,edges['Source'].values,edges['Target'].values,edges['Weight'].values)
+    if sp.issparse(edges):
+        # symmetric adjacency matrix: edges with source <= target
+        edges = sp.triu(edges).tocoo()
+        return(nodes,edges.row,edges.col,edges.data)
+    try:
+        edges = np.array([(min(s,t),max(s,t),w) for s,t,w in edges.edges(data='Weight')]).reshape(-1,3)
+        return(nodes,edges[:,0].astype(int),edges[:,1].astype(int),edges[:,2])
+    except AttributeError:
+        print('network format not defined')
+        sys.exit()
+
+def timbralNetwork(waves,vector,thup,thdw,distance='euclidean',output=None,k=None,method='exact',network=None,
+                   ntables=16,nbits=8,width=None,seed=0):
     
     ''' 
     •    generates the network of MFCC vectors from sound recordings
-    •    seq – list of MFCC vectors
-    •    waves - names of wave files
+    •    seq – list of MFCC vectors, or a FeatureStore (read as a memory map, without copies)
+    •    waves - names of wave files (if None, the wave ids of the FeatureStore)
+    •    distance (str)– choice of norm in the timbral space, default is 'euclidean'
+    •	output (str) – format of nodes and edges: None (pandas DataFrames), 'csr', 'coo' (scipy.sparse) or 'networkx'
+    •	thup, thdw (float) – edges between sounds at distance in [thdw,thup] (None for no bound)
+    •	k (int) – if set, keep only the edges to the k nearest sounds of every sound
+    •	method (str) – 'exact': blocked evaluation of the distances
+                     'approximate': distances evaluated only between the sounds that share a bucket of a random
+                     projection hash (ntables tables of nbits projections, bucket width – default from thup or k)
+    •	network (tuple) – nodes and edges (in any output format) of the network of the first sounds in vector: only the
+        edges of the sounds that follow are computed and added to it (their k nearest neighbours are searched among
+        all the sounds, the neighbours of the existing sounds are not updated)
+    •	returns nodes (one per sound in the order of vector: node i is sound i) and edges
     '''
     # build the network
 
-    dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
-    dnodes = pd.DataFrame(None,columns=['Label'])
-    for n in range(len(waves)):
-        nameseq = pd.DataFrame([waves[n].split('/')[-1].split('.')[0]],columns=['Label'])
-        dnodes = dnodes.append(nameseq)
-    df = np.array(dnodes)
-    dnodes = pd.DataFrame(None,columns=['Label'])
-    dff,idx = np.unique(df,return_inverse=True)
-    for n in range(dff.shape[0]):
-        nameseq = pd.DataFrame([[str(dff[n])]],columns=['Label'])
-        dnodes = dnodes.append(nameseq)
-    
-    N = vector.shape[0]
-    index = np.linspace(0,vector.shape[0]-1,vector.shape[0],dtype=int)
-    # parallelize over interval vector to optimize the vectorization in sklm.pairwise_distances
-    ini,end = load_balancing(size, rank, N)
-    nsize = end-ini
-    vaux = scatter_array(vector)
-    #pair = sklm.pairwise_distances(vaux,vector,metric=distance)
-    dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
-    for i in range(nsize):
-        tmp = pd.DataFrame(None,columns=['Source','Target','Weight'])
-        tmp['Source'] = (i+ini)*np.ones(vector.shape[0],dtype=int)[:]
-        tmp['Target'] = index[:]
-        tmp['Weight'] = np.sqrt(np.sum((vaux[i,:]-vector[:,:])**2,axis=1))
-        tmp = tmp.query('Weight<='+str(thup)).query('Weight>='+str(thdw))
-        dedges = dedges.append(tmp)
-            
-    dedges = dedges.query('Weight<='+str(thup)).query('Weight>='+str(thdw))
-    dedges['Weight'] = dedges['Weight'].apply(lambda x: 1/x)
-    # do some cleaning
-    cond = dedges.Source > dedges.Target
-    dedges.loc[cond, ['Source', 'Target']] = dedges.loc[cond, ['Target', 'Source']].values
-    dedges = dedges.drop_duplicates(subset=['Source', 'Target'])
+    if isinstance(vector,FeatureStore):
+        if waves is None: waves = vector.waves
+        vector = vector.features
+    # flattened view of multidimensional descriptors (e.g. standardized cepstra)
+    vector = vector.reshape(vector.shape[0],-1)
+    if distance == None: distance = 'euclidean'
+    up = thup if thup != None else np.inf
+    dw = thdw if thdw != None else 0
 
-    # write csv for partial edges
-    dedges.to_csv('edges'+str(rank)+'.csv',index=False)
-    if para: comm.Barrier()
+    names = [w.split('/')[-1].split('.')[0] for w in waves]
+    N = vector.shape[0]
+    start = 0
+    # one node per sound, in the order of vector
+    if network != None:
+        # incremental update: the new sounds are appended to the existing nodes
+        nodes,nsource,ntarget,nweight = networkTables(network)
+        start = nodes.shape[0]
+        if start > N:
+            print('network has more nodes than sounds')
+            sys.exit()
+        dnodes = pd.concat([nodes,pd.DataFrame(np.array(names[start:]).astype(str),columns=['Label'])],
+                           ignore_index=True)
+    else:
+        dnodes = pd.DataFrame(np.array(names).astype(str),columns=['Label'])
     
-    if size != 1 and rank == 0:
-        dedges = pd.DataFrame(None,columns=['Source','Target','Weight'])
-        for i in range(size):
-            tmp = pd.read_csv('edges'+str(i)+'.csv')
-            dedges = dedges.append(tmp)
-            os.remove('edges'+str(i)+'.csv')
-        # do some cleaning
-        cond = dedges.Source > dedges.Target
-        dedges.loc[cond, ['Source', 'Target']] = dedges.loc[cond, ['Target', 'Source']].values
-        dedges = dedges.drop_duplicates(subset=['Source', 'Target'])
+    # parallelize over the new sounds to optimize the vectorization of the distance kernel
+    ini,end = load_balancing(size, rank, N-start)
+    ini += start
+    end += start
+    if method == 'exact':
+        if k == None:
+            source,target,weight = sparsePairDistance(vector[ini:end],vector,up,dw,distance,offset=ini,upper=(start == 0))
+            if start > 0:
+                # pairs with the existing sounds and among the new ones
+                keep = (target < start) | (target >= source)
+                source,target,weight = source[keep],target[keep],weight[keep]
+        else:
+            source,target,weight = topkPairDistance(vector[ini:end],vector,k,up,dw,distance,offset=ini)
+    elif method == 'approximate':
+        if width == None: width = lshWidth(vector,k,thup,distance,seed=seed)
+        source,target = lshCandidates(vector,width,ntables,nbits,start=start,seed=seed)
+        # every rank evaluates the candidates of its own sounds
+        keep = (target >= ini) & (target < end)
+        source,target = source[keep],target[keep]
+        weight = candidateDistance(vector,source,target,distance)
+        keep = (weight <= up) & (weight >= dw)
+        source,target,weight = source[keep],target[keep],weight[keep]
+    else:
+        print('method not defined')
+        sys.exit()
+    # undirected edges with source <= target
+    edges = EdgeBuffer(source.shape[0])
+    edges.extend(np.minimum(source,target),np.maximum(source,target),1/weight)
+
+    # gather partial edges in memory on rank 0 and remove duplicates
+    rec = gatherv(edges.records())
+    if rank == 0:
+        source,target,weight = rec['Source'],rec['Target'],rec['Weight']
+        if k != None and method == 'approximate':
+            # k nearest candidates (largest weights) of the new sounds
+            node = np.concatenate([source,target])
+            mask = kSmallest(node,-np.concatenate([weight,weight]),k) & (node >= start)
+            keep = mask[:source.shape[0]] | mask[source.shape[0]:]
+            source,target,weight = source[keep],target[keep],weight[keep]
+        edges = EdgeBuffer(rec.shape[0])
+        if network != None:
+            edges.extend(nsource,ntarget,nweight)
+        edges.extend(source,target,weight)
+        edges.unique()
         # write csv for edges
-        dedges.to_csv('edges.csv',index=False)
-    elif size == 1:
-        os.rename('edges'+str(rank)+'.csv','edges.csv')
+        edges.toDataFrame().to_csv('edges.csv',index=False)
 
-    return(dnodes,dedges)
-    
+    return(edges.toOutput(dnodes,output))
@@ -15,6 +15,7 @@
 
 import numpy as np
 import networkx as nx
+import scipy.sparse as sp
 import community as cm
 import matplotlib.pyplot as plt
 
@@ -22,13 +23,19 @@ def drawNetwork(Gx=None,Gxu=None,nodes=None,edges=None,forceiter=100,grphtype='u
     layout='force',drawlabels=True,giant=False,equi=False,res=0.5,k=None,edge_labels=False,font=12):
 
     if grphtype == 'directed':
-        if Gx == None and Gxu == None:
+        if Gx == None and Gxu == None and sp.issparse(edges):
+            # adjacency matrix as returned by the network builders with output='csr' or 'coo'
+            Gx = nx.from_scipy_sparse_array(edges,create_using=nx.DiGraph(),edge_attribute='Weight')
+            Gxu = nx.from_scipy_sparse_array(edges,edge_attribute='Weight')
+        elif Gx == None and Gxu == None:
             Gx = nx.from_pandas_edgelist(edges,'Source','Target',['Weight'],create_using=nx.DiGraph())
             Gxu = nx.from_pandas_edgelist(edges,'Source','Target',['Weight'])
         if giant: 
             print('not implemented')
     else:
-        if Gx == None:
+        if Gx == None and sp.issparse(edges):
+            Gx = nx.from_scipy_sparse_array(edges,edge_attribute='Weight')
+        elif Gx == None:
             Gx = nx.from_pandas_edgelist(edges,'Source','Target',['Weight'])
         if giant and not nx.is_connected(Gx):
             S = [Gx.subgraph(c).copy() for c in nx.connected_components(Gx)]
@@ -13,36 +13,19 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
+
 import numpy as np
-import glob, os
-import librosa
 
-from .normSoundDecay import normSoundDecay
+from .timbreFeatures import timbreFeatures
 
-def computeASCBW(input_path,input_file):
+def computeASCBW(input_path,input_file,nproc=None,cache=None):
     # sound descriptor as normalized sound decay (alpha), spectral centoid and spectral bandwidth
-    # as in Aramaki et al. 2009
-    eps=1.0e-10
-    waves = list(glob.glob(os.path.join(input_path,input_file)))
-    ascbw = []
-    for wav in np.sort(waves):
-        y, sr = librosa.load(wav)
-        maxsp = int(np.argwhere(np.abs(y) < eps)[0])
-        try:
-            alpha0,_,_ = normSoundDecay(y,sr,plot=False)
-        except:
-            onset_frames = librosa.onset.onset_detect(y=y, sr=sr)
-            y = y[(onset_frames[0]+1):]
-            maxsp = int(np.argwhere(np.abs(y) < eps)[0])
-            alpha0,_,_ = normSoundDecay(y,sr)
-        cent = librosa.feature.spectral_centroid(y=y, sr=sr,hop_length=maxsp)
-        spec_bw = librosa.feature.spectral_bandwidth(y=y, sr=sr,hop_length=maxsp)
-#        ascbw.append([alpha0,cent[0,0],spec_bw[0,0]])
-        ascbw.append([alpha0/cent[0,0],cent[0,0],spec_bw[0,0]])
-    ascbw = np.asarray(ascbw)
+    # as in Aramaki et al. 2009 (decoding and featurization in timbreFeatures)
+    waves, feat = timbreFeatures(input_path,input_file,'ASCBW',nproc=nproc,cache=cache)
+    ascbw = np.asarray(feat['ASCBW'])
     # normalization to np.max
     for i in range(3):
         ascbw[:,i] /= np.max(ascbw[:,i])
     
-    return(np.sort(waves),ascbw)
+    return(waves,ascbw)
 
@@ -13,19 +13,17 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
+
 import numpy as np
-import glob, os
-import librosa
 
-def computeMFCC(input_path,input_file,nmel,ncc,zero):
-    # read audio files in repository and compute the MFCC
-    waves = list(glob.glob(os.path.join(input_path,input_file)))
+from .timbreFeatures import timbreFeatures
+
+def computeMFCC(input_path,input_file,nmel,ncc,zero,nproc=None,cache=None):
+    # read audio files in repository and compute the MFCC (decoding and featurization in timbreFeatures)
+    waves, feat = timbreFeatures(input_path,input_file,'MFCC',nmel=nmel,ncc=ncc,nproc=nproc,cache=cache)
     mfcc0 = []
-    for wav in np.sort(waves):
-        y, sr = librosa.load(wav)
-        S = librosa.feature.melspectrogram(y, sr=sr, n_mels=nmel)
-        log_S = librosa.power_to_db(S, ref=np.max)
-        mfcc = librosa.feature.mfcc(S=log_S, n_mfcc=ncc)
+    for mfcc in feat['MFCC']:
+        mfcc = np.array(mfcc)
 #        # Here we take the average over a single impulse (for lack of a better measure...)
 #        mfcc0.append(np.sum(mfcc,axis=1)/mfcc.shape[1])
         # use mfcc[0] as weighting function for the average of the mfcc's over the full impulse
@@ -39,5 +37,5 @@ def computeMFCC(input_path,input_file,nmel,ncc,zero):
         temp = np.asarray(mfcc0)
         mfcc0 = temp[:,1:]
     
-    return(np.sort(waves),np.ascontiguousarray(mfcc0),mfcc)
+    return(waves,np.ascontiguousarray(mfcc0),mfcc)
     
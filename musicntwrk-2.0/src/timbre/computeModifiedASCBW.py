@@ -14,44 +14,28 @@
 #
 
 import numpy as np
-import glob, os
-import librosa
 
 import matplotlib.pyplot as plt
 import matplotlib.style as ms
 ms.use('seaborn-muted')
 
-from .mfccSoundDecayPiecewise import mfccSoundDecayPiecewise
-from .minimizeBKPT import minimizeBKPT
+from .timbreFeatures import timbreFeatures
 
-def computeModifiedASCBW(input_path,input_file,scnd,method,nstep):
+def computeModifiedASCBW(input_path,input_file,scnd,method,nstep,nproc=None,cache=None):
     # sound descriptor as normalized sound decay from the fit of the 0-th component of the MFCC, 
-    # spectral centoid and spectral bandwidth
-    eps=1.0e-10
-    waves = list(glob.glob(os.path.join(input_path,input_file)))
+    # spectral centoid and spectral bandwidth (decoding and featurization in timbreFeatures)
+    waves, feat = timbreFeatures(input_path,input_file,'modifiedASCBW',method=method,nstep=nstep,nproc=nproc,cache=cache)
     ascbw = []
-    for wav in np.sort(waves):
-        y, sr = librosa.load(wav)
-        maxsp = int(np.argwhere(np.abs(y) < eps)[0])
-        cent = librosa.feature.spectral_centroid(y=y, sr=sr,hop_length=maxsp)
-        spec_bw = librosa.feature.spectral_bandwidth(y=y, sr=sr,hop_length=maxsp)
-        S = librosa.feature.melspectrogram(y, sr=sr, n_mels=16)
-        log_S = librosa.power_to_db(S, ref=np.max)
-        mfcc = librosa.feature.mfcc(S=log_S, n_mfcc=13)
-        try:
-            a,_,_,_,_ = mfccSoundDecayPiecewise(mfcc[0],breakpoints=minimizeBKPT(mfcc[0],method=method,nstep=nstep)[1])
-        except:
-            print(wav)
+    for n in range(len(waves)):
+        a = feat['modifiedASCBW'][n]
+        if a is None:
+            print(waves[n])
             break
-        alpha0 = a[0]
-        if np.abs(a[1]) > np.abs(a[2]): a[1] = a[2]
-        if a[1] > 0: a[1] = 0
-        alpha1 = a[1]
         if scnd: 
-            ascbw.append([np.abs(alpha0),np.abs(alpha1),cent[0,0],spec_bw[0,0]])
+            ascbw.append([np.abs(a[0]),np.abs(a[1]),a[2],a[3]])
             na = 4
         else:
-            ascbw.append([np.abs(alpha0),cent[0,0],spec_bw[0,0]])
+            ascbw.append([np.abs(a[0]),a[2],a[3]])
             na = 3
     ascbw = np.asarray(ascbw)
     # normalization to np.max
@@ -68,5 +52,5 @@ def computeModifiedASCBW(input_path,input_file,scnd,method,nstep):
     print('spectral centroid        = ',int(ascbwu[0,2]))
     print('bandwidth                = ',int(ascbwu[0,3]))
     
-    return(np.sort(waves),ascbw,ascbwu)
+    return(waves,ascbw,ascbwu)
 
@@ -13,19 +13,17 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
+
 import numpy as np
-import glob,os
-import librosa
 
-def computePSCC(input_path,input_file,ncc,zero):
-    # read audio files in repository and compute the PSCC
-    waves = list(glob.glob(os.path.join(input_path,input_file)))
+from .timbreFeatures import timbreFeatures
+
+def computePSCC(input_path,input_file,ncc,zero,nproc=None,cache=None):
+    # read audio files in repository and compute the PSCC (decoding and featurization in timbreFeatures)
+    waves, feat = timbreFeatures(input_path,input_file,'PSCC',ncc=ncc,nproc=nproc,cache=cache)
     mfcc0 = []
-    for wav in np.sort(waves):
-        y, sr = librosa.load(wav)
-        S = np.abs(librosa.stft(y))**2
-        log_S = librosa.power_to_db(S, ref=np.max)
-        mfcc = librosa.feature.mfcc(S=log_S, n_mfcc=ncc)
+    for mfcc in feat['PSCC']:
+        mfcc = np.array(mfcc)
         # use mfcc[0] as weighting function for the average of the mfcc's over the full impulse
         mfnorm = (mfcc[0]-np.min(mfcc[0]))/np.max(mfcc[0]-np.min(mfcc[0]))
         mfcc0.append(mfcc.dot(mfnorm)/mfcc.shape[1])
@@ -37,5 +35,5 @@ def computePSCC(input_path,input_file,ncc,zero):
         temp = np.asarray(mfcc0)
         mfcc0 = temp[:,1:]
 
-    return(np.sort(waves),np.ascontiguousarray(mfcc0),mfcc)
+    return(waves,np.ascontiguousarray(mfcc0),mfcc)
     
@@ -13,39 +13,24 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
+
 import numpy as np
-import glob,os
-import librosa
 
-def computeStandardizedMFPS(input_path,input_file,nmel,lmax,maxi,nbins):
+from .timbreFeatures import timbreFeatures, waveLengths
+
+def computeStandardizedMFPS(input_path,input_file,nmel,lmax,maxi,nbins,nproc=None,cache=None,mmap=None):
     # read audio files in repository and compute the standardized (equal number of samples per file) 
-    # and normalized MFCC
-    waves = list(glob.glob(os.path.join(input_path,input_file)))
-    wf = []
-    for wav in np.sort(waves):
-        y, sr = librosa.load(wav)
-        wf.append(y)
-    wf = np.asarray(wf)
-    # standardization of the number of sample in every sound wav
+    # and normalized MFCC (decoding and featurization in timbreFeatures)
+    # features are streamed one file at a time into a preallocated array (memory-mapped .npy file if mmap is set)
+    # standardization of the number of sample in every sound wav - lengths from the file headers only
     if lmax == None:
-        lwf = []
-        for n in range(wf.shape[0]):
-            lwf.append(wf[n].shape[0])
-        lwf = np.asarray(lwf)
-        lmax = np.max(lwf)
-    mfcc = []
-    for n in range(wf.shape[0]):
-        if wf[n].shape[0] <= lmax:
-            wtmp = np.pad(wf[n], (0, lmax-wf[n].shape[0]), 'constant')
-        else:
-            wtmp = wf[n][:lmax]
-        if nbins == None:
-            hopl = 512
-        else:
-            hopl = hopl = int((lmax/nbins)*2/2+1) #round(int(lmax/nbins)/2)*2
-        S = librosa.feature.melspectrogram(wtmp, sr=sr, n_mels=nmel,hop_length=hopl)
-        log_S = librosa.power_to_db(S, ref=np.max)
-        mfcc.append(log_S)
-    mfcc = np.asarray(mfcc)
-    return(np.sort(waves),mfcc,lmax)
-
+        waves, lengths = waveLengths(input_path,input_file)
+        lmax = int(np.max(lengths))
+    if nbins == None:
+        hopl = 512
+    else:
+        hopl = int((lmax/nbins)*2/2+1) #round(int(lmax/nbins)/2)*2
+    waves, feat = timbreFeatures(input_path,input_file,'standardMFPS',nmel=nmel,hop=hopl,lmax=lmax,nproc=nproc,cache=cache,
+                                 out=(mmap if mmap != None else True))
+    mfcc = np.asarray(feat['standardMFPS'])
+    return(waves,mfcc,lmax)
@@ -0,0 +1,90 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import io,json,hashlib,sqlite3
+import numpy as np
+
+def fileHash(wav,block=1<<20):
+    # sha1 of the content of a file, so that renamed or copied samples share their features
+    h = hashlib.sha1()
+    with open(wav,'rb') as f:
+        for chunk in iter(lambda: f.read(block),b''):
+            h.update(chunk)
+    return(h.hexdigest())
+
+class FeatureCache:
+
+    def __init__(self,path=None,commit=64):
+        '''
+        •	persistent store of the timbre descriptors of sound files
+        •	path (str) – name of the SQLite file, if None the features are kept in memory
+        •	commit (int) – number of new entries written before each commit
+        •	entries are keyed by the hash of the file content, the descriptor and its parameters
+        '''
+        self.commit = commit
+        self.data = {}
+        self.db = None
+        self.new = 0
+        if path != None: self.open(path)
+
+    def open(self,path):
+        '''
+        •	attach (or create) the persistent store in the SQLite file path
+        '''
+        self.close()
+        self.db = sqlite3.connect(path)
+        self.db.execute('CREATE TABLE IF NOT EXISTS features (key TEXT PRIMARY KEY, value BLOB)')
+        self.db.commit()
+
+    def flush(self):
+        if self.db != None:
+            self.db.commit()
+            self.new = 0
+
+    def close(self):
+        if self.db != None:
+            self.flush()
+            self.db.close()
+            self.db = None
+
+    def key(self,sha,descriptor,params):
+        '''
+        •	sha (str) – hash of the file content (fileHash)
+        •	params (dict) – parameters of the descriptor (nmel, ncc, sr, hop, ...)
+        '''
+        return(sha+'|'+descriptor+'|'+json.dumps(params,sort_keys=True))
+
+    def get(self,key):
+        '''
+        •	returns the feature array or None if it has not been computed yet
+        '''
+        if key in self.data:
+            return(self.data[key])
+        if self.db != None:
+            row = self.db.execute('SELECT value FROM features WHERE key=?',(key,)).fetchone()
+            if row != None:
+                return(np.load(io.BytesIO(row[0]),allow_pickle=False))
+        return(None)
+
+    def put(self,key,value):
+        if self.db == None:
+            self.data[key] = value
+        else:
+            buf = io.BytesIO()
+            np.save(buf,np.asarray(value),allow_pickle=False)
+            self.db.execute('INSERT OR REPLACE INTO features VALUES (?,?)',(key,buf.getvalue()))
+            self.new += 1
+            if self.new >= self.commit: self.flush()
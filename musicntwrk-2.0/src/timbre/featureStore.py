@@ -0,0 +1,132 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import os,sys,json
+import numpy as np
+
+class FeatureStore:
+
+    def __init__(self,path,descriptor=None,params=None):
+        '''
+        •	on-disk, memory-mapped store of the timbre descriptors of a library of sound files: a directory with
+            the dense feature tensor as raw binary (features.bin) and the metadata (meta.json) – wave ids, descriptor,
+            parameters, shape and dtype of the feature of a single file
+        •	path (str) – directory of the store, created if it does not exist
+        •	descriptor (str), params (dict) – descriptor and parameters (nmel, ncc, lmax, ...) of a new store, they
+            must match the ones of an existing store
+        '''
+        self.path = path
+        self.meta = {'descriptor':descriptor,'params':params if params != None else {},'shape':None,'dtype':None,
+                     'waves':[]}
+        if os.path.isfile(os.path.join(path,'meta.json')):
+            with open(os.path.join(path,'meta.json')) as f:
+                self.meta = json.load(f)
+            if self.meta['descriptor'] == None and descriptor != None:
+                self.meta['descriptor'] = descriptor
+                self.meta['params'] = params if params != None else {}
+            elif (descriptor != None and descriptor != self.meta['descriptor']) or \
+                (params != None and json.dumps(params,sort_keys=True) != json.dumps(self.meta['params'],sort_keys=True)):
+                print('descriptor or parameters do not match the store in ',path)
+                sys.exit()
+        else:
+            os.makedirs(path,exist_ok=True)
+            self.dump()
+        self.ids = {w:n for n,w in enumerate(self.meta['waves'])}
+        self.data = None
+
+    def __len__(self):
+        return(len(self.meta['waves']))
+
+    def dump(self):
+        # metadata are rewritten after the features, so that an interrupted append leaves a consistent store
+        tmp = os.path.join(self.path,'meta.json.tmp')
+        with open(tmp,'w') as f:
+            json.dump(self.meta,f)
+        os.replace(tmp,os.path.join(self.path,'meta.json'))
+
+    @property
+    def descriptor(self):
+        return(self.meta['descriptor'])
+
+    @property
+    def params(self):
+        return(self.meta['params'])
+
+    @property
+    def waves(self):
+        return(np.array(self.meta['waves']))
+
+    @property
+    def features(self):
+        '''
+        •	read-only memory map of the (n_files, ...) feature tensor: slices are views on the file, no data is copied
+        '''
+        if self.data is None or self.data.shape[0] != len(self):
+            if len(self) == 0:
+                shape = tuple(self.meta['shape']) if self.meta['shape'] != None else ()
+                return(np.zeros((0,)+shape))
+            self.data = np.memmap(os.path.join(self.path,'features.bin'),mode='r',dtype=np.dtype(self.meta['dtype']),
+                                  shape=(len(self),)+tuple(self.meta['shape']))
+        return(self.data)
+
+    def __getitem__(self,idx):
+        '''
+        •	random access by position, slice or wave id (str)
+        '''
+        if isinstance(idx,str):
+            idx = self.ids[idx]
+        return(self.features[idx])
+
+    def index(self,waves):
+        '''
+        •	positions of the wave ids in the store (-1 if missing)
+        '''
+        return(np.array([self.ids.get(w,-1) for w in np.asarray(waves).reshape(-1)],dtype=np.int64))
+
+    def append(self,waves,features,chunk=256):
+        '''
+        •	append the features (n_files, ...) of the sound files waves, waves already in the store are skipped
+        •	features can be a memory map (e.g. the mmap output of computeStandardizedMFCC): they are written in chunks
+        '''
+        waves = np.asarray(waves).reshape(-1)
+        if waves.shape[0] != features.shape[0]:
+            print('number of waves and features do not match')
+            sys.exit()
+        if self.meta['shape'] == None:
+            self.meta['shape'] = list(features.shape[1:])
+            self.meta['dtype'] = np.dtype(features.dtype).str
+        elif list(features.shape[1:]) != self.meta['shape']:
+            print('shape of the features does not match the store: ',features.shape[1:],tuple(self.meta['shape']))
+            sys.exit()
+        dtype = np.dtype(self.meta['dtype'])
+        new = np.array([w not in self.ids for w in waves],dtype=bool)
+        # repeated waves within the same call are stored once
+        _,first = np.unique(waves,return_index=True)
+        once = np.zeros(waves.shape[0],dtype=bool)
+        once[first] = True
+        new &= once
+        with open(os.path.join(self.path,'features.bin'),'ab') as f:
+            # truncate any partial write left by an interrupted append
+            f.truncate(len(self)*int(np.prod(self.meta['shape']))*dtype.itemsize)
+            for i in range(0,waves.shape[0],chunk):
+                sel = new[i:i+chunk]
+                if np.any(sel):
+                    f.write(np.ascontiguousarray(features[i:i+chunk][sel],dtype=dtype).tobytes())
+        for w in waves[new]:
+            self.ids[str(w)] = len(self.meta['waves'])
+            self.meta['waves'].append(str(w))
+        self.dump()
+        return(int(np.sum(new)))
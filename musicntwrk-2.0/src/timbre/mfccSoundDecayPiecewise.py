@@ -17,12 +17,17 @@ import numpy as np
 
 from ..utils.SegmentedLinearReg import SegmentedLinearReg
 
-def mfccSoundDecayPiecewise(mfcc,breakpoints=[]):
+def decayCurve(mfcc):
+    # logarithm of the decay of the 0-th MFCC from its maximum (first 100 frames)
     idmax = np.argwhere(mfcc == np.max(mfcc))[0,0]
     y = mfcc[idmax:100]
     y = y-np.min(y)
     y = np.log(y[y>1.e-10])
     x = np.arange(len(y))
+    return(x,y)
+
+def mfccSoundDecayPiecewise(mfcc,breakpoints=[]):
+    x,y = decayCurve(mfcc)
 
     initialBreakpoints = breakpoints
     xfit,yfit = SegmentedLinearReg( x, y, initialBreakpoints )
@@ -13,50 +13,75 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
+import sys
 import numpy as np
-from .mfccSoundDecayPiecewise import mfccSoundDecayPiecewise
+from .mfccSoundDecayPiecewise import decayCurve
 
-def minimizeBKPT(vec,method='MC',nstep=100,extrema=[(0,20),(15,40),(30,60)]):
+def segmentCosts(x,y,minlen=2):
+    '''
+    •	sum of squared residuals of the least-squares line through every segment y[s:e] of the curve
+    •	prefix sums of 1, x, y, x^2, xy, y^2 give each fit in O(1): the (n+1,n+1) matrix of costs is built in one
+        vectorized step, segments shorter than minlen have infinite cost
+    '''
+    x = np.asarray(x,dtype=float)
+    y = np.asarray(y,dtype=float)
+    # center x to reduce cancellations in the sums
+    x = x-np.mean(x)
+    S = [np.concatenate([[0.0],np.cumsum(v)]) for v in [np.ones_like(x),x,y,x*x,x*y,y*y]]
+    D = [c[None,:]-c[:,None] for c in S]
+    n,sx,sy,sxx,sxy,syy = D
+    with np.errstate(divide='ignore',invalid='ignore'):
+        vxx = sxx-sx*sx/n
+        vxy = sxy-sx*sy/n
+        vyy = syy-sy*sy/n
+        cost = vyy-np.where(vxx > 0,vxy*vxy/vxx,0.0)
+    cost = np.maximum(cost,0.0)
+    cost[~(n >= minlen)] = np.inf
+    return(cost)
 
-    def func(x,*args):
-        return(mfccSoundDecayPiecewise(vec,breakpoints=x,plot=False)[4])
+def minimizeBKPT(vec,method='exact',nstep=100,extrema=[(0,20),(15,40),(30,60)],minlen=10):
+    '''
+    •	optimal breakpoints of the 4-segment linear fit of the decay of the 0-th MFCC (see mfccSoundDecayPiecewise)
+    •	method (str) – 'exact': global optimum over all the breakpoints by dynamic programming over the segments
+                     'uniform': minimum over the grid of breakpoints defined by extrema (list of tuples)
+                     'MC': minimum over nstep random breakpoints
+    •	minlen (int) – minimum number of points per segment: short segments in the noisy tail of the curve are poor
+                     starting points for the continuous fit of SegmentedLinearReg
+    •	returns the mean squared residual and the sorted breakpoints (None if the curve is too short)
+    '''
+    x,y = decayCurve(vec)
+    N = x.shape[0]
+    C = segmentCosts(x,y,minlen)
+
+    if method == None or method == 'exact':
+        # best 2 and 3 segment fits of every prefix, then the last segment
+        D2 = C[0,:,None]+C
+        arg2 = np.argmin(D2,axis=0)
+        D2 = np.min(D2,axis=0)
+        D3 = D2[:,None]+C
+        arg3 = np.argmin(D3,axis=0)
+        D3 = np.min(D3,axis=0)
+        D4 = D3+C[:,N]
+        k = int(np.argmin(D4))
+        if not np.isfinite(D4[k]): return(np.inf,None)
+        j = int(arg3[k])
+        i = int(arg2[j])
+        return(D4[k]/N,np.array([i,j,k]))
 
     if method == 'MC':
-        # MonteCarlo optimization of breakpoints for piecewise fitting
-        # needs nstep
-        xopt = [1,1,1]
-        res = res0 = 10
-        for n in range(nstep):
-            x = np.sort([np.random.randint(1,20),np.random.randint(1,40),np.random.randint(1,80)])
-            try:
-                res = func(x,vec)
-            except:
-                pass
-            if res < res0:
-                xopt = np.sort(x)
-                res0 = res
+        # random breakpoints for piecewise fitting, needs nstep
+        x = np.sort(np.array([np.random.randint(1,20,nstep),np.random.randint(1,40,nstep),np.random.randint(1,80,nstep)]).T,axis=1)
     elif method == 'uniform':
-        # find minimum of residual on a uniform grid
-        # needs extrema as list of tuples
-        x = []
-        for i in range(extrema[0][0],extrema[0][1]):
-            for j in range(extrema[1][0],extrema[1][1]):
-                for k in range(extrema[2][0],extrema[2][1]):
-                    x.append([i,j,k])
-        x = np.asarray(x)
-        res = []
-        xres = []
-        for n in range(x.shape[0]):
-            try:
-                res.append(func(np.sort(x[n]),vec))
-                xres.append(x[n])
-            except:
-                pass
-        res = np.asarray(res)
-        xres = np.asarray(xres)
-        r = res[~np.isnan(res)]
-        xopt = np.sort(xres[np.argwhere(res==np.min(r))][0,0])
-        res0 = res[np.argwhere(res==np.min(r))][0,0]
-
-    return(res0,xopt)
-            
+        # uniform grid of breakpoints, needs extrema as list of tuples
+        x = np.stack(np.meshgrid(*[np.arange(e[0],e[1]) for e in extrema],indexing='ij'),axis=-1).reshape(-1,3)
+        x = np.sort(x,axis=1)
+    else:
+        print('method not defined')
+        sys.exit()
+    # total cost of all the candidates in one sweep
+    b = np.concatenate([np.zeros((x.shape[0],1),dtype=int),np.minimum(x,N),np.full((x.shape[0],1),N)],axis=1)
+    res = np.sum(C[b[:,:-1],b[:,1:]],axis=1)
+    res[np.any(x > N,axis=1)] = np.inf
+    n = int(np.argmin(res))
+    if not np.isfinite(res[n]): return(np.inf,None)
+    return(res[n]/N,x[n])
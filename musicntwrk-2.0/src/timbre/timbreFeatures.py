@@ -0,0 +1,222 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import sys,glob,os
+import multiprocessing as mp
+import numpy as np
+import librosa
+
+from .featureCache import FeatureCache, fileHash
+from .normSoundDecay import normSoundDecay
+from .mfccSoundDecayPiecewise import mfccSoundDecayPiecewise
+from .minimizeBKPT import minimizeBKPT
+
+# parameters that define each descriptor (and its cache key)
+DESCRIPTORS = {'length':['sr'],
+               'MFCC':['sr','nmel','ncc','hop'],
+               'PSCC':['sr','ncc','hop'],
+               'standardMFCC':['sr','nmel','ncc','lmax','hop'],
+               'standardPSCC':['sr','ncc','lmax','hop'],
+               'standardMFPS':['sr','nmel','lmax','hop'],
+               'ASCBW':['sr'],
+               'modifiedASCBW':['sr','method','nstep']}
+
+def standardize(y,lmax):
+    # pad or truncate the waveform to lmax samples
+    if y.shape[0] <= lmax:
+        return(np.pad(y, (0, lmax-y.shape[0]), 'constant'))
+    return(y[:lmax])
+
+def waveFeatures(job):
+    '''
+    •	decode a sound file once and compute all the requested descriptors
+    •	job – tuple (file name, list of descriptors, dictionary of parameters)
+    •	returns a dictionary descriptor: feature array (None if the descriptor cannot be evaluated)
+    '''
+    wav,descriptors,par = job
+    eps=1.0e-10
+    y, sr = librosa.load(wav,sr=par['sr'])
+    hop = par['hop'] if par['hop'] != None else 512
+    feat = {}
+    for d in descriptors:
+        if d == 'length':
+            feat[d] = np.array([y.shape[0]])
+        elif d == 'MFCC':
+            S = librosa.feature.melspectrogram(y=y, sr=sr, n_mels=par['nmel'], hop_length=hop)
+            log_S = librosa.power_to_db(S, ref=np.max)
+            feat[d] = librosa.feature.mfcc(S=log_S, n_mfcc=par['ncc'])
+        elif d == 'PSCC':
+            S = np.abs(librosa.stft(y, hop_length=hop))**2
+            log_S = librosa.power_to_db(S, ref=np.max)
+            feat[d] = librosa.feature.mfcc(S=log_S, n_mfcc=par['ncc'])
+        elif d == 'standardMFCC' or d == 'standardPSCC' or d == 'standardMFPS':
+            wtmp = standardize(y,par['lmax'])
+            if d == 'standardPSCC':
+                # power (energy-squared) spectrogram
+                S = np.abs(librosa.stft(wtmp,hop_length=hop))**2
+            else:
+                S = librosa.feature.melspectrogram(y=wtmp, sr=sr, n_mels=par['nmel'],hop_length=hop)
+            log_S = librosa.power_to_db(S, ref=np.max)
+            if d == 'standardMFPS':
+                feat[d] = log_S
+                continue
+            temp = librosa.feature.mfcc(S=log_S, n_mfcc=par['ncc'])
+            # normalize the 0-th coefficient first
+            try:
+                temp[0] = (temp[0]-np.min(temp[0]))/(np.max(temp[0])-np.min(temp[0]))
+            except:
+                print(wav,np.max(temp[0]),np.min(temp[0]))
+            feat[d] = temp
+        elif d == 'ASCBW':
+            # normalized sound decay (alpha), spectral centroid and spectral bandwidth as in Aramaki et al. 2009
+            ya = y
+            maxsp = int(np.argwhere(np.abs(ya) < eps)[0])
+            try:
+                alpha0,_,_ = normSoundDecay(ya,sr,plot=False)
+            except:
+                onset_frames = librosa.onset.onset_detect(y=ya, sr=sr)
+                ya = ya[(onset_frames[0]+1):]
+                maxsp = int(np.argwhere(np.abs(ya) < eps)[0])
+                alpha0,_,_ = normSoundDecay(ya,sr)
+            cent = librosa.feature.spectral_centroid(y=ya, sr=sr,hop_length=maxsp)
+            spec_bw = librosa.feature.spectral_bandwidth(y=ya, sr=sr,hop_length=maxsp)
+            feat[d] = np.array([alpha0/cent[0,0],cent[0,0],spec_bw[0,0]])
+        elif d == 'modifiedASCBW':
+            # sound decay from the piecewise fit of the 0-th MFCC, spectral centroid and spectral bandwidth
+            maxsp = int(np.argwhere(np.abs(y) < eps)[0])
+            cent = librosa.feature.spectral_centroid(y=y, sr=sr,hop_length=maxsp)
+            spec_bw = librosa.feature.spectral_bandwidth(y=y, sr=sr,hop_length=maxsp)
+            S = librosa.feature.melspectrogram(y=y, sr=sr, n_mels=16)
+            log_S = librosa.power_to_db(S, ref=np.max)
+            mfcc = librosa.feature.mfcc(S=log_S, n_mfcc=13)
+            # the uniform grid of breakpoints is the fallback when the fit from the requested ones does not converge
+            a = None
+            for method in [par['method'],'uniform']:
+                try:
+                    a,_,_,_,_ = mfccSoundDecayPiecewise(mfcc[0],breakpoints=minimizeBKPT(mfcc[0],method=method,nstep=par['nstep'])[1])
+                    break
+                except:
+                    pass
+            if a is None:
+                feat[d] = None
+                continue
+            if np.abs(a[1]) > np.abs(a[2]): a[1] = a[2]
+            if a[1] > 0: a[1] = 0
+            feat[d] = np.array([a[0],a[1],cent[0,0],spec_bw[0,0]])
+        else:
+            print('descriptor not defined: ',d)
+            feat[d] = None
+    return(feat)
+
+def waveLengths(input_path,input_file,sr=22050):
+    '''
+    •	number of samples of every sound file after resampling to sr, read from the file header (soundfile) without
+        decoding the audio – files whose header cannot be read are decoded one at a time
+    •	returns the sorted file names and the array of lengths
+    '''
+    waves = np.sort(list(glob.glob(os.path.join(input_path,input_file))))
+    lengths = np.zeros(waves.shape[0],dtype=np.int64)
+    try:
+        import soundfile as sf
+    except:
+        sf = None
+    for n in range(waves.shape[0]):
+        try:
+            info = sf.info(waves[n])
+            # same rounding as librosa.resample
+            lengths[n] = info.frames if info.samplerate == sr else int(np.ceil(info.frames*(float(sr)/info.samplerate)))
+        except:
+            y, _ = librosa.load(waves[n],sr=sr)
+            lengths[n] = y.shape[0]
+    return(waves,lengths)
+
+def timbreFeatures(input_path,input_file,descriptors,nmel=None,ncc=None,sr=22050,hop=None,lmax=None,method=None,nstep=None,
+                   nproc=None,cache=None,out=None):
+    '''
+    •	shared timbre feature pipeline: every sound file is decoded once and all the requested descriptors are computed
+        in one pass, over a pool of processes
+    •	descriptors (str or list) – any of 'MFCC', 'PSCC', 'standardMFCC', 'standardPSCC', 'standardMFPS', 'ASCBW', 
+        'modifiedASCBW' and 'length' (number of samples)
+    •	nmel, ncc, sr, hop – parameters of the spectrograms and cepstra (hop = None is librosa's default of 512)
+    •	lmax – number of samples of the standardized descriptors; method, nstep – breakpoint search of modifiedASCBW
+    •	nproc (int) – number of processes, default is the number of cores
+    •	cache (str or FeatureCache) – SQLite file (or cache) of the features keyed by file content and parameters:
+        only the files that are new or have changed are decoded
+    •	out (True or str) – stream the features of a single descriptor of fixed shape (e.g. the standardized ones) into
+        a preallocated (n_files, ...) array as every file is processed; if str, the array is a memory-mapped .npy file
+    •	returns the sorted file names and a dictionary descriptor: list of feature arrays, one per file (or the
+        preallocated array if out is set)
+    '''
+    waves = np.sort(list(glob.glob(os.path.join(input_path,input_file))))
+    if isinstance(descriptors,str): descriptors = [descriptors]
+    par = {'sr':sr,'nmel':nmel,'ncc':ncc,'hop':hop,'lmax':lmax,'method':method,'nstep':nstep}
+    opened = isinstance(cache,str)
+    if opened: cache = FeatureCache(cache)
+    if out is not None and len(descriptors) != 1:
+        print('out requires a single descriptor')
+        sys.exit()
+
+    feat = {d:[None]*waves.shape[0] for d in descriptors}
+    def store(n,d,value):
+        if out is None or value is None:
+            feat[d][n] = value
+            return
+        if not isinstance(feat[d],np.ndarray):
+            # allocate the output at the first feature, all the others have the same shape
+            shape = (waves.shape[0],)+value.shape
+            if isinstance(out,str):
+                feat[d] = np.lib.format.open_memmap(out,mode='w+',dtype=value.dtype,shape=shape)
+            else:
+                feat[d] = np.zeros(shape,dtype=value.dtype)
+        feat[d][n] = value
+
+    # look up the cache and collect the descriptors that are still missing for every file
+    keys = {}
+    todo = {}
+    for n in range(waves.shape[0]):
+        sha = fileHash(waves[n]) if cache is not None else None
+        for d in descriptors:
+            if d not in DESCRIPTORS:
+                print('descriptor not defined: ',d)
+                sys.exit()
+            value = None
+            if cache is not None:
+                keys[n,d] = cache.key(sha,d,{p:par[p] for p in DESCRIPTORS[d]})
+                value = cache.get(keys[n,d])
+            if value is None:
+                todo.setdefault(n,[]).append(d)
+            else:
+                store(n,d,value)
+
+    # decode and featurize the missing files
+    jobs = [(waves[n],todo[n],par) for n in todo]
+    if nproc == 1 or len(jobs) <= 1:
+        res = map(waveFeatures,jobs)
+    else:
+        pool = mp.Pool(nproc)
+        res = pool.imap(waveFeatures,jobs,chunksize=max(1,len(jobs)//(4*(nproc or os.cpu_count()))))
+    for n,value in zip(todo,res):
+        for d in value:
+            store(n,d,value[d])
+            if value[d] is not None and cache is not None: cache.put(keys[n,d],value[d])
+    if nproc != 1 and len(jobs) > 1:
+        pool.close()
+        pool.join()
+    if cache is not None: cache.flush()
+    if opened: cache.close()
+    if isinstance(feat[descriptors[0]],np.memmap): feat[descriptors[0]].flush()
+
+    return(waves,feat)
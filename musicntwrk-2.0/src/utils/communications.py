@@ -13,6 +13,7 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
+import sys
 import numpy as np
 import time
 
@@ -84,10 +85,76 @@ try:
         # Gather the data according to load_sizes
         comm.Gatherv([arraux, mpidtype], [arr, lsizes[:,0], lsizes[:,1], mpidtype], root=sroot)
 
+    # Gathers first dimension of arrays of different length on each process (e.g. structured edge arrays)
+    def gatherv ( arraux, sroot=0 ):
+
+        # Number of rows on each process and size in bytes of a row
+        counts = np.array(comm.allgather(arraux.shape[0]), dtype=int)
+        rowbytes = arraux.dtype.itemsize*int(np.prod(arraux.shape[1:]))
+        displs = np.concatenate([[0],np.cumsum(counts)[:-1]])
+
+        # MPI counts and offsets are C ints: they are given in rows, not bytes
+        if counts.sum() > np.iinfo(np.int32).max:
+            print('gatherv: ',counts.sum(),' rows exceed the MPI count limit of ',np.iinfo(np.int32).max)
+            sys.exit()
+
+        arraux = np.ascontiguousarray(arraux)
+
+        # Gather rows as raw bytes so that structured dtypes need no MPI datatype
+        rowtype = MPI.BYTE.Create_contiguous(rowbytes).Commit()
+        arr = None
+        if rank == sroot:
+            arr = np.empty((counts.sum(),)+arraux.shape[1:], dtype=arraux.dtype)
+            comm.Gatherv([arraux, arraux.shape[0], rowtype], [arr, counts, displs, rowtype], root=sroot)
+        else:
+            comm.Gatherv([arraux, arraux.shape[0], rowtype], None, root=sroot)
+        rowtype.Free()
+
+        return arr
+
+    # Dynamic (master-worker) distribution of a list of jobs known on every process: the root hands out the index of
+    # the next job to the first process that is free and yields (index, result) as the results arrive
+    def dynamic_map ( func, jobs, sroot=0 ):
+
+        if size == 1:
+            for j in range(len(jobs)):
+                yield j, func(jobs[j])
+            return
+
+        if rank == sroot:
+            status = MPI.Status()
+            nextjob = 0
+            active = size-1
+            while active > 0:
+                msg = comm.recv(source=MPI.ANY_SOURCE, tag=11, status=status)
+                # send the next job before handing the result to the caller
+                if nextjob < len(jobs):
+                    comm.send(nextjob, dest=status.Get_source(), tag=12)
+                    nextjob += 1
+                else:
+                    comm.send(-1, dest=status.Get_source(), tag=12)
+                    active -= 1
+                if msg is not None:
+                    yield msg
+        else:
+            msg = None
+            while True:
+                comm.send(msg, dest=sroot, tag=11)
+                j = comm.recv(source=sroot, tag=12)
+                if j < 0: break
+                msg = (j, func(jobs[j]))
+
 except:
     
     def scatter_array (arr,sroot=0):
         return(arr)
 
     def gather_array ( arr, arraux, sroot=0 ):
-        return
\ No newline at end of file
+        return
+
+    def gatherv ( arraux, sroot=0 ):
+        return(arraux)
+
+    def dynamic_map ( func, jobs, sroot=0 ):
+        for j in range(len(jobs)):
+            yield j, func(jobs[j])
@@ -13,6 +13,9 @@
 # in the root directory of the present distribution,
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
+import hashlib,os,time,pickle
+import multiprocessing as mp
+import pandas as pd
 import numpy as np
 from scipy import stats
 from scipy.optimize import curve_fit
@@ -22,6 +25,7 @@ plt.style.use('ggplot')
 
 from .communications import *
 from .load_balancing import *
+from .fitRange import linearFitKS
 
 try:
     from mpi4py import MPI
@@ -62,22 +66,22 @@ References:
  - To choose which calculation is correct, if $\mu = 1 + 1/\eta$ gives a $\mu > 3$ then use $\mu = 1 + \eta$. The program automatically checks this and indicates the recommended $\mu$ with an arrow in the figure legend. If you already have an expectation for what range $\mu$ should be in, e.g. from theoretical arguments, use that. 
 '''
 
-def DEAfunction(dell,Tau):
+def eventCounts(Delh,Tau):
     """
-    DEA function
-    Called by DEAwithStripes; executes a standard DEA algorithm on the data passed.
+    Number of events in the window (Tau[i],Tau[i]+dell] that follows every event, for a block of window lengths.
+    Tau is sorted: the count is a binary search on the event times, O(n log n) time and O(n) memory per window.
+    Windows that end past the last event count zero.
     """
-    diff = np.zeros((len(Tau),len(Tau)))
-    fact = Tau+dell
-    fact[fact>np.max(Tau)] = 0
-    fact = (fact > 0).astype(int)
-    for n in range(1,len(Tau)):
-        diff[n-1,:] = np.roll(Tau,-n) - Tau
-        diff[n-1,:][diff[n-1,:] <= 0] = dell+1
-        diff[n-1,:] = (diff[n-1,:] <= dell).astype(int)
-        if np.sum(diff[n-1,:]) == 0:
-            break
-    XF = np.sum(diff,axis=0)*fact
+    Tau = np.asarray(Tau)
+    Delh = np.asarray(Delh,dtype=float)
+    # integer event times: Tau[j]-Tau[i] <= dell is exact with the integer part of dell
+    dl = np.floor(Delh) if np.issubdtype(Tau.dtype,np.integer) else Delh
+    XF = np.searchsorted(Tau,Tau[None,:]+dl[:,None].astype(Tau.dtype),side='right')-np.arange(1,len(Tau)+1)[None,:]
+    fact = (Tau[None,:]+Delh[:,None] <= np.max(Tau)).astype(int)
+    return((XF*fact).astype(float))
+
+def DEentropy(XF):
+    # Shannon entropy of the histogram of the event counts
     XF = XF[XF > 0]
     # This part does the actual DEA computations
     nbins = len(np.arange(-max(XF),max(XF)+1,1))
@@ -89,11 +93,34 @@ def DEAfunction(dell,Tau):
     DE = -np.sum(P*np.log(P))  # This is the integral for Shannon Entropy S
 
     return DE
+
+def DEAfunction(dell,Tau):
+    """
+    DEA function
+    Called by DEAwithStripes; executes a standard DEA algorithm on the data passed.
+    """
+    return DEentropy(eventCounts([dell],Tau)[0])
+
+def DEAkernel(Delh,Tau,chunk=1<<22):
+    """
+    DEA over all the window lengths in Delh, in blocks of windows of at most chunk event counts.
+    Windows where the entropy cannot be evaluated (no events) are NaN.
+    """
+    DE = np.full(len(Delh),np.nan)
+    m = max(1,chunk//max(1,len(Tau)))
+    for n in range(0,len(Delh),m):
+        XF = eventCounts(Delh[n:n+m],Tau)
+        for q in range(XF.shape[0]):
+            try:
+                DE[n+q] = DEentropy(XF[q])
+            except:
+                pass
+    return DE
         
-def DEAwithStripes(Data,NumberofStripes,base):
+def stripeEvents(Data,NumberofStripes,base):
     """
-    Applies stripes
-    Applies the stripes to the passed Data, then calls DEAfunction to perform DEA on that. 
+    Applies the stripes to the passed Data and finds the events.
+    Returns the event times Tau and the window lengths Delh of the DEA.
     """
 
     Data = np.array(Data)
@@ -122,6 +149,23 @@ def DEAwithStripes(Data,NumberofStripes,base):
 
     # Makes the window lengths and windows
     Delh = base**np.linspace(1,int(l),int(l))
+
+    return (Tau, Delh)
+
+def fillWindows(DE):
+    # windows without events take the entropy of the previous window (0 for the first window)
+    for q in range(len(DE)):
+        if np.isnan(DE[q]):
+            DE[q] = DE[q-1] if q > 0 else 0
+    return DE
+
+def DEAwithStripes(Data,NumberofStripes,base):
+    """
+    Applies stripes
+    Applies the stripes to the passed Data, then calls DEAfunction to perform DEA on that. 
+    """
+
+    Tau, Delh = stripeEvents(Data,NumberofStripes,base)
     
     DE = np.zeros(len(Delh))
 
@@ -134,11 +178,8 @@ def DEAwithStripes(Data,NumberofStripes,base):
     dex = scatter_array(DE)
     
     # Call the DEA function to execute on the data
-    for q in range(nsize):
-        try:
-            dex[q] = DEAfunction(delhx[q], Tau)
-        except:
-            dex[q] = dex[q-1]
+    dex[:nsize] = DEAkernel(delhx[:nsize], Tau)
+    fillWindows(dex[:nsize])
 
 
     gather_array(DE,dex)
@@ -172,10 +213,67 @@ def curve_fit_log(xdata, ydata,lfit='powerlaw') :
 def best_xmax(de,DE,xmax,lfit='powerlaw',st=0):
     x = np.exp(de[np.logical_and(de>=st, de<=xmax)])
     y = np.exp(DE[np.logical_and(de>=st, de<=xmax)])
-    _,_,_,_,_,kstest = curve_fit_log(x,y,lfit='powerlaw')
+    _,_,_,_,_,kstest = curve_fit_log(x,y,lfit=lfit)
     return(xmax,kstest[0])
 
-def DEA(Data,NumberofStripes=0,base=1.025,plots=False,save=True,lfit='powerlaw',st=0,stp=None):
+def searchXmax(job):
+    # optimal xmax of the fits starting at st (None if any of the fits fails)
+    de,DE,st,lfit = job
+    try:
+        xmx = []
+        kmn = []
+        for n in np.linspace(st+1,de[-1],100):
+            xm,km = best_xmax(de,DE,n,lfit,st=st)
+            xmx.append(xm)
+            kmn.append(km)
+        return(xmx[np.argmin(kmn)],np.min(kmn))
+    except:
+        return(None)
+
+def fitRange(de,DE,st=0,lfit='powerlaw',nproc=None):
+    """
+    Optimal xmin xmax for the fit of the DEA (Kolmogorov-Smirnov test) over a grid of 30 starts and 100 stops.
+    'powerlaw' fits are lines in log scale evaluated in O(1) from prefix sums (linearFitKS),
+    'truncatedpowerlaw' fits are distributed over a pool of nproc processes.
+    """
+    xstart = []
+    xstop = []
+    kst = []
+    starts = np.linspace(st,de[-1],30)
+    if lfit == 'powerlaw':
+        X = np.log10(np.exp(de))
+        Y = np.log10(np.exp(DE))
+        for s in starts:
+            stops = np.linspace(s+1,de[-1],100)
+            lo = np.full(stops.shape[0],np.searchsorted(de,s,side='left'))
+            hi = np.searchsorted(de,stops,side='right')
+            # a fit with less than 2 points fails and the start is discarded
+            if np.any(hi-lo < 2): continue
+            _,_,ks = linearFitKS(X,Y,lo,hi)
+            xstop.append(stops[np.argmin(ks)])
+            xstart.append(s)
+            kst.append(np.min(ks))
+    else:
+        jobs = [(de,DE,s,lfit) for s in starts]
+        if nproc == 1:
+            res = list(map(searchXmax,jobs))
+        else:
+            with mp.Pool(nproc) as pool:
+                res = pool.map(searchXmax,jobs)
+        for s,r in zip(starts,res):
+            if r == None: continue
+            xstop.append(r[0])
+            xstart.append(s)
+            kst.append(r[1])
+    return(xstart[np.argmin(kst)],xstop[np.argmin(kst)])
+
+# DEA curves and fit ranges of the series already analysed, keyed by series hash, stripes and base
+fitCache = {}
+
+def seriesHash(Data):
+    return(hashlib.sha1(np.ascontiguousarray(np.asarray(Data,dtype=float)).tobytes()).hexdigest())
+
+def DEA(Data,NumberofStripes=0,base=1.025,plots=False,save=True,lfit='powerlaw',st=0,stp=None,nproc=None,cache=True):
 
     """Computes the scaling.
     Calls the DEAwithStripes to perform DEA, and outputs plots. 
@@ -185,13 +283,20 @@ def DEA(Data,NumberofStripes=0,base=1.025,plots=False,save=True,lfit='powerlaw',
         Data -- 1D array. Your data. 
         NumberofStripes -- int. How many stripes to use.
         base -- float: 1 < base < 2. Determines number of points in final DEA plot. Smaller gives more points.
+        nproc -- int. Number of processes for the search of the fit range of 'truncatedpowerlaw'.
+        cache -- logical. Reuse the DEA curve and fit range of a series already analysed with the same stripes and base.
     returns:
         DE, de = Diffusion Entropy, window size
         eta (scaling parameter
         if plots == True - the plot showing the DEA and fit line.
     """
                 
-    de, DE = DEAwithStripes(Data,NumberofStripes,base)
+    key = (seriesHash(Data),NumberofStripes,base)
+    if cache and key in fitCache:
+        de, DE = fitCache[key]
+    else:
+        de, DE = DEAwithStripes(Data,NumberofStripes,base)
+        if cache: fitCache[key] = (de, DE)
 
     # The numbers st and stp set the interval of the DEA over which to perform the fitting to get the scaling
 
@@ -205,24 +310,11 @@ def DEA(Data,NumberofStripes=0,base=1.025,plots=False,save=True,lfit='powerlaw',
         # Find optimal xmin xmax for powerlaw fit (Kolmogorov-Smirnov test)
 
         if stp == None:
-            xstop = []
-            xstart = []
-            kst = []
-            for s in np.linspace(st,de[-1],30):
-                try:
-                    xmx = []
-                    kmn = []
-                    for n in np.linspace(s+1,de[-1],100):
-                        xm,km = best_xmax(de,DE,n,lfit,st=s)
-                        xmx.append(xm)
-                        kmn.append(km)
-                    xstop.append(xmx[np.argmin(kmn)])
-                    xstart.append(s)
-                    kst.append(np.min(kmn))
-                except:
-                    pass
-            xmin = xstart[np.argmin(kst)]
-            xmax = xstop[np.argmin(kst)]
+            if cache and key+(lfit,st) in fitCache:
+                xmin, xmax = fitCache[key+(lfit,st)]
+            else:
+                xmin, xmax = fitRange(de,DE,st,lfit,nproc)
+                if cache: fitCache[key+(lfit,st)] = (xmin, xmax)
         else:
             xmin = st
             xmax = stp
@@ -277,4 +369,153 @@ def plotDEA(de,DE,xfit,fit,popt,xmin,xmax,kstest,NumberofStripes,save=False,fign
         if save:
             plt.savefig(figname)
         else:
-            plt.show()
\ No newline at end of file
+            plt.show()
+
+def batchUnit(job):
+    # work unit of DEAbatch: a block of windows of a series ('dea') or the fit of a complete DEA curve ('fit')
+    if job[0] == 'dea':
+        _,i,n0,Delh,Tau = job
+        return ('dea',i,n0,DEAkernel(Delh,Tau))
+    _,i,de,DE,lfit,st,stp = job
+    try:
+        if stp == None:
+            xmin, xmax = fitRange(de,DE,st,lfit,1)
+        else:
+            xmin, xmax = st, stp
+        x = np.exp(de[np.logical_and(de>=xmin, de<=xmax)])
+        y = np.exp(DE[np.logical_and(de>=xmin, de<=xmax)])
+        _,_,popt,_,_,kstest = curve_fit_log(x,y,lfit=lfit)
+        return ('fit',i,(popt,xmin,xmax,kstest[0]))
+    except:
+        return ('fit',i,None)
+
+def DEAbatch(series,NumberofStripes=0,base=1.025,lfit='powerlaw',st=0,stp=None,nproc=None,unit=1<<20,
+             cache=True,checkpoint=None,every=60):
+
+    """DEA of many series with dynamic scheduling of the work.
+    The windows of all the series are split in (series, block of windows) work units of about unit event counts,
+    handed out longest first to the first free process of a multiprocessing pool or, when run with mpi4py on more
+    than one rank, to the first free rank (rank 0 only distributes the work). The fits of the DEA curves are then
+    scheduled in the same way. Results match DEA on each series (on one process).
+    args:
+        series -- list of 1D arrays, or dictionary name: 1D array.
+        NumberofStripes, base, lfit, st, stp -- as in DEA.
+        nproc -- int. Number of processes of the pool, default is the number of cores.
+        unit -- int. Size of a work unit in event counts.
+        cache -- logical. Reuse and store the DEA curves and fit ranges in the cache of DEA.
+        checkpoint -- str. File where the completed work units are saved every "every" seconds and at the end:
+                      an interrupted sweep restarted with the same file resumes from the units already done.
+    returns:
+        pandas DataFrame with columns series, eta, mu, xmin, xmax, KS (NaN if the DEA of the series fails),
+        None on the ranks other than 0.
+        The DEA curves and fit ranges are stored in the cache of DEA.
+    """
+
+    names = list(series.keys()) if isinstance(series,dict) else list(range(len(series)))
+    data = list(series.values()) if isinstance(series,dict) else list(series)
+    keys = [(seriesHash(d),NumberofStripes,base) for d in data]
+    fkey = (lfit,st) if stp == None else (lfit,st,stp)
+
+    # completed work of a previous run
+    state = {'DE':{},'fit':{}}
+    if rank == 0 and checkpoint != None and os.path.isfile(checkpoint):
+        with open(checkpoint,'rb') as f:
+            state = pickle.load(f)
+    if para: state = comm.bcast(state)
+
+    def save():
+        if rank != 0 or checkpoint == None: return
+        with open(checkpoint+'.tmp','wb') as f:
+            pickle.dump(state,f)
+        os.replace(checkpoint+'.tmp',checkpoint)
+
+    def run(jobs):
+        # results of the jobs in order of completion (on rank 0)
+        if para and size > 1:
+            for _,res in dynamic_map(batchUnit,jobs):
+                yield res
+        elif nproc == 1 or len(jobs) <= 1:
+            for res in map(batchUnit,jobs):
+                yield res
+        else:
+            with mp.Pool(nproc) as pool:
+                for res in pool.imap_unordered(batchUnit,jobs):
+                    yield res
+
+    # (series, block of windows) units still to do
+    events = {}
+    jobs = []
+    for i in range(len(data)):
+        if cache and keys[i] in fitCache and keys[i] not in state['DE']:
+            DE = fitCache[keys[i]][1]
+            state['DE'][keys[i]] = (DE.copy(),np.ones(len(DE),dtype=bool))
+        try:
+            Tau, Delh = stripeEvents(data[i],NumberofStripes,base)
+        except:
+            continue
+        events[i] = Delh
+        if keys[i] not in state['DE']:
+            state['DE'][keys[i]] = (np.full(len(Delh),np.nan),np.zeros(len(Delh),dtype=bool))
+        done = state['DE'][keys[i]][1]
+        m = max(1,unit//max(1,len(Tau)))
+        for n0 in range(0,len(Delh),m):
+            if not done[n0:n0+m].all():
+                jobs.append(('dea',i,n0,Delh[n0:n0+m],Tau))
+    jobs.sort(key=lambda job: -len(job[3])*len(job[4]))
+    if para: jobs = comm.bcast(jobs)
+
+    last = time.time()
+    for _,i,n0,DE in run(jobs):
+        state['DE'][keys[i]][0][n0:n0+len(DE)] = DE
+        state['DE'][keys[i]][1][n0:n0+len(DE)] = True
+        if time.time()-last > every:
+            save()
+            last = time.time()
+    save()
+
+    # complete DEA curves, on every process as in DEA
+    curves = {}
+    if rank == 0:
+        for i in events:
+            curves[i] = (np.log(events[i]),fillWindows(state['DE'][keys[i]][0].copy()))
+    if para: curves = comm.bcast(curves)
+    if cache:
+        for i in curves: fitCache[keys[i]] = curves[i]
+
+    # fits of the curves
+    jobs = []
+    if rank == 0:
+        for i in curves:
+            if keys[i]+fkey in state['fit']: continue
+            if stp == None and keys[i]+(lfit,st) in fitCache:
+                # fit range already known
+                jobs.append(('fit',i)+curves[i]+(lfit,)+fitCache[keys[i]+(lfit,st)])
+            else:
+                jobs.append(('fit',i)+curves[i]+(lfit,st,stp))
+    if para: jobs = comm.bcast(jobs)
+
+    last = time.time()
+    for _,i,res in run(jobs):
+        state['fit'][keys[i]+fkey] = res
+        if cache and stp == None and res != None: fitCache[keys[i]+(lfit,st)] = res[1:3]
+        if time.time()-last > every:
+            save()
+            last = time.time()
+    save()
+
+    if rank != 0:
+        return None
+
+    table = []
+    for i in range(len(data)):
+        res = state['fit'].get(keys[i]+fkey)
+        if i not in curves or res == None:
+            table.append([names[i]]+[np.nan]*5)
+            continue
+        popt,xmin,xmax,ks = res
+        eta = popt[1]
+        # recommended mu, as in plotDEA
+        mu = 1 + 1/eta if 1 + 1/eta <= 3 else 1 + eta
+        table.append([names[i],eta,mu,xmin,xmax,ks])
+
+    return(pd.DataFrame(table,columns=['series','eta','mu','xmin','xmax','KS']))
@@ -23,6 +23,7 @@ import matplotlib.pyplot as plt
 
 from .communications import *
 from .load_balancing import *
+from .fitRange import linearFitKS
 
 from ..harmony.changePoint import changePoint
 
@@ -71,9 +72,17 @@ def make_trajectory(events):
     trajectory = np.cumsum(events)
     return trajectory
 
-def entropy(trajectory):
+def windowLengths(n,base=None):
+    # all the window lengths up to a quarter of the trajectory, or log-spaced ones (powers of base): O(n log n)
+    # instead of O(n^2) for long series
+    if base == None:
+        return np.arange(1, int(0.25*n), 1)
+    L = np.unique(np.floor(base**np.arange(0,np.log(max(2,0.25*n))/np.log(base)+1)).astype(int))
+    return L[np.logical_and(L >= 1, L < int(0.25*n))]
+
+def entropy(trajectory,base=None):
     S = []
-    window_lengths = np.arange(1, int(0.25*len(trajectory)), 1)
+    window_lengths = windowLengths(len(trajectory),base)
     for L in window_lengths:
         window_starts = np.arange(0, len(trajectory)-L, 1)
         window_ends = np.arange(L, len(trajectory), 1)
@@ -125,11 +134,12 @@ def get_scaling(S, L, start, stop):
     kstest = stats.ks_2samp(S_slice,fit[0] * np.log(L_slice) + fit[1])
     return (L_slice, fit, kstest[0])
     
-def DEA(data, stripes, start=0, stop=None, maxstop=0,evtype=0):
+def DEA(data, stripes, start=0, stop=None, maxstop=0,evtype=0,base=None):
+    # base: log-spaced window lengths (powers of base) instead of all lengths up to a quarter of the series
     rounded_data = apply_stripes(data, stripes)
     event_array = find_events(rounded_data,evtype)
     diffusion_trajectory = make_trajectory(event_array)
-    S, L = entropy(diffusion_trajectory)
+    S, L = entropy(diffusion_trajectory,base)
     
     # Find optimal xmin xmax for powerlaw fit (Kolmogorov-Smirnov test)
     if stop == None:
@@ -142,19 +152,18 @@ def DEA(data, stripes, start=0, stop=None, maxstop=0,evtype=0):
             nstep = 30
         if maxstop == 0:
             maxstop = L[-1]
+        # linear fits of S vs log(L) from prefix sums
+        logL = np.log(L)
         for x0 in np.linspace(start,maxstop,nstep,dtype=int):
-            try:
-                xmx = []
-                kmn = []
-                for x1 in np.arange(x0+3,maxstop,nstep,dtype=int):
-                    _,_,km = get_scaling(S, L, x0, x1)
-                    xmx.append(x1)
-                    kmn.append(km)
-                xstop.append(xmx[np.argmin(kmn)])
-                xstart.append(x0)
-                kst.append(np.min(kmn))
-            except:
-                pass
+            xmx = np.arange(x0+3,maxstop,nstep,dtype=int)
+            lo = np.full(xmx.shape[0],np.searchsorted(L,x0,side='left'))
+            hi = np.searchsorted(L,xmx,side='right')
+            # a start without stops or with fits of less than 2 points is discarded
+            if xmx.shape[0] == 0 or np.any(hi-lo < 2): continue
+            _,_,kmn = linearFitKS(logL,S,lo,hi)
+            xstop.append(xmx[np.argmin(kmn)])
+            xstart.append(x0)
+            kst.append(np.min(kmn))
         xmin = xstart[np.argmin(kst)]
         xmax = xstop[np.argmin(kst)]
     else:
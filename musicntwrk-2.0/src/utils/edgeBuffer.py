@@ -0,0 +1,182 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import sys
+import numpy as np
+import pandas as pd
+
+class EdgeBuffer:
+
+    def __init__(self,size=1024,label=False):
+        '''
+        •	growable columnar buffer of network edges: int32 source and target, float32 weight and, if label is True,
+            an operator label stored as int32 index into a string table
+        •	size (int) – initial capacity, doubled every time the buffer is full
+        '''
+        self.n = 0
+        self.source = np.zeros(size,dtype=np.int32)
+        self.target = np.zeros(size,dtype=np.int32)
+        self.weight = np.zeros(size,dtype=np.float32)
+        self.label = np.zeros(size,dtype=np.int32) if label else None
+        self.names = {}
+
+    def __len__(self):
+        return(self.n)
+
+    def reserve(self,n):
+        # amortized doubling of the columns
+        if self.n+n <= self.source.shape[0]: return
+        size = max(2*self.source.shape[0],self.n+n)
+        for col in ['source','target','weight','label']:
+            old = getattr(self,col)
+            if old is None: continue
+            new = np.zeros(size,dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self,col,new)
+
+    def labelID(self,label):
+        if label not in self.names: self.names[label] = len(self.names)
+        return(self.names[label])
+
+    def add(self,source,target,weight,label=None):
+        '''
+        •	append a single edge
+        '''
+        self.reserve(1)
+        self.source[self.n] = source
+        self.target[self.n] = target
+        self.weight[self.n] = weight
+        if self.label is not None: self.label[self.n] = self.labelID(label)
+        self.n += 1
+
+    def extend(self,source,target,weight,label=None):
+        '''
+        •	append arrays of edges (label can be a single string or a list of strings)
+        '''
+        source = np.asarray(source).reshape(-1)
+        n = source.shape[0]
+        self.reserve(n)
+        self.source[self.n:self.n+n] = source
+        self.target[self.n:self.n+n] = np.asarray(target).reshape(-1)
+        self.weight[self.n:self.n+n] = np.asarray(weight).reshape(-1)
+        if self.label is not None:
+            if isinstance(label,str):
+                self.label[self.n:self.n+n] = self.labelID(label)
+            else:
+                self.label[self.n:self.n+n] = [self.labelID(l) for l in label]
+        self.n += n
+
+    def records(self):
+        '''
+        •	edges as a contiguous structured array (Source, Target, Weight) – used by gatherv for MPI transfers
+        '''
+        rec = np.empty(self.n,dtype=[('Source',np.int32),('Target',np.int32),('Weight',np.float32)])
+        rec['Source'] = self.source[:self.n]
+        rec['Target'] = self.target[:self.n]
+        rec['Weight'] = self.weight[:self.n]
+        return(rec)
+
+    def unique(self):
+        '''
+        •	remove repeated (source,target) pairs keeping the first occurrence, edges are sorted by source and target
+        '''
+        key = self.source[:self.n].astype(np.int64)*(int(self.target[:self.n].max())+1)+self.target[:self.n] \
+            if self.n > 0 else np.zeros(0,dtype=np.int64)
+        _,first = np.unique(key,return_index=True)
+        for col in ['source','target','weight','label']:
+            old = getattr(self,col)
+            if old is None: continue
+            old[:first.shape[0]] = old[first]
+        self.n = first.shape[0]
+
+    def labels(self):
+        # operator labels of the edges as strings
+        table = np.empty(len(self.names),dtype=object)
+        for name,i in self.names.items(): table[i] = name
+        return(table[self.label[:self.n]])
+
+    def toDataFrame(self):
+        '''
+        •	edges table as pandas DataFrame with columns Source, Target, Weight (and Label)
+        '''
+        dedges = pd.DataFrame({'Source':self.source[:self.n],'Target':self.target[:self.n],'Weight':self.weight[:self.n]})
+        if self.label is not None: dedges['Label'] = self.labels()
+        return(dedges)
+
+    def toNetworkx(self,directed=False,multi=False,nodes=None):
+        '''
+        •	networkx graph with Weight (and Label) edge attributes, as nx.from_pandas_edgelist
+        •	nodes (str) – optional node labels, stored as Label node attribute
+        '''
+        import networkx as nx
+        if multi:
+            G = nx.MultiDiGraph() if directed else nx.MultiGraph()
+        else:
+            G = nx.DiGraph() if directed else nx.Graph()
+        if nodes is not None:
+            G.add_nodes_from((n,{'Label':l}) for n,l in enumerate(np.asarray(nodes).reshape(-1)))
+        if self.label is not None:
+            attr = [{'Weight':w,'Label':l} for w,l in zip(self.weight[:self.n].tolist(),self.labels())]
+        else:
+            attr = [{'Weight':w} for w in self.weight[:self.n].tolist()]
+        G.add_edges_from(zip(self.source[:self.n].tolist(),self.target[:self.n].tolist(),attr))
+        return(G)
+
+    def toSparse(self,N=None,fmt='csr',directed=True,duplicates='last'):
+        '''
+        •	weighted adjacency matrix as scipy.sparse matrix
+        •	N (int) – number of nodes, default is the largest node index + 1
+        •	fmt (str) – 'csr' or 'coo'
+        •	directed (logical) – if False the matrix is symmetrized
+        •	duplicates (str) – 'last' keeps the last weight of repeated edges (as networkx), 'sum' adds them
+        '''
+        import scipy.sparse as sp
+        s = self.source[:self.n]
+        t = self.target[:self.n]
+        w = self.weight[:self.n]
+        if N is None:
+            N = int(max(s.max(),t.max()))+1 if self.n > 0 else 0
+        if not directed:
+            s,t,w = np.concatenate([s,t]),np.concatenate([t,s]),np.concatenate([w,w])
+        if duplicates == 'last':
+            # position of the last occurrence of every (source,target) pair
+            key = s.astype(np.int64)*N+t
+            _,last = np.unique(key[::-1],return_index=True)
+            last = key.shape[0]-1-last
+            s,t,w = s[last],t[last],w[last]
+        mat = sp.coo_matrix((w,(s,t)),shape=(N,N))
+        if fmt == 'coo':
+            return(mat)
+        return(mat.tocsr())
+
+    def toOutput(self,dnodes,output=None,directed=False):
+        '''
+        •	nodes and edges in the format requested by the output argument of the network builders
+        •	output (str) – None or 'pandas': nodes and edges tables as pandas DataFrames
+                          'csr' or 'coo': array of node labels and scipy.sparse weighted adjacency matrix
+                          'networkx': array of node labels and networkx graph
+        •	directed (logical) – if False the adjacency matrix is symmetric and the graph undirected
+        '''
+        if output == None or output == 'pandas':
+            return(dnodes,self.toDataFrame())
+        labels = np.asarray(dnodes).reshape(-1)
+        if output == 'csr' or output == 'coo':
+            return(labels,self.toSparse(N=labels.shape[0],fmt=output,directed=directed))
+        elif output == 'networkx':
+            return(labels,self.toNetworkx(directed=directed,nodes=labels))
+        else:
+            print('output format not defined')
+            sys.exit()
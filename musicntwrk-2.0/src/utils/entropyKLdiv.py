@@ -14,43 +14,119 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
+import sys
 import numpy as np
-import scipy as sci
+import scipy.sparse as sp
+import scipy.sparse.linalg as spl
 import networkx as nx
 
-def entropyKLdiv(Gx,eta):
-    
-    np.seterr(divide='ignore', invalid='ignore')
-    
-    # Calculate the entropy of the network and the KL divergency from the human expectation model
-    # from Lynn et al. Nature Physics, 16, 965–973 (2020)
+def stationary(P,method='power',tol=1.e-12,maxiter=100000):
+    # stationary distribution pi = pi P of the transition matrix (CSR)
+    if method == 'eigs' and P.shape[0] > 2:
+        _,vec = spl.eigs(P.T,k=1,which='LR')
+        pi = np.real(vec[:,0])
+        return(pi/np.sum(pi))
+    # lazy power iteration, pi <- (pi + pi P)/2, also converges on periodic chains
+    PT = P.T.tocsr()
+    pi = np.full(P.shape[0],1.0/P.shape[0])
+    for n in range(maxiter):
+        new = 0.5*(pi+PT.dot(pi))
+        new /= np.sum(new)
+        if np.sum(np.abs(new-pi)) < tol:
+            return(new)
+        pi = new
+    print('stationary distribution not converged')
+    return(pi)
+
+def entropyKLdiv(Gx,eta=0.8,method='power',solver='neumann',block=256,tol=1.e-10):
+    '''
+    •	entropy of the network and KL divergence from the human expectation model, from Lynn et al. Nature Physics,
+        16, 965–973 (2020)
+    •	Gx – networkx graph or scipy.sparse adjacency matrix (as returned by the network builders with output='csr'),
+        edges are weighted by the 'weight' attribute (1 if missing)
+    •	eta (float or list) – inaccuracy parameter(s) of the expectation model
+    •	method (str) – stationary distribution by 'power' iteration or sparse 'eigs'
+    •	solver (str) – expected transitions Phat = (1-eta) P (I-eta P)^-1, needed only on the edges of the network,
+        over blocks of block columns: by the Neumann series (1-eta) Σ eta^k P^(k+1), truncated at relative accuracy
+        tol once the chain has mixed and shared by all the values of eta ('neumann'), or by exact sparse LU solves
+        ('splu', better for networks with little fill-in)
+    •	returns entropy S and KL divergence (array if eta is a list)
+    '''
+    if solver != 'splu' and solver != 'neumann':
+        print('solver not defined')
+        sys.exit()
     
-    if nx.is_directed(Gx):
-        degree = np.asarray(Gx.out_degree(),dtype=float)[:,1]
+    # row-normalized transition matrix P as sparse CSR
+    if sp.issparse(Gx):
+        A = sp.csr_matrix(Gx,dtype=float)
     else:
-        degree = np.asarray(Gx.degree(),dtype=float)[:,1]
-    G = nx.to_numpy_array(Gx)
+        A = sp.csr_matrix(nx.to_scipy_sparse_array(Gx,format='csr'),dtype=float)
+    A.sum_duplicates()
+    norm = np.asarray(A.sum(axis=1)).reshape(-1)
+    P = sp.csr_matrix(sp.diags(np.divide(1.0,norm,out=np.zeros_like(norm),where=norm != 0)).dot(A))
+    P.eliminate_zeros()
+    N = P.shape[0]
+    row = np.repeat(np.arange(N),np.diff(P.indptr))
+    col = P.indices
     
-    # define probability distribution
-    P = np.zeros((G.shape[0],G.shape[1]))
-    for i in range(degree.shape[0]):
-        for j in range(degree.shape[0]):
-            P[i,j] = G[i,j]/degree[i]
-    eig, vec, _ = sci.linalg.eig(P,left=True)
-    n0 = np.argwhere(np.abs(eig-1) < 1.e-10)[0][0]
-    pi = np.real(vec[:,n0] / np.sum(vec[:,n0]))
-    logP = np.log2(P)
-    logP[np.isinf(logP)] = 0
+    pi = stationary(P,method,min(tol,1.e-12))
+    logP = np.log2(P.data)
     
     # Entropy
-    S = -pi.dot(np.sum(P*logP,axis=1))
+    S = -pi.dot(np.bincount(row,weights=P.data*logP,minlength=N))
     
-    # KL divergence
-    eta = 0.8
-    Phat = (1-eta)*P.dot(np.linalg.inv(np.identity(P.shape[0])-eta*P))
-    Phat[np.isnan(Phat)] = 0
-    logPhat = np.log2(Phat)
-    logPhat[np.isinf(logPhat)] = 0
-    KLD = -pi.dot(np.sum((P*(logPhat - logP)),axis=1))
+    # KL divergence: Phat is only needed on the non-zero entries of P
+    etas = np.atleast_1d(np.asarray(eta,dtype=float))
+    Phat = np.zeros((etas.shape[0],P.data.shape[0]))
+    PC = P.tocsc()
+    order = np.argsort(col,kind='stable')
+    cols = col[order]
+    lu = [spl.splu(sp.csc_matrix(sp.identity(N)-e*P)) for e in etas] if solver == 'splu' else None
+    for c0 in range(0,N,block):
+        c1 = min(N,c0+block)
+        # entries of P in the columns c0:c1
+        k = order[np.searchsorted(cols,c0):np.searchsorted(cols,c1)]
+        if k.shape[0] == 0: continue
+        X = PC[:,c0:c1].toarray()
+        if solver == 'splu':
+            for n in range(etas.shape[0]):
+                Y = lu[n].solve(X)
+                Phat[n,k] = (1-etas[n])*Y[row[k],col[k]-c0]
+        else:
+            # Neumann series with tail: the entries of P^(l+1)[:,j] for l > m stay within the range (max - min) of
+            # P^(m+1)[:,j] (P is row-stochastic), so approximating the tail Σ_l>m eta^l P^(l+1) by
+            # eta^(m+1)/(1-eta) P^(m+1) has error below eta^(m+1)/(1-eta) range: a column leaves the series when this
+            # is below tol relative to its entries of Phat (as soon as the chain has mixed)
+            e = np.max(etas)
+            jk = col[k]-c0
+            rk = row[k]
+            acc = np.zeros((etas.shape[0],k.shape[0]))
+            X = np.ascontiguousarray(X)
+            active = np.arange(c1-c0)
+            pos = np.arange(c1-c0)
+            m = 0
+            while active.shape[0] > 0:
+                kk = np.nonzero(pos[jk] >= 0)[0]
+                Xk = X[rk[kk],pos[jk[kk]]]
+                acc[:,kk] += np.outer(etas**m,Xk)
+                m += 1
+                span = np.max(X,axis=0)-np.min(X,axis=0)
+                err = np.zeros(active.shape[0])
+                np.maximum.at(err,pos[jk[kk]],e**m*span[pos[jk[kk]]]/((1-e)*acc[np.argmax(etas),kk]))
+                conv = np.logical_or(err < tol,e**m == 0)
+                if np.any(conv):
+                    # converged columns: sum of the series with its tail
+                    kc = conv[pos[jk[kk]]]
+                    Phat[:,k[kk[kc]]] = (1-etas)[:,None]*(acc[:,kk[kc]]+np.outer(etas**m/(1-etas),Xk[kc]))
+                    X = np.ascontiguousarray(X[:,~conv])
+                    pos[active[conv]] = -1
+                    active = active[~conv]
+                    pos[active] = np.arange(active.shape[0])
+                if active.shape[0] > 0:
+                    X = P.dot(X)
+    KLD = np.array([-pi.dot(np.bincount(row,weights=P.data*(np.log2(Phat[n])-logP),minlength=N)) 
+                    for n in range(etas.shape[0])])
     
-    return(S,KLD)
\ No newline at end of file
+    if np.ndim(eta) == 0:
+        KLD = KLD[0]
+    return(S,KLD)
@@ -0,0 +1,54 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import numpy as np
+
+def ksStatistic(a,b):
+    # two-sample Kolmogorov-Smirnov statistic, as scipy.stats.ks_2samp
+    a = np.sort(a)
+    b = np.sort(b)
+    data = np.concatenate([a,b])
+    cdf1 = np.searchsorted(a,data,side='right')/a.shape[0]
+    cdf2 = np.searchsorted(b,data,side='right')/b.shape[0]
+    return(np.max(np.abs(cdf1-cdf2)))
+
+def linearFitKS(X,Y,lo,hi):
+    '''
+    •	least-squares lines Y = a + b X over the index ranges [lo,hi) of X, and Kolmogorov-Smirnov statistic between
+        the data and the line in each range
+    •	the sums of every fit come from prefix sums of 1, X, Y, X^2, XY: O(1) per range plus O(m) for the KS test
+    •	the KS statistic depends only on the ordering of the samples: it is the same in log scale as for the power
+        laws 10^(a+bX) of curve_fit_log
+    •	returns intercepts, slopes and KS statistics (NaN for ranges with less than 2 points)
+    '''
+    X = np.asarray(X,dtype=float)
+    Y = np.asarray(Y,dtype=float)
+    lo = np.asarray(lo,dtype=int)
+    hi = np.asarray(hi,dtype=int)
+    x0 = np.mean(X) if X.shape[0] > 0 else 0.0
+    Xc = X-x0
+    S = [np.concatenate([[0.0],np.cumsum(v)]) for v in [np.ones_like(Xc),Xc,Y,Xc*Xc,Xc*Y]]
+    m,sx,sy,sxx,sxy = [c[hi]-c[lo] for c in S]
+    with np.errstate(divide='ignore',invalid='ignore'):
+        b = (m*sxy-sx*sy)/(m*sxx-sx*sx)
+        a = (sy-b*sx)/m-b*x0
+    ks = np.full(lo.shape[0],np.nan)
+    for k in range(lo.shape[0]):
+        if m[k] < 2:
+            a[k] = b[k] = np.nan
+            continue
+        ks[k] = ksStatistic(Y[lo[k]:hi[k]],a[k]+b[k]*X[lo[k]:hi[k]])
+    return(a,b,ks)
@@ -13,17 +13,31 @@
 # or http://www.gnu.org/copyleft/gpl.txt .
 #
 
+import numpy as np
 from .opsNameFull import opsNameFull
 from .minimalNoBijDistance import minimalNoBijDistance
+from .opsCache import opsCache
 
-def generalizedOpsName(a,b,TET,distance):
-# generalizes the operator name function for no-bijective chord progression
+def generalizedOpsName(a,b,TET=12,distance='euclidean'):
+    # given two pcs of any cardinality returns the voice leading and the name of the normal ordered distance operator
+    # results are memoized in opsCache up to a common transposition of a and b
+    key,t = opsCache.key('ops',a,b,TET,distance)
+    value = opsCache.get(key)
+    if value == None:
+        value = opsNameCompute(np.asarray(a)-t,np.asarray(b)-t,TET,distance)
+        opsCache.put(key,value)
     if len(a) == len(b):
-        return(a,opsNameFull(a,b,TET))
+        return(a,value[2])
+    else:
+        return(value[1]+t,value[2])
+
+def opsNameCompute(a,b,TET,distance):
+    if len(a) == len(b):
+        return(np.nan,np.zeros(0,dtype=int),opsNameFull(a,b,TET))
     else:
         if len(a) > len(b):
             pair,r = minimalNoBijDistance(a,b,TET,distance)
-            return(r,opsNameFull(a,r,TET))
+            return(pair,r,opsNameFull(a,r,TET))
         else:
             pair,r = minimalNoBijDistance(b,a,TET,distance)
-            return(r,opsNameFull(r,b,TET))
+            return(pair,r,opsNameFull(r,b,TET))
@@ -0,0 +1,84 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import itertools as iter
+import functools
+import numpy as np
+
+from ..musicntwrk import PCSetArray
+from .pcsMask import pcs2mask
+
+class MaskTable:
+
+    def __init__(self,TET=12,Nc=3):
+        '''
+        •	precomputed canonical forms of all the C(TET,Nc) pcs of cardinality Nc encoded as bitmasks
+        •	TET (int)- number of allowed pitches in the totality of the musical space (temperament) - TET ≤ 64
+        •	Nc (int)– cardinality
+        •	lookups are binary searches on the sorted array of masks
+        '''
+        p = PCSetArray(np.asarray(list(iter.combinations(range(TET),Nc))),TET=TET)
+        mask = pcs2mask(p.pcs)
+        order = np.argsort(mask)
+        self.TET = TET
+        self.Nc = Nc
+        self.mask = mask[order]
+        self.normal = p.normalOrder()[order]
+        self.prime = p.primeForm()[order]
+        self.primeMask = pcs2mask(self.prime)
+        self.interval = p.intervalVector()[order]
+        # Z relation: distinct prime forms that share the same interval vector
+        prime,first,iprime = np.unique(self.primeMask,return_index=True,return_inverse=True)
+        u,ivec,counts = np.unique(self.interval[first],return_inverse=True,return_counts=True,axis=0)
+        ivec = ivec.reshape(-1)
+        self.zclass = ivec[iprime.reshape(-1)]
+        self.zrel = (counts[ivec] != 1)[iprime.reshape(-1)]
+
+    def index(self,mask):
+        '''
+        •	position of the masks in the table
+        '''
+        mask = np.asarray(mask,dtype=np.uint64)
+        idx = np.searchsorted(self.mask,mask)
+        if np.any(idx >= self.mask.shape[0]) or np.any(self.mask[np.minimum(idx,self.mask.shape[0]-1)] != mask):
+            raise ValueError('mask not in the table of '+str(self.Nc)+'-pcs in '+str(self.TET)+'-TET')
+        return(idx)
+
+    def normalOrder(self,mask):
+        return(self.normal[self.index(mask)])
+
+    def primeForm(self,mask):
+        return(self.prime[self.index(mask)])
+
+    def primeFormMask(self,mask):
+        return(self.primeMask[self.index(mask)])
+
+    def intervalVector(self,mask):
+        return(self.interval[self.index(mask)])
+
+    def zClass(self,mask):
+        '''
+        •	id of the interval vector class of the masks and whether they are Z-related to another prime form
+        '''
+        idx = self.index(mask)
+        return(self.zclass[idx],self.zrel[idx])
+
+@functools.lru_cache(maxsize=None)
+def maskTable(TET=12,Nc=3):
+    '''
+    •	MaskTable for the given temperament and cardinality, built once per session
+    '''
+    return(MaskTable(TET,Nc))
@@ -0,0 +1,113 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import sys
+import itertools as iter
+import numpy as np
+import sklearn.metrics as sklm
+
+def shiftMatrix(n,TET):
+    # the 2n+1 octave shifts of a single voice used by minimalDistance
+    iTET = np.vstack([np.identity(n,dtype=int)*TET,-np.identity(n,dtype=int)*TET])
+    return(np.vstack([iTET,np.zeros(n,dtype=int)]))
+
+def minimalDistanceMatrix(a,b,TET,distance='euclidean',sort=True,chunk=512):
+    '''
+    •	calculates the minimal distance between all pairs of pcs of same cardinality (bijective) – matrix version of minimalDistance()
+    •	a,b (int) – pcs as 2D numpy arrays (one pcs per row) or lists
+    •	sort (logical) – if True the rows of a are sorted first, as in minimalDistance()
+    •	returns the distance matrix and, for every pair, the index of the minimal shift: the voice leading of the pair (i,j)
+        is np.sort(b[j]-shiftMatrix(n,TET)[imin[i,j]])
+    '''
+    if distance == None: distance = 'euclidean'
+    a = np.asarray(a)
+    b = np.asarray(b)
+    n = a.shape[1]
+    if n != b.shape[1]:
+        print('dimension of arrays must be equal')
+        sys.exit()
+    if sort: a = np.sort(a,axis=1)
+    iTET = shiftMatrix(n,TET)
+    r = [np.sort(b - iTET[k],axis=1) for k in range(2*n+1)]
+    dist = np.zeros((a.shape[0],b.shape[0]),dtype=float)
+    imin = np.zeros((a.shape[0],b.shape[0]),dtype=int)
+    for i in range(0,a.shape[0],chunk):
+        dmin = np.full((min(chunk,a.shape[0]-i),b.shape[0]),np.inf)
+        kmin = np.zeros(dmin.shape,dtype=int)
+        for k in range(2*n+1):
+            diff = sklm.pairwise_distances(a[i:i+chunk],r[k],metric=distance)
+            # strict comparison keeps the first minimum, as np.argmin in minimalDistance()
+            lower = diff < dmin
+            dmin[lower] = diff[lower]
+            kmin[lower] = k
+        dist[i:i+chunk] = dmin
+        imin[i:i+chunk] = kmin
+    return(dist,imin)
+
+def minimalNoBijDistanceMatrix(a,b,TET,distance='euclidean',sort=True,chunk=512):
+    '''
+    •	calculates the minimal distance between all pairs of pcs of different cardinality (non bijective) – matrix version of minimalNoBijDistance()
+    •	a,b (int) – pcs as 2D numpy arrays or lists, the cardinality of a is larger than or equal to that of b
+    •	every row of b is completed with all the combinations_with_replacement of its own pitches and the 
+        minimal voice leading over all completions is taken
+    •	returns the distance matrix, the index of the minimal completion (in iter.combinations_with_replacement(range(nb),ndif))
+        and the index of the minimal shift of that completion
+    '''
+    a = np.asarray(a)
+    b = np.asarray(b)
+    ndif = a.shape[1] - b.shape[1]
+    if ndif < 0:
+        print('cardinality of a must be larger than that of b')
+        sys.exit()
+    c = np.asarray(list(iter.combinations_with_replacement(range(b.shape[1]),ndif)),dtype=int).reshape(-1,ndif)
+    # all completions of all rows of b, in the order of minimalNoBijDistance()
+    r = np.concatenate([np.repeat(b[:,None,:],c.shape[0],axis=1),b[:,c]],axis=2).reshape(-1,a.shape[1])
+    dist = np.zeros((a.shape[0],b.shape[0]),dtype=float)
+    lmin = np.zeros((a.shape[0],b.shape[0]),dtype=int)
+    imin = np.zeros((a.shape[0],b.shape[0]),dtype=int)
+    ix = np.ix_(np.arange(min(chunk,a.shape[0])),np.arange(b.shape[0]))
+    for i in range(0,a.shape[0],chunk):
+        d,k = minimalDistanceMatrix(a[i:i+chunk],r,TET,distance,sort=sort,chunk=chunk)
+        d = d.reshape(d.shape[0],b.shape[0],c.shape[0])
+        k = k.reshape(d.shape)
+        l = np.argmin(d,axis=2)
+        dist[i:i+chunk] = d[ix[0][:d.shape[0]],ix[1],l]
+        lmin[i:i+chunk] = l
+        imin[i:i+chunk] = k[ix[0][:d.shape[0]],ix[1],l]
+    return(dist,lmin,imin)
+
+def minimalDistancePairs(pcs,TET,distance='euclidean',sort=True,chunk=512):
+    '''
+    •	full matrix of minimal voice-leading distances between all the pcs of a list, of any cardinality
+    •	pcs (int) – list of pcs (numpy arrays or lists)
+    •	pcs of same cardinality use minimalDistanceMatrix(), pcs of different cardinality use minimalNoBijDistanceMatrix() 
+        with the larger pcs as reference
+    '''
+    card = np.asarray([len(p) for p in pcs])
+    dist = np.zeros((len(pcs),len(pcs)),dtype=float)
+    group = {n:np.nonzero(card == n)[0] for n in np.unique(card)}
+    for na in group:
+        a = np.asarray([pcs[i] for i in group[na]]).reshape(-1,na)
+        for nb in group:
+            if nb > na: continue
+            b = np.asarray([pcs[j] for j in group[nb]]).reshape(-1,nb)
+            if na == nb:
+                d,_ = minimalDistanceMatrix(a,b,TET,distance,sort=sort,chunk=chunk)
+            else:
+                d,_,_ = minimalNoBijDistanceMatrix(a,b,TET,distance,sort=sort,chunk=chunk)
+                dist[np.ix_(group[nb],group[na])] = d.T
+            dist[np.ix_(group[na],group[nb])] = d
+    return(dist)
@@ -16,14 +16,22 @@
 import itertools as iter
 import numpy as np
 from .minimalDistance import minimalDistance
+from .opsCache import opsCache
 
 def minimalNoBijDistance(a,b,TET,distance):
     '''
     •	calculates the minimal distance between two pcs of different cardinality (non bijective) – uses minimalDistance()
     •	a,b (int) – pcs as lists or numpy arrays
+    •	results are memoized in opsCache up to a common transposition of a and b
     '''
     a = np.asarray(a)
     b = np.asarray(b)
+    key,t = opsCache.key('nobij',a,b,TET,distance)
+    value = opsCache.get(key)
+    if value != None:
+        return(np.float64(value[0]),value[1]+t)
+    a = a-t
+    b = b-t
     ndif = np.sort(np.array([a.shape[0],b.shape[0]]))[1] - np.sort(np.array([a.shape[0],b.shape[0]]))[0]
     c = np.asarray(list(iter.combinations_with_replacement(b,ndif)))
     r = np.zeros((c.shape[0],a.shape[0]))
@@ -34,5 +42,6 @@ def minimalNoBijDistance(a,b,TET,distance):
     for l in range(r.shape[0]):
         dist[l],_=minimalDistance(a,r[l],TET,distance)
     imin = np.argmin(dist)
+    opsCache.put(key,(min(dist),r[imin].astype(int),''))
         
-    return(min(dist),r[imin].astype(int))
+    return(min(dist),r[imin].astype(int)+t)
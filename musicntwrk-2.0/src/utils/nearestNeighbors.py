@@ -0,0 +1,115 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import numpy as np
+import sklearn.metrics as sklm
+
+from .sparsePairDistance import KDMETRIC, pairedDistance
+
+def kSmallest(node,dist,k):
+    '''
+    •	mask of the entries whose distance is among the k smallest of their node (ties broken by position)
+    '''
+    order = np.lexsort((dist,node))
+    n = node[order]
+    first = np.concatenate([[0],np.flatnonzero(n[1:] != n[:-1])+1]) if n.shape[0] > 0 else np.zeros(0,dtype=int)
+    rank = np.arange(n.shape[0])-np.repeat(first,np.diff(np.append(first,n.shape[0])))
+    mask = np.zeros(node.shape[0],dtype=bool)
+    mask[order[rank < k]] = True
+    return(mask)
+
+def candidateDistance(y,p,q,distance='euclidean',chunk=65536):
+    # distance between the rows p and q of y, in chunks of pairs
+    dist = np.zeros(p.shape[0],dtype=float)
+    for n in range(0,p.shape[0],chunk):
+        a = np.asarray(y[p[n:n+chunk]],dtype=float)
+        b = np.asarray(y[q[n:n+chunk]],dtype=float)
+        if distance in KDMETRIC:
+            dist[n:n+chunk] = pairedDistance(a,b,distance)
+        else:
+            dist[n:n+chunk] = sklm.paired_distances(a,b,metric=distance)
+    return(dist)
+
+def topkPairDistance(x,y,k,thup=np.inf,thdw=0,distance='euclidean',offset=0,chunk=None):
+    '''
+    •	exact k nearest rows of y (within [thdw,thup]) of every row of x, computed in blocks of rows
+    •	x (float) – block of rows of y whose global index starts at offset (the row itself is excluded)
+    •	chunk (int) – rows per block, default keeps the block of distances below 4M entries
+    •	returns COO arrays (source, target, distance)
+    '''
+    if distance == None: distance = 'euclidean'
+    if chunk == None: chunk = max(1,(1<<22)//max(1,y.shape[0]))
+    kk = min(k,y.shape[0]-1)
+    source = []
+    target = []
+    weight = []
+    if kk <= 0:
+        return(np.zeros(0,dtype=int),np.zeros(0,dtype=int),np.zeros(0,dtype=float))
+    for n in range(0,x.shape[0],chunk):
+        pair = sklm.pairwise_distances(np.asarray(x[n:n+chunk],dtype=float),np.asarray(y,dtype=float),metric=distance)
+        i = np.arange(pair.shape[0])
+        pair[i,i+n+offset] = np.inf
+        pair[(pair > thup) | (pair < thdw)] = np.inf
+        j = np.argpartition(pair,kk-1,axis=1)[:,:kk]
+        w = np.take_along_axis(pair,j,axis=1)
+        i = np.repeat(i+n+offset,kk).reshape(-1,kk)
+        keep = np.isfinite(w)
+        source.append(i[keep])
+        target.append(j[keep])
+        weight.append(w[keep])
+    return(np.concatenate(source),np.concatenate(target),np.concatenate(weight))
+
+def lshCandidates(y,width,ntables=16,nbits=8,window=32,start=0,seed=0):
+    '''
+    •	approximate near neighbour candidates of the rows of y by random projection hashing (p-stable LSH):
+        in every table the rows are hashed to the buckets floor((y.A+b)/width) of nbits random projections
+    •	rows in the same bucket are paired, large buckets only with the window rows that follow in a random order
+    •	returns the unique pairs (p,q) with p < q and q >= start (the rows added to an existing network)
+    '''
+    rng = np.random.default_rng(seed)
+    N = y.shape[0]
+    pairs = []
+    for t in range(ntables):
+        A = rng.standard_normal((y.shape[1],nbits))
+        b = rng.uniform(0,width,nbits)
+        key = np.floor((np.asarray(y,dtype=float) @ A+b)/width).astype(np.int64)
+        _,bucket = np.unique(key,axis=0,return_inverse=True)
+        bucket = bucket.reshape(-1)
+        order = np.lexsort((rng.random(N),bucket))
+        bs = bucket[order]
+        for delta in range(1,window+1):
+            same = bs[delta:] == bs[:-delta]
+            if not np.any(same): break
+            p = order[:-delta][same]
+            q = order[delta:][same]
+            p,q = np.minimum(p,q),np.maximum(p,q)
+            keep = q >= start
+            pairs.append(p[keep].astype(np.int64)*N+q[keep])
+    if len(pairs) == 0:
+        return(np.zeros(0,dtype=int),np.zeros(0,dtype=int))
+    pairs = np.unique(np.concatenate(pairs))
+    return(pairs//N,pairs%N)
+
+def lshWidth(y,k=None,thup=None,distance='euclidean',sample=256,seed=0):
+    # bucket width: four times the threshold, or the median distance to the k-th neighbour of a sample of rows
+    # (with 16 tables of 8 projections about 95% of the neighbours share at least one bucket)
+    if thup != None and np.isfinite(thup): return(4*thup)
+    rng = np.random.default_rng(seed)
+    rows = np.sort(rng.choice(y.shape[0],min(sample,y.shape[0]),replace=False))
+    pair = sklm.pairwise_distances(np.asarray(y[rows],dtype=float),np.asarray(y,dtype=float),metric=distance)
+    kk = min(k if k != None else 1,y.shape[0]-1)
+    width = 4*np.median(np.sort(pair,axis=1)[:,kk])
+    return(width if width > 0 else 1.0)
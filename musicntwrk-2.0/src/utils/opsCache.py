@@ -0,0 +1,112 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import atexit,sqlite3
+import numpy as np
+from collections import OrderedDict
+
+# metrics invariant under a common translation of the two pcs
+TMETRIC = ['euclidean','l2','cityblock','manhattan','l1','chebyshev','minkowski','sqeuclidean']
+
+class OpsCache:
+
+    def __init__(self,maxsize=65536,path=None,commit=256):
+        '''
+        •	least recently used cache of the voice-leading operators between pairs of pcs
+        •	maxsize (int) – number of pairs kept in memory
+        •	path (str) – if given, name of a SQLite file used as persistent store shared across runs
+        •	commit (int) – number of new entries written to the persistent store before each commit
+        '''
+        self.maxsize = maxsize
+        self.commit = commit
+        self.data = OrderedDict()
+        self.db = None
+        self.new = 0
+        if path != None: self.open(path)
+
+    def open(self,path):
+        '''
+        •	attach (or create) the persistent store in the SQLite file path
+        '''
+        self.close()
+        self.db = sqlite3.connect(path)
+        self.db.execute('CREATE TABLE IF NOT EXISTS ops (key TEXT PRIMARY KEY, dist REAL, lead TEXT, name TEXT)')
+        self.db.commit()
+
+    def flush(self):
+        if self.db != None:
+            self.db.commit()
+            self.new = 0
+
+    def close(self):
+        if self.db != None:
+            self.flush()
+            self.db.close()
+            self.db = None
+
+    def clear(self):
+        self.data.clear()
+
+    def key(self,func,a,b,TET,distance):
+        '''
+        •	canonical key of a pair of pcs: both pcs are transposed (without wrapping around the octave) so that the
+            lowest pitch of the pair is 0 – only for metrics that are invariant under a common translation and for pcs
+            within [0,TET), where the transposition does not change the normal orders
+        •	returns the key and the transposition
+        '''
+        a = np.asarray(a)
+        b = np.asarray(b)
+        t = 0
+        if distance in TMETRIC and a.size > 0 and b.size > 0 and min(a.min(),b.min()) >= 0 and max(a.max(),b.max()) < TET:
+            t = min(a.min(),b.min())
+        key = func+'|'+str(TET)+'|'+str(distance)+'|'+','.join(map(str,(a-t).tolist()))+'|'+','.join(map(str,(b-t).tolist()))
+        return(key,t)
+
+    def get(self,key):
+        '''
+        •	returns (distance, voice leading, operator name) or None if the pair has not been computed yet
+        '''
+        if key in self.data:
+            self.data.move_to_end(key)
+            return(self.data[key])
+        if self.db != None:
+            row = self.db.execute('SELECT dist,lead,name FROM ops WHERE key=?',(key,)).fetchone()
+            if row != None:
+                value = (row[0],np.asarray(list(map(int,row[1].split(','))) if row[1] != '' else [],dtype=int),row[2])
+                self.store(key,value)
+                return(value)
+        return(None)
+
+    def put(self,key,value):
+        '''
+        •	value is the tuple (distance, voice leading as int array, operator name)
+        '''
+        self.store(key,value)
+        if self.db != None:
+            self.db.execute('INSERT OR REPLACE INTO ops VALUES (?,?,?,?)',
+                            (key,float(value[0]),','.join(map(str,np.asarray(value[1]).tolist())),value[2]))
+            self.new += 1
+            if self.new >= self.commit: self.flush()
+
+    def store(self,key,value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+# cache shared by minimalNoBijDistance and generalizedOpsName
+opsCache = OpsCache()
+atexit.register(opsCache.close)
@@ -18,8 +18,8 @@ from ..musicntwrk import PCSet
 
 def opsNameFull(a,b,TET):
     # given two vectors returns the name of the normal ordered distance operator (R) that connects them
-    a = PCSet(a,UNI=False).normalOrder()
-    b = PCSet(b,UNI=False).normalOrder()   
+    a = PCSet(a,TET=TET,UNI=False).normalOrder()
+    b = PCSet(b,TET=TET,UNI=False).normalOrder()   
     d = np.zeros((b.shape[0]),dtype=int) 
     for n in range(b.shape[0]):
         c = np.roll(b,n)
@@ -0,0 +1,162 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import itertools as iter
+import numpy as np
+
+from .generalizedOpsName import generalizedOpsName
+from .opsNameVec import opsNameVec
+from .pcsMask import pcs2mask
+from .minimalDistanceMatrix import minimalNoBijDistanceMatrix,minimalDistancePairs
+
+class OpsTable:
+
+    def __init__(self,pcs=None,TET=12,distance='euclidean',kind='full',header=None,names=None,dist=None):
+        '''
+        •	table of the voice-leading operators (and minimal distances) between all pairs of a list of pcs
+        •	pcs (int) – list of pcs (numpy arrays or lists) of any cardinality
+        •	kind (str) – 'full': normal ordered operators of generalizedOpsName() (tonal models),
+                         'min': minimal distance operators of opsName() (vLeadNetworkByName)
+        •	header (str) – labels of the pcs (e.g. roman numerals), default is the pcs itself
+        •	names (str) – optional N x N table of operator names already computed (e.g. the opstable of tonalHarmonyModels)
+        •	operators are stored as an N x N matrix of integer IDs (op) into the string table names, with an
+            inverted index that returns all the pairs connected by a given operator without string comparisons
+        '''
+        self.TET = TET
+        self.distance = distance
+        self.kind = kind
+        self.pcs = None if pcs is None else [np.asarray(p,dtype=int) for p in pcs]
+        if names is None:
+            names = opsNames(self.pcs,TET,distance,kind)
+        names = np.asarray(names,dtype=str)
+        if header is None:
+            header = [str(p.tolist()) for p in self.pcs] if self.pcs is not None else [str(n) for n in range(names.shape[0])]
+        self.header = list(header)
+        if dist is None and self.pcs is not None:
+            dist = minimalDistancePairs(self.pcs,TET,distance)
+        self.dist = dist
+        # bitmask of each pcs to find a chord in the table by its pitch content
+        self.mask = None
+        if self.pcs is not None and TET <= 64:
+            self.mask = np.asarray([pcs2mask(p%TET) for p in self.pcs],dtype=np.uint64)
+        self.names,op = np.unique(names,return_inverse=True)
+        self.op = op.reshape(names.shape).astype(np.int32)
+        # inverted index: flat positions of the pairs sorted by operator ID
+        self.order = np.argsort(self.op.ravel(),kind='stable')
+        self.start = np.searchsorted(self.op.ravel()[self.order],np.arange(self.names.shape[0]+1))
+
+    def __len__(self):
+        return(self.op.shape[0])
+
+    def opsID(self,name):
+        '''
+        •	integer ID of the operator name, -1 if the operator does not connect any pair in the table
+        '''
+        n = np.searchsorted(self.names,name)
+        if n < self.names.shape[0] and self.names[n] == name:
+            return(int(n))
+        return(-1)
+
+    def pairs(self,name):
+        '''
+        •	all pairs (idx -> idy) connected by the operator name, in row-major order
+        '''
+        n = self.opsID(name)
+        if n < 0:
+            return(np.zeros(0,dtype=int),np.zeros(0,dtype=int))
+        return(np.divmod(self.order[self.start[n]:self.start[n+1]],self.op.shape[1]))
+
+    def targets(self,i,name):
+        '''
+        •	indices of the pcs reached from pcs i by the operator name
+        '''
+        idx,idy = self.pairs(name)
+        return(idy[idx == i])
+
+    def name(self,i,j):
+        return(str(self.names[self.op[i,j]]))
+
+    def table(self):
+        '''
+        •	operator table as list of lists of strings (format of tonalHarmonyModels)
+        '''
+        return(self.names[self.op].tolist())
+
+    def save(self,filename):
+        '''
+        •	write the table in compressed numpy format (integer IDs, string table, distances, labels and pcs)
+        '''
+        pcs = [] if self.pcs is None else [','.join(map(str,p.tolist())) for p in self.pcs]
+        dist = np.zeros((0,0)) if self.dist is None else self.dist
+        np.savez_compressed(filename,op=self.op,names=self.names,dist=dist,header=np.asarray(self.header,dtype=str),
+                            pcs=np.asarray(pcs,dtype=str),meta=np.asarray([self.TET,self.distance,self.kind],dtype=str))
+
+def loadOpsTable(filename):
+    '''
+    •	read a table written by OpsTable.save()
+    '''
+    f = np.load(filename)
+    TET,distance,kind = f['meta']
+    pcs = [np.asarray(list(map(int,p.split(','))),dtype=int) for p in f['pcs']] if f['pcs'].shape[0] > 0 else None
+    dist = f['dist'] if f['dist'].size > 0 else None
+    return(OpsTable(pcs,int(TET),str(distance),str(kind),header=f['header'].tolist(),names=f['names'][f['op']],dist=dist))
+
+def opsTableSpace(Nc,TET=12,distance='euclidean',kind='full'):
+    '''
+    •	table of the operators between all prime-form classes of the cardinalities in Nc (int or list) in a space of TET pitches
+    •	the header are the class names of pcsDictionary
+    '''
+    from ..networks.pcsDictionary import pcsDictionary
+    from .pcsMask import mask2pcs,dictionaryMasks
+    header = []
+    pcs = []
+    for n in np.atleast_1d(Nc):
+        dictionary,_ = pcsDictionary(int(n),False,None,0,None,TET)
+        header += dictionary['class'].tolist()
+        p = mask2pcs(dictionaryMasks(dictionary),TET)
+        pcs += [np.asarray(x) for x in p]
+    return(OpsTable(pcs,TET,distance,kind,header=header))
+
+def opsNames(pcs,TET,distance,kind):
+    # N x N table of operator names
+    N = len(pcs)
+    names = np.empty((N,N),dtype=object)
+    if kind == 'full':
+        for i in range(N):
+            for j in range(N):
+                names[i,j] = generalizedOpsName(pcs[i],pcs[j],TET,distance)[1]
+        return(names)
+    card = np.asarray([len(p) for p in pcs])
+    group = {n:np.nonzero(card == n)[0] for n in np.unique(card)}
+    for na in group:
+        a = np.asarray([pcs[i] for i in group[na]]).reshape(-1,na)
+        for nb in group:
+            if nb > na: continue
+            b = np.asarray([pcs[j] for j in group[nb]]).reshape(-1,nb)
+            ia,ib = np.meshgrid(np.arange(a.shape[0]),np.arange(b.shape[0]),indexing='ij')
+            ia = ia.ravel()
+            ib = ib.ravel()
+            if na == nb:
+                r = b[ib]
+            else:
+                # minimal completion of the smaller pcs, as in vLeadNetworkByName
+                _,lmin,_ = minimalNoBijDistanceMatrix(a,b,TET,distance)
+                c = np.asarray(list(iter.combinations_with_replacement(range(nb),na-nb)),dtype=int).reshape(-1,na-nb)
+                r = np.concatenate([b[ib],b[ib[:,None],c[lmin.ravel()]]],axis=1)
+            n = opsNameVec(a[ia],r,TET).reshape(a.shape[0],b.shape[0])
+            names[np.ix_(group[na],group[nb])] = n
+            if na != nb: names[np.ix_(group[nb],group[na])] = n.T
+    return(names)
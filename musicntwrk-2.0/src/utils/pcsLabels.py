@@ -0,0 +1,55 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import sys
+import numpy as np
+import music21 as m21
+
+from ..musicntwrk import PCSetArray
+
+def pcsLabels(seq,TET=12):
+    '''
+    •	pitch-name labels of a sequence of pcs of any cardinality (normal order for TET=12, ordered pcs for TET=24)
+    •	seq (int) – list of pcs as lists or numpy arrays
+    •	normal orders are computed in batch with PCSetArray for each cardinality and every distinct pcs is named only once
+    '''
+    label = np.empty(len(seq),dtype=object)
+    card = np.asarray([len(s) for s in seq])
+    for n in np.unique(card):
+        indx = np.nonzero(card == n)[0]
+        p = PCSetArray([seq[i] for i in indx],TET=TET)
+        if TET == 12:
+            if n == 1:
+                pcs = p.pcs
+            else:
+                pcs = p.normalOrder()
+            u,inv = np.unique(pcs,return_inverse=True,axis=0)
+            names = [''.join(m21.chord.Chord(c.tolist()).pitchNames) for c in u]
+        elif TET == 24:
+            dict24 = {'C':0,'C~':1,'C#':2,'D-':2,'D`':3,'D':4,'D~':5,'D#':6,'E-':6,'E`':7,'E':8,
+                                'E~':9,'F`':9,'F':10,'F~':11,'F#':12,'G-':12,'G`':13,'G':14,'G~':15,'G#':16,
+                                'A-':16,'A`':17,'A':18,'A~':19,'A#':20,'B-':20,'B`':21,'B':22,'B~':23,'C`':23}
+            # first name in the dictionary for each pitch
+            pitch = {}
+            for key,val in dict24.items():
+                pitch.setdefault(val,key)
+            u,inv = np.unique(p.pcs,return_inverse=True,axis=0)
+            names = [''.join(pitch[i] for i in c) for c in u]
+        else:
+            print('temperament needs to be added')
+            sys.exit()
+        label[indx] = np.asarray(names,dtype=object)[inv.reshape(-1)]
+    return(label)
@@ -0,0 +1,92 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import re
+import numpy as np
+
+# number of set bits in every byte value
+POP8 = np.array([bin(n).count('1') for n in range(256)],dtype=np.uint8)
+
+def pcs2mask(pcs):
+    '''
+    •	integer bitmask encoding of pcs: bit p is set when pitch class p belongs to the set (TET ≤ 64)
+    •	pcs (int) – pcs as list or numpy array, (N,Nc) matrix or list of pcs of any cardinality
+    •	returns the mask as numpy uint64 (one per pcs)
+    '''
+    if len(pcs) != 0 and np.ndim(pcs[0]) == 1 and len(set(len(p) for p in pcs)) != 1:
+        # pcs of different cardinality
+        return(np.asarray([pcs2mask(p) for p in pcs],dtype=np.uint64))
+    pcs = np.asarray(pcs,dtype=np.uint64)
+    if pcs.ndim <= 1:
+        return(np.bitwise_or.reduce(np.left_shift(np.uint64(1),pcs).reshape(-1)))
+    return(np.bitwise_or.reduce(np.left_shift(np.uint64(1),pcs),axis=1))
+
+def maskCardinality(mask):
+    '''
+    •	number of pitches in each mask (popcount)
+    '''
+    mask = np.asarray(mask,dtype=np.uint64)
+    return(POP8[mask.reshape(-1,1).view(np.uint8)].sum(axis=1).reshape(mask.shape).astype(int))
+
+def mask2pcs(mask,TET=12):
+    '''
+    •	decode masks into pcs in ascending order
+    •	returns a numpy array for a single mask, an (N,Nc) matrix if all masks have the same cardinality,
+        otherwise a list of numpy arrays
+    '''
+    mask = np.asarray(mask,dtype=np.uint64)
+    bits = (mask.reshape(-1,1) >> np.arange(TET,dtype=np.uint64)) & np.uint64(1)
+    row,pcs = np.nonzero(bits)
+    if mask.ndim == 0:
+        return(pcs)
+    card = np.bincount(row,minlength=mask.shape[0])
+    if card.shape[0] != 0 and np.all(card == card[0]):
+        return(pcs.reshape(mask.shape[0],card[0]))
+    return(np.split(pcs,np.cumsum(card)[:-1]))
+
+def maskT(mask,t,TET=12):
+    '''
+    •	transposition by t (int) units (modulo TET) as a rotation of the bits
+    '''
+    mask = np.asarray(mask,dtype=np.uint64)
+    t = int(t)%TET
+    full = np.uint64((1 << TET)-1)
+    if t == 0:
+        return(mask)
+    return(((mask << np.uint64(t)) | (mask >> np.uint64(TET-t))) & full)
+
+def maskIntervalVector(mask,TET=12):
+    '''
+    •	total interval content of each mask: the number of pairs at interval k is popcount(mask & T_k(mask)),
+        halved for the tritone-like interval TET/2
+    '''
+    mask = np.asarray(mask,dtype=np.uint64).reshape(-1)
+    itv = np.zeros((mask.shape[0],int(TET/2)),dtype=int)
+    for k in range(1,int(TET/2)+1):
+        itv[:,k-1] = maskCardinality(mask & maskT(mask,k,TET))
+    if TET%2 == 0:
+        itv[:,-1] //= 2
+    return(itv)
+
+def dictionaryMasks(dictionary):
+    '''
+    •	masks of all the pcs in a dictionary generated by pcsDictionary or scoreDictionary
+    •	uses the 'mask' column if present, otherwise encodes the 'pcs' column (older dictionaries read from csv)
+    '''
+    if 'mask' in dictionary.columns:
+        return(np.asarray(dictionary['mask'],dtype=np.uint64))
+    df = np.asarray(dictionary)
+    return(pcs2mask([list(map(int,re.findall('\d+',df[n,1]))) for n in range(len(df))]))
@@ -15,6 +15,8 @@
 
 import collections
 import numpy as np
+import scipy.sparse as sp
+import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 
 
@@ -38,15 +40,26 @@ def scaleFreeFit(Gx,indeg=True,imin=0,undir=False,lfit='powerlaw',plot=True):
         popt_log, pcov_log = curve_fit(linlaw, xdata_log, ydata_log)
         ydatafit_log = np.power(10, linlaw(xdata_log, *popt_log))
         return (xdata,ydata,popt_log, pcov_log, ydatafit_log)
-    try:
+    if sp.issparse(Gx):
+        # adjacency matrix as returned by the network builders with output='csr' or 'coo'
+        Gx = sp.csr_matrix(Gx)
         if indeg == True:
-            data = np.array(sorted([d for n, d in Gx.in_degree()],reverse=True))
+            data = np.sort(Gx.getnnz(axis=0))[::-1]
         elif indeg == False and undir == False:
-            data = np.array(sorted([d for n, d in Gx.out_degree()],reverse=True))
+            data = np.sort(Gx.getnnz(axis=1))[::-1]
         elif indeg == False and undir == True:
-            data = np.array(sorted([d for n, d in Gx.degree()],reverse=True))
-    except:
-        data = Gx
+            # self-loops count twice, as in networkx
+            data = np.sort(Gx.getnnz(axis=1)+(Gx.diagonal() != 0))[::-1]
+    else:
+        try:
+            if indeg == True:
+                data = np.array(sorted([d for n, d in Gx.in_degree()],reverse=True))
+            elif indeg == False and undir == False:
+                data = np.array(sorted([d for n, d in Gx.out_degree()],reverse=True))
+            elif indeg == False and undir == True:
+                data = np.array(sorted([d for n, d in Gx.degree()],reverse=True))
+        except:
+            data = Gx
     data = data[imin:]
     degreeCount = collections.Counter(data)
     deg, cnt = zip(*degreeCount.items())
@@ -0,0 +1,89 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import numpy as np
+import sklearn.metrics as sklm
+from scipy.spatial import cKDTree
+
+# metrics evaluated with a KD-tree radius query (Minkowski p-norm) and their paired form
+KDMETRIC = {'euclidean':2,'l2':2,'cityblock':1,'manhattan':1,'l1':1,'chebyshev':np.inf}
+
+def pairedDistance(x,y,distance):
+    # distance between corresponding rows of x and y
+    if KDMETRIC[distance] == 2:
+        return(np.sqrt(np.sum((x-y)**2,axis=1)))
+    elif KDMETRIC[distance] == 1:
+        return(np.sum(np.abs(x-y),axis=1))
+    else:
+        return(np.max(np.abs(x-y),axis=1))
+
+def sparsePairDistance(x,y,thup,thdw,distance='euclidean',offset=0,upper=True,chunk=1024,kdmax=16):
+    '''
+    •	pairs of rows of x and y whose distance lies in [thdw,thup], without building the full distance matrix
+    •	x (float) – block of rows whose global index starts at offset (e.g. the rows scattered to this rank)
+    •	y (float) – all the rows
+    •	distance (str)– any metric of sklearn.metrics.pairwise_distances; euclidean, cityblock and chebyshev
+        use a KD-tree radius query in up to kdmax dimensions, all others are evaluated in blocks of chunk rows
+    •	upper (logical) – if True keep only the pairs with source <= target (undirected networks)
+    •	returns COO arrays (source, target, distance) sorted by source and target
+    '''
+    if distance == None: distance = 'euclidean'
+    x = np.asarray(x,dtype=float)
+    y = np.asarray(y,dtype=float)
+    source = []
+    target = []
+    weight = []
+    # KD-trees degrade to a brute force search in high dimension (e.g. timbre descriptors)
+    kdtree = distance in KDMETRIC and y.shape[1] <= kdmax
+    # slightly larger radius: the exact threshold is applied on the distances below
+    r = thup*(1+1e-9)+1e-12
+    if kdtree:
+        tree = cKDTree(y)
+    else:
+        # keep the block of distances below 4M entries
+        chunk = max(1,min(chunk,(1<<22)//max(1,y.shape[0])))
+    for n in range(0,x.shape[0],chunk):
+        if kdtree:
+            idx = tree.query_ball_point(x[n:n+chunk],r,p=KDMETRIC[distance],return_sorted=True)
+            cnt = np.fromiter(map(len,idx),dtype=int,count=len(idx))
+            i = np.repeat(np.arange(n,n+len(idx)),cnt)
+            if cnt.sum() == 0: continue
+            j = np.concatenate(idx).astype(int)
+            if upper:
+                keep = i+offset <= j
+                i = i[keep]
+                j = j[keep]
+            w = pairedDistance(x[i],y[j],distance)
+        else:
+            pair = sklm.pairwise_distances(x[n:n+chunk],y,metric=distance)
+            if upper:
+                pair[np.arange(pair.shape[1])[None,:] < np.arange(n,n+pair.shape[0])[:,None]+offset] = np.inf
+            if distance in KDMETRIC:
+                # pairwise_distances expands the norm: candidates are re-evaluated exactly
+                i,j = np.nonzero(pair <= r*(1+1e-6))
+                i = i+n
+                w = pairedDistance(x[i],y[j],distance)
+            else:
+                i,j = np.nonzero(pair <= thup)
+                w = pair[i,j]
+                i = i+n
+        keep = (w <= thup) & (w >= thdw)
+        source.append(i[keep]+offset)
+        target.append(j[keep])
+        weight.append(w[keep])
+    if len(source) == 0:
+        return(np.zeros(0,dtype=int),np.zeros(0,dtype=int),np.zeros(0,dtype=float))
+    return(np.concatenate(source),np.concatenate(target),np.concatenate(weight))
@@ -0,0 +1,64 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import sys,math
+import numpy as np
+
+def binomialTable(n,k):
+    # table of binomial coefficients C(m,j) for m <= n and j <= k
+    table = np.zeros((n+1,k+1),dtype=np.int64)
+    for m in range(n+1):
+        for j in range(min(m,k)+1):
+            table[m,j] = math.comb(m,j)
+    return(table)
+
+def unrankCombinations(n,k,ini,end):
+    '''
+    •	slice [ini,end) of the k-combinations of range(n) in lexicographic order, as given by itertools.combinations,
+        generated by combinatorial unranking without enumerating the preceding combinations
+    •	n, k (int) – size of the set and of the combinations
+    •	ini, end (int) – first and last (excluded) rank of the slice, e.g. from load_balancing(size,rank,math.comb(n,k))
+    •	returns an (end-ini,k) int array
+    '''
+    if math.comb(n,k) >= 2**63:
+        print('combination space too large for int64 ranks')
+        sys.exit()
+    table = binomialTable(n,k)
+    r = np.arange(ini,end,dtype=np.int64)
+    comb = np.zeros((r.shape[0],k),dtype=int)
+    v = np.zeros(r.shape[0],dtype=int)
+    for j in range(k):
+        # smallest value v such that the combinations starting with v at position j contain rank r
+        for _ in range(n):
+            cnt = table[np.clip(n-1-v,0,n),k-1-j]
+            move = r >= cnt
+            if not move.any(): break
+            r[move] -= cnt[move]
+            v[move] += 1
+        comb[:,j] = v
+        v = v+1
+    return(comb)
+
+def unrankCompositions(N,Nc,ini,end):
+    '''
+    •	slice [ini,end) of the compositions of N into exactly Nc positive parts, by stars and bars unranking:
+        the Nc-1 bars are a (Nc-1)-combination of the N-1 gaps between the N units
+    •	the order is that of the groupings of N consecutive units with Nc groups (Sublists)
+    •	returns an (end-ini,Nc) int array of parts
+    '''
+    bars = unrankCombinations(N-1,Nc-1,ini,end)+1
+    cuts = np.hstack([np.zeros((bars.shape[0],1),dtype=int),bars,np.full((bars.shape[0],1),N,dtype=int)])
+    return(np.diff(cuts,axis=1))
@@ -0,0 +1,31 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+
+import numpy as np
+
+from musicntwrk.utils.diffusionEntropyAnalyis import DEAwithStripes, fillWindows
+
+def test_fillWindows_first_window_empty():
+    # an empty first window is 0, not the entropy of the last window
+    DE = fillWindows(np.array([np.nan,np.nan,0.5,np.nan,0.7]))
+    assert np.array_equal(DE,[0,0,0.5,0.5,0.7])
+
+def test_DEA_leading_windows_without_events():
+    # runs of 3 equal values: the windows shorter than 3 have no events
+    np.random.seed(0)
+    de, DE = DEAwithStripes(np.repeat(np.random.randn(300),3),0,1.1)
+    assert np.all(DE[:6] == 0)
+    assert DE[-1] > 0
@@ -0,0 +1,48 @@
+#
+# MUSIC𝄞NTWRK
+#
+# A python library for pitch class set and rhythmic sequences classification and manipulation,
+# the generation of networks in generalized music and sound spaces, and the sonification of arbitrary data
+#
+# Copyright (C) 2018 Marco Buongiorno Nardelli
+# http://www.materialssoundmusic.com, mbn@unt.edu
+#
+# This file is distributed under the terms of the
+# GNU General Public License. See the file `License'
+# in the root directory of the present distribution,
+# or http://www.gnu.org/copyleft/gpl.txt .
+#
+
+import numpy as np
+
+from musicntwrk.timbre.minimizeBKPT import minimizeBKPT
+from musicntwrk.timbre.mfccSoundDecayPiecewise import mfccSoundDecayPiecewise, decayCurve
+
+def decay(rng,tail=False):
+    # 0-th MFCC with a rise and a 4-segment logarithmic decay over the 100 frames read by decayCurve
+    t = np.arange(89)
+    k = [rng.integers(10,25),rng.integers(35,50),rng.integers(60,75)]
+    s = np.array([-0.2,-0.08,-0.03,-0.01])*rng.uniform(0.7,1.3,4)
+    L = 5+s[0]*t+np.sum([(s[i+1]-s[i])*np.maximum(t-k[i],0) for i in range(3)],axis=0)
+    y = np.exp(L+rng.normal(0,0.05,89))
+    # without tail the minimum of the window is 0 and is dropped by decayCurve
+    if not tail: y[-1] = 0
+    return(np.concatenate([np.linspace(0.1,0.9,11)*y[0],y,np.zeros(20)]),s)
+
+def test_piecewise_fit_from_default_breakpoints():
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        vec,s = decay(rng)
+        res,bkpt = minimizeBKPT(vec)
+        a,b,xfit,yfit,res = mfccSoundDecayPiecewise(vec,breakpoints=bkpt)
+        assert np.all(np.isfinite(xfit)) and np.all(np.isfinite(yfit))
+        assert abs(a[0]-s[0]) < 0.05
+
+def test_breakpoints_leave_minlen_points():
+    # the noisy tail of the logarithmic decay does not attract the last breakpoints
+    rng = np.random.default_rng(1)
+    for _ in range(5):
+        vec,s = decay(rng,tail=True)
+        x,y = decayCurve(vec)
+        res,bkpt = minimizeBKPT(vec)
+        assert np.all(np.diff(np.concatenate([[0],bkpt,[x.shape[0]]])) >= 10)